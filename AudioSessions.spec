@@ -6,8 +6,8 @@ a = Analysis(
     ['app.py'],
     pathex=[],
     binaries=[
-        ('/opt/homebrew/bin/ffmpeg', '.'),   # ffmpeg für pydub Audio-Konvertierung
-        ('/opt/homebrew/bin/ffprobe', '.'),  # ffprobe für pydub
+        ('/opt/homebrew/bin/ffmpeg', '.'),   # ffmpeg für MP3-Kodierung
+        ('/opt/homebrew/bin/ffprobe', '.'),  # ffprobe für Nicht-WAV-Formate
     ],
     datas=[
         ('icon.png', '.'),           # Logo für Splash Screen ins Working Directory
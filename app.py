@@ -5,11 +5,19 @@ Main Entry Point
 import sys
 import os
 import platform
+import multiprocessing
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QIcon
 from ui.main_window import MainWindow
 
 
+def _close_api_clients():
+    """Schließt die OpenAI-Clients (nur wenn sie in dieser Sitzung geladen wurden)"""
+    api_client = sys.modules.get("services.api_client")
+    if api_client is not None:
+        api_client.close_clients()
+
+
 def main():
     """Hauptfunktion"""
     app = QApplication(sys.argv)
@@ -17,6 +25,9 @@ def main():
     app.setOrganizationName("Corporate Digital Brain")
     app.setWindowIcon(QIcon("icon.png"))
 
+    # Offene Keep-Alive-Verbindungen beim Beenden schließen (wie der Settings-Flush)
+    app.aboutToQuit.connect(_close_api_clients)
+
     # Hauptfenster erstellen
     window = MainWindow()
 
@@ -36,4 +47,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Für Prozess-Pools in PyInstaller-Builds (Bulk-Import)
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,104 @@
+"""
+Import-Zeit des App-Starts (Regressionstest mit python -X importtime)
+
+Misst, wie lange `import app` dauert (alles, was vor dem ersten Frame
+geladen wird), und prüft, dass schwere Pakete nicht wieder beim Start
+importiert werden. openai, sounddevice und soundfile werden erst bei der
+ersten KI-Aktion, Aufnahme oder Wiedergabe geladen, pyarrow erst beim
+Parquet-Export.
+
+Verwendung:
+    python benchmarks/import_benchmark.py
+    python benchmarks/import_benchmark.py --runs 5 --budget-ms 1500 --top 20
+    python benchmarks/import_benchmark.py --module ui.main_window
+
+Exit-Code 1, wenn das Budget überschritten ist oder ein verzögertes Paket
+beim Start importiert wird.
+"""
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Pakete, die beim Start nicht importiert werden dürfen
+DEFERRED_MODULES = ["openai", "httpx", "sounddevice", "soundfile", "tiktoken", "pyarrow"]
+
+# Budget für `import app` (Millisekunden, bester Lauf)
+IMPORT_BUDGET_MS = 1500
+
+
+def measure(module: str) -> Tuple[Dict[str, Tuple[int, int]], List[str]]:
+    """
+    Importiert das Modul in einem frischen Interpreter mit -X importtime
+
+    Returns:
+        ({Modulname: (eigene µs, kumulierte µs)}, [Top-Level-Pakete in Import-Reihenfolge])
+    """
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT), env.get("PYTHONPATH")]))
+    # Ohne .pyc-Cache würde Kompilieren statt Importieren gemessen
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=env, capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"import {module} fehlgeschlagen:\n{completed.stderr}")
+
+    timings: Dict[str, Tuple[int, int]] = {}
+    packages: List[str] = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        name = name.strip()
+        timings[name] = (int(self_us), int(cumulative_us))
+        package = name.split(".")[0]
+        if package not in packages:
+            packages.append(package)
+    return timings, packages
+
+
+def main():
+    """Hauptfunktion"""
+    parser = argparse.ArgumentParser(description="Import-Zeit des App-Starts messen")
+    parser.add_argument("--module", default="app", help="Zu importierendes Modul")
+    parser.add_argument("--runs", type=int, default=3, help="Anzahl Messungen (bester Lauf zählt)")
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS,
+                        help="Maximale Import-Zeit in Millisekunden (0 = keine Prüfung)")
+    parser.add_argument("--top", type=int, default=15, help="Langsamste Module anzeigen")
+    args = parser.parse_args()
+
+    # Erster Lauf füllt den .pyc-Cache und zählt nicht
+    measure(args.module)
+    runs = [measure(args.module) for _ in range(max(1, args.runs))]
+    timings, packages = min(runs, key=lambda run: run[0][args.module][1])
+    total_ms = timings[args.module][1] / 1000
+
+    print(f"⏱️ import {args.module}: {total_ms:.0f} ms (bester von {len(runs)} Läufen)")
+    slowest = sorted(timings.items(), key=lambda item: item[1][1], reverse=True)
+    for name, (self_us, cumulative_us) in slowest[1:args.top + 1]:
+        print(f"  {cumulative_us / 1000:>8.1f} ms  {self_us / 1000:>7.1f} ms  {name}")
+
+    failed = False
+    loaded = [package for package in DEFERRED_MODULES if package in packages]
+    if loaded:
+        print(f"✗ Beim Start importiert (sollte verzögert sein): {', '.join(loaded)}")
+        failed = True
+    if args.budget_ms and total_ms > args.budget_ms:
+        print(f"✗ Budget überschritten: {total_ms:.0f} ms > {args.budget_ms:.0f} ms")
+        failed = True
+
+    if not failed:
+        print("✅ Import-Budget eingehalten")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
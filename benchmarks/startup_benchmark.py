@@ -0,0 +1,280 @@
+"""
+Startzeit-Benchmark: von `import app` bis zum bedienbaren Hauptfenster
+
+Läuft headless (QT_QPA_PLATFORM=offscreen) gegen synthetische Datenbanken
+mit 100, 10.000 und 100.000 Sessions (andere Größen über --sizes). Jede
+Größe wird in einem frischen Interpreter gemessen (sonst wären Importe und
+Caches schon warm):
+
+- import_ms:        import der App (ui.main_window mit allen Abhängigkeiten)
+- init_ms:          MainWindow.__init__, aufgeteilt in Phasen (phases)
+- first_paint_ms:   show() bis zum ersten gezeichneten Frame
+- load_sessions_ms: erster _load_sessions() (Datenbank + Tabelle)
+- ready_ms:         show() bis _finish_startup() fertig ist (Fenster bedienbar)
+- splash_ms:        show() bis der Splash Screen ausgeblendet ist
+
+Die Ergebnisse werden als JSON ausgegeben (--output für eine Datei) und mit
+den Budgets aus startup_budgets.json verglichen. Exit-Code 1, wenn ein
+Budget überschritten ist. Größen ohne Budget zählen nur bei Absturz oder
+Zeitüberschreitung als Fehler.
+
+Verwendung:
+    python benchmarks/startup_benchmark.py
+    python benchmarks/startup_benchmark.py --sizes 100 10000 --output startup.json
+    python benchmarks/startup_benchmark.py --budgets meine_budgets.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Standard-Größen der synthetischen Datenbanken (mit Budget in startup_budgets.json)
+DEFAULT_SIZES = [100, 10_000, 100_000]
+
+# Budgets pro Größe (Millisekunden), siehe Datei
+DEFAULT_BUDGETS = Path(__file__).resolve().parent / "startup_budgets.json"
+
+# Methoden von MainWindow, die als Phasen von __init__ gemessen werden
+INIT_PHASES = ["_load_language", "_setup_ui", "_connect_signals", "_setup_shortcuts", "_show_splash_screen"]
+
+# Methoden, die nach dem ersten Frame laufen (Teil von ready_ms)
+STARTUP_PHASES = ["_load_devices", "_load_sessions"]
+
+# Sessions pro Insert-Transaktion beim Erzeugen der Datenbanken
+INSERT_BATCH = 10_000
+
+
+def build_database(db_path: Path, count: int):
+    """Erzeugt eine Datenbank mit count synthetischen Sessions (wird wiederverwendet)"""
+    sys.path.insert(0, str(ROOT))
+    from data.repo import SessionRepository
+
+    if db_path.exists():
+        if SessionRepository(str(db_path)).count_sessions() == count:
+            return
+        db_path.unlink()
+
+    print(f"🛠️ Erzeuge Datenbank mit {count} Sessions: {db_path}", file=sys.stderr)
+    repo = SessionRepository(str(db_path))
+    start = datetime(2024, 1, 1, 8, 0)
+    for offset in range(0, count, INSERT_BATCH):
+        repo.create_many([
+            {
+                "title": f"Session {index + 1}",
+                "recorded_at": (start + timedelta(minutes=37 * index)).isoformat(),
+                "path": f"recordings/session_{index + 1:06d}.wav",
+                "duration_sec": 60 + index % 3600,
+                "samplerate": 44100 if index % 2 else 16000,
+                "notes": "Synthetische Session für den Startzeit-Benchmark" if index % 5 == 0 else "",
+            }
+            for index in range(offset, min(count, offset + INSERT_BATCH))
+        ])
+
+    # Gemischte Transkriptions-Status wie in einer echten Datenbank (frische DB: IDs 1..count)
+    repo.set_transcription_status_many(range(1, count + 1, 2), "completed")
+    repo.set_transcription_status_many(range(2, count + 1, 7), "error")
+
+
+def _timed(cls, name: str, timings: dict):
+    """Ersetzt cls.name durch eine Variante, die die Dauer des ersten Aufrufs festhält"""
+    original = getattr(cls, name)
+
+    def wrapper(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return original(self, *args, **kwargs)
+        finally:
+            timings.setdefault(name, (time.perf_counter() - start) * 1000)
+
+    setattr(cls, name, wrapper)
+
+
+def measure_startup(timeout: float) -> dict:
+    """Misst den Start im aktuellen Prozess (Arbeitsverzeichnis enthält data/sessions.db)"""
+    start = time.perf_counter()
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import QEventLoop, QStandardPaths, QTimer
+    sys.path.insert(0, str(ROOT))
+    import app  # noqa: F401  (Import wird gemessen)
+    from ui.main_window import MainWindow
+    import_ms = (time.perf_counter() - start) * 1000
+
+    # Einstellungen des Benutzers nicht anfassen
+    QStandardPaths.setTestModeEnabled(True)
+
+    qt_app = QApplication.instance() or QApplication([sys.argv[0]])
+    qt_app.setApplicationName("Corporate Digital Brain Desktop Recorder")
+    qt_app.setOrganizationName("Corporate Digital Brain")
+
+    phases = {}
+    for name in INIT_PHASES + STARTUP_PHASES:
+        _timed(MainWindow, name, phases)
+
+    marks = {}
+    start = time.perf_counter()
+    window = MainWindow()
+    init_ms = (time.perf_counter() - start) * 1000
+    phases["other"] = init_ms - sum(phases.get(name, 0.0) for name in INIT_PHASES)
+
+    loop = QEventLoop()
+
+    def mark(name):
+        marks.setdefault(name, (time.perf_counter() - shown) * 1000)
+        if "ready" in marks and "splash" in marks:
+            loop.quit()
+
+    original_paint = MainWindow.paintEvent
+    original_finish = MainWindow._finish_startup
+
+    def paint_event(self, event):
+        original_paint(self, event)
+        mark("first_paint")
+
+    def finish_startup(self):
+        original_finish(self)
+        mark("ready")
+
+    MainWindow.paintEvent = paint_event
+    MainWindow._finish_startup = finish_startup
+    window.splash_widget.finished.connect(lambda: mark("splash"))
+
+    shown = time.perf_counter()
+    window.show()
+    QTimer.singleShot(int(timeout * 1000), loop.quit)
+    loop.exec()
+
+    window.close()
+    return {
+        "import_ms": round(import_ms, 1),
+        "init_ms": round(init_ms, 1),
+        "phases": {name: round(phases[name], 1) for name in INIT_PHASES + ["other"] if name in phases},
+        "first_paint_ms": round(marks["first_paint"], 1) if "first_paint" in marks else None,
+        "load_devices_ms": round(phases["_load_devices"], 1) if "_load_devices" in phases else None,
+        "load_sessions_ms": round(phases["_load_sessions"], 1) if "_load_sessions" in phases else None,
+        "ready_ms": round(marks["ready"], 1) if "ready" in marks else None,
+        "splash_ms": round(marks["splash"], 1) if "splash" in marks else None,
+    }
+
+
+def run_size(count: int, workdir: Path, timeout: float) -> dict:
+    """
+    Misst eine Datenbankgröße in einem eigenen Prozess
+
+    Stürzt die Messung ab oder hängt sie (z.B. eine blockierende Tabelle),
+    enthält das Ergebnis nur "error"; alle Budgets dieser Größe gelten dann
+    als überschritten.
+    """
+    run_dir = workdir / f"sessions_{count}"
+    build_database(run_dir / "data" / "sessions.db", count)
+
+    result_path = run_dir / "result.json"
+    if result_path.exists():
+        result_path.unlink()
+
+    env = dict(os.environ)
+    env["QT_QPA_PLATFORM"] = "offscreen"
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT), env.get("PYTHONPATH")]))
+    try:
+        completed = subprocess.run(
+            [sys.executable, __file__, "--child", str(result_path), "--timeout", str(timeout)],
+            cwd=run_dir, env=env, capture_output=True, text=True,
+            # Der Timeout im Kindprozess greift nur, solange die Event-Loop läuft
+            timeout=timeout * 2 + 60
+        )
+    except subprocess.TimeoutExpired:
+        return {"sessions": count, "error": f"Zeitüberschreitung nach {timeout * 2 + 60:.0f}s"}
+
+    if completed.returncode != 0 or not result_path.exists():
+        stderr = completed.stderr.strip().splitlines()
+        return {"sessions": count,
+                "error": f"Exit-Code {completed.returncode}: {stderr[-1] if stderr else ''}"}
+
+    result = json.loads(result_path.read_text(encoding="utf-8"))
+    result["sessions"] = count
+    return result
+
+
+def check_budgets(results: list, budgets: dict) -> list:
+    """Vergleicht die Ergebnisse mit den Budgets, gibt die Überschreitungen zurück"""
+    violations = []
+    for result in results:
+        if "error" in result:
+            violations.append({"sessions": result["sessions"], "metric": "error",
+                               "value": result["error"], "budget": None})
+            continue
+        for metric, budget_ms in budgets.get(str(result["sessions"]), {}).items():
+            # Fehlender Wert: Phase nie erreicht (z.B. Splash hängt)
+            value = result.get(metric)
+            if value is None or value > budget_ms:
+                violations.append({"sessions": result["sessions"], "metric": metric,
+                                   "value": value, "budget": budget_ms})
+    return violations
+
+
+def main():
+    """Hauptfunktion"""
+    parser = argparse.ArgumentParser(description="Startzeit des Hauptfensters messen")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Anzahl Sessions der synthetischen Datenbanken")
+    parser.add_argument("--budgets", default=str(DEFAULT_BUDGETS), help="JSON-Datei mit Budgets")
+    parser.add_argument("--workdir", default=os.path.join(tempfile.gettempdir(), "startup_benchmark"),
+                        help="Verzeichnis für die Datenbanken (werden wiederverwendet)")
+    parser.add_argument("--output", default=None, help="Ergebnisse zusätzlich in diese Datei schreiben")
+    parser.add_argument("--timeout", type=float, default=30.0,
+                        help="Maximale Wartezeit auf Splash und Startup (Sekunden)")
+    parser.add_argument("--child", metavar="RESULT_FILE", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        result = measure_startup(args.timeout)
+        Path(args.child).write_text(json.dumps(result), encoding="utf-8")
+        return 0
+
+    budgets = json.loads(Path(args.budgets).read_text(encoding="utf-8"))
+    workdir = Path(args.workdir)
+
+    results = []
+    for count in args.sizes:
+        result = run_size(count, workdir, args.timeout)
+        results.append(result)
+        if "error" in result:
+            print(f"✗ {count:>7} Sessions: {result['error']}", file=sys.stderr)
+            continue
+        print(f"⏱️ {count:>7} Sessions: import {result['import_ms']:.0f} ms, "
+              f"init {result['init_ms']:.0f} ms, Sessions {result['load_sessions_ms'] or 0:.0f} ms, "
+              f"bereit nach {result['ready_ms'] or 0:.0f} ms", file=sys.stderr)
+
+    violations = check_budgets(results, budgets)
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "results": results,
+        "budgets": budgets,
+        "violations": violations,
+    }
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    print(output)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+
+    for violation in violations:
+        if violation["budget"] is None:
+            continue  # Messfehler oben schon ausgegeben
+        print(f"✗ {violation['sessions']} Sessions: {violation['metric']} = {violation['value']} ms "
+              f"(Budget {violation['budget']} ms)", file=sys.stderr)
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
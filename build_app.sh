@@ -27,6 +27,9 @@ fi
 echo "🧹 Lösche alten Build..."
 rm -rf build dist
 
+# Übersetzungs-Kataloge kompilieren (werden statt der .ts Dateien geladen)
+./venv/bin/python3 simple_translator.py
+
 # Baue App mit PyInstaller
 echo ""
 echo "🔨 Baue App mit PyInstaller..."
@@ -181,6 +181,9 @@ if [[ $REPLY =~ ^[1]$ ]]; then
     # Loesche alten Build
     rm -rf build dist
 
+    # Übersetzungs-Kataloge kompilieren
+    python3 simple_translator.py
+
     # Baue mit PyInstaller
     pyinstaller AudioSessions_linux.spec --clean
 
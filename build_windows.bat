@@ -117,6 +117,7 @@ REM ============================================================================
 echo [6/6] Baue App mit PyInstaller...
 echo Dies kann einige Minuten dauern...
 echo.
+python simple_translator.py
 pyinstaller AudioSessions_windows.spec --clean
 if errorlevel 1 (
     echo.
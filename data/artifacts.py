@@ -0,0 +1,235 @@
+"""
+SQLite Repository für Session-Artefakte (Transkripte und KI-Ergebnisse)
+
+Große Texte werden getrennt von der sessions-Tabelle und ab einer
+Mindestgröße zlib-komprimiert gespeichert. Für die Suche liegt der Text
+der Transkripte zusätzlich unkomprimiert in einem Volltext-Index
+(transcript_search, FTS5 mit Trigrammen, damit LIKE '%...%' indiziert läuft).
+"""
+import sqlite3
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional, Dict, Any, Set
+
+# Artefakt-Arten
+KIND_TRANSCRIPT = "transcript"
+KIND_TRANSFORM = "transform"
+
+# Texte ab dieser Größe (Bytes UTF-8) werden komprimiert
+COMPRESS_THRESHOLD = 4096
+
+# Suchindex der Transkripte (rowid = Session-ID, Spalte text)
+SEARCH_TABLE = "transcript_search"
+
+
+def encode_text(text: str):
+    """Kodiert Text für die Speicherung, gibt (encoding, content, size) zurück"""
+    raw = text.encode("utf-8")
+    if len(raw) >= COMPRESS_THRESHOLD:
+        return "zlib", zlib.compress(raw, 6), len(raw)
+    return "plain", raw, len(raw)
+
+
+def decode_text(encoding: str, content) -> Optional[str]:
+    """Dekodiert gespeicherten Text (auch als SQL-Funktion registriert)"""
+    if content is None:
+        return None
+    if encoding == "zlib":
+        content = zlib.decompress(content)
+    if isinstance(content, str):
+        return content
+    return bytes(content).decode("utf-8")
+
+
+def register_functions(conn: sqlite3.Connection):
+    """Registriert artifact_text(encoding, content) für SQL-Abfragen (z.B. Suche)"""
+    conn.create_function("artifact_text", 2, decode_text, deterministic=True)
+
+
+class ArtifactRepository:
+    """Repository für Transkripte und Transformations-Ergebnisse pro Session"""
+
+    def __init__(self, db_path: str = "data/sessions.db"):
+        self.db_path = db_path
+        self._init_db()
+
+    def _init_db(self):
+        """Erstellt die artifacts-Tabelle falls nicht vorhanden"""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS artifacts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    session_id INTEGER NOT NULL,
+                    kind TEXT NOT NULL,
+                    prompt_id TEXT NOT NULL DEFAULT '',
+                    model TEXT NOT NULL DEFAULT '',
+                    encoding TEXT NOT NULL DEFAULT 'plain',
+                    content BLOB,
+                    size INTEGER DEFAULT 0,
+                    tokens INTEGER,
+                    created_at TEXT NOT NULL,
+                    UNIQUE (session_id, kind, prompt_id, model)
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_artifacts_session_kind
+                ON artifacts (session_id, kind, created_at DESC)
+            """)
+            self._init_search_index(conn)
+            conn.commit()
+
+    @staticmethod
+    def _init_search_index(conn: sqlite3.Connection):
+        """Legt den Suchindex an und füllt ihn einmalig aus bestehenden Transkripten"""
+        try:
+            conn.execute(f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE}
+                USING fts5(text, tokenize = 'trigram')
+            """)
+        except sqlite3.OperationalError:
+            # SQLite ohne FTS5/Trigramme (< 3.34): unkomprimierte Kopie, LIKE ohne Dekodieren
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {SEARCH_TABLE} (
+                    rowid INTEGER PRIMARY KEY,
+                    text TEXT
+                )
+            """)
+
+        if conn.execute(f"SELECT 1 FROM {SEARCH_TABLE} LIMIT 1").fetchone():
+            return
+        # Neuestes Transkript pro Session (ältere Datenbanken ohne Index)
+        latest = {}
+        for session_id, encoding, content in conn.execute("""
+            SELECT session_id, encoding, content FROM artifacts
+            WHERE kind = ? ORDER BY created_at
+        """, (KIND_TRANSCRIPT,)):
+            latest[session_id] = decode_text(encoding, content)
+        conn.executemany(
+            f"INSERT INTO {SEARCH_TABLE} (rowid, text) VALUES (?, ?)",
+            [(session_id, text) for session_id, text in latest.items() if text]
+        )
+        if latest:
+            print(f"✓ Suchindex für {len(latest)} Transkripte angelegt")
+
+    @staticmethod
+    def _index_transcript(conn: sqlite3.Connection, session_id: int, text: str):
+        """Ersetzt den Suchtext einer Session"""
+        conn.execute(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = ?", (session_id,))
+        conn.execute(f"INSERT INTO {SEARCH_TABLE} (rowid, text) VALUES (?, ?)", (session_id, text))
+
+    def save(self, session_id: int, kind: str, text: str, prompt_id: str = '',
+             model: str = '', tokens: Optional[int] = None,
+             conn: Optional[sqlite3.Connection] = None):
+        """
+        Speichert (oder ersetzt) ein Artefakt
+
+        Args:
+            session_id: Zugehörige Session
+            kind: KIND_TRANSCRIPT oder KIND_TRANSFORM
+            text: Inhalt
+            prompt_id: Prompt-ID (nur bei Transformationen)
+            model: Verwendetes Modell
+            tokens: Verbrauchte Tokens
+            conn: Optionale bestehende Verbindung (gemeinsame Transaktion)
+        """
+        encoding, content, size = encode_text(text)
+        params = (session_id, kind, prompt_id or '', model or '', encoding,
+                  content, size, tokens, datetime.now().isoformat())
+        sql = """
+            INSERT INTO artifacts (session_id, kind, prompt_id, model, encoding,
+                                   content, size, tokens, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (session_id, kind, prompt_id, model) DO UPDATE SET
+                encoding = excluded.encoding,
+                content = excluded.content,
+                size = excluded.size,
+                tokens = excluded.tokens,
+                created_at = excluded.created_at
+        """
+
+        if conn is not None:
+            conn.execute(sql, params)
+            if kind == KIND_TRANSCRIPT:
+                self._index_transcript(conn, session_id, text)
+            return
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(sql, params)
+            if kind == KIND_TRANSCRIPT:
+                self._index_transcript(conn, session_id, text)
+            conn.commit()
+
+    def load(self, session_id: int, kind: str, prompt_id: str = '',
+             model: Optional[str] = None) -> Optional[str]:
+        """
+        Lädt den Inhalt eines Artefakts
+
+        Args:
+            session_id: Zugehörige Session
+            kind: KIND_TRANSCRIPT oder KIND_TRANSFORM
+            prompt_id: Prompt-ID (nur bei Transformationen)
+            model: Modell; None = neuestes Artefakt unabhängig vom Modell
+
+        Returns:
+            Text oder None wenn nicht vorhanden
+        """
+        sql = """
+            SELECT encoding, content FROM artifacts
+            WHERE session_id = ? AND kind = ? AND prompt_id = ?
+        """
+        params = [session_id, kind, prompt_id or '']
+        if model is not None:
+            sql += " AND model = ?"
+            params.append(model)
+        sql += " ORDER BY created_at DESC LIMIT 1"
+
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(sql, params).fetchone()
+
+        if not row:
+            return None
+        return decode_text(row[0], row[1])
+
+    def list_for_session(self, session_id: int) -> List[Dict[str, Any]]:
+        """Gibt die Metadaten aller Artefakte einer Session zurück (ohne Inhalt)"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.execute("""
+                SELECT id, session_id, kind, prompt_id, model, encoding, size,
+                       tokens, created_at
+                FROM artifacts
+                WHERE session_id = ?
+                ORDER BY created_at DESC
+            """, (session_id,))
+            return [dict(row) for row in cursor.fetchall()]
+
+    def session_ids_with(self, kind: str, prompt_id: str = '') -> Set[int]:
+        """IDs aller Sessions mit einem Artefakt dieser Art (eine Abfrage statt einer pro Session)"""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(
+                "SELECT DISTINCT session_id FROM artifacts WHERE kind = ? AND prompt_id = ?",
+                (kind, prompt_id or '')
+            )
+            return {row[0] for row in cursor.fetchall()}
+
+    def delete_for_session(self, session_id: int,
+                           conn: Optional[sqlite3.Connection] = None):
+        """Löscht alle Artefakte einer Session"""
+        self.delete_for_sessions([session_id], conn=conn)
+
+    def delete_for_sessions(self, session_ids: Iterable[int],
+                            conn: Optional[sqlite3.Connection] = None):
+        """Löscht alle Artefakte (und Suchtexte) mehrerer Sessions"""
+        rows = [(session_id,) for session_id in session_ids]
+        if conn is not None:
+            conn.executemany("DELETE FROM artifacts WHERE session_id = ?", rows)
+            conn.executemany(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = ?", rows)
+            return
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany("DELETE FROM artifacts WHERE session_id = ?", rows)
+            conn.executemany(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = ?", rows)
+            conn.commit()
@@ -0,0 +1,167 @@
+"""
+Content-Hashes für Audio-Dateien mit persistentem Index
+
+Hashes werden blockweise (mmap) berechnet und in SQLite unter
+(Pfad, Größe, mtime) abgelegt. Solange sich die Datei nicht ändert, ist jede
+weitere Abfrage ein Index-Treffer ohne die Datei erneut zu lesen.
+"""
+import hashlib
+import mmap
+import os
+import sqlite3
+from pathlib import Path
+from typing import Optional, Iterable, Tuple
+
+# Blockgröße für Hash-Berechnung
+HASH_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def hash_file(path: str, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    """Berechnet SHA256 einer Datei blockweise über mmap (konstanter Speicherbedarf)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            # Leere Dateien lassen sich nicht mappen
+            return digest.hexdigest()
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                for offset in range(0, size, chunk_size):
+                    digest.update(view[offset:offset + chunk_size])
+            finally:
+                view.release()
+
+    return digest.hexdigest()
+
+
+class HashingFile:
+    """
+    Datei-Wrapper, der beim sequentiellen Schreiben den SHA256 mitberechnet
+
+    Wird z.B. an wave.open() übergeben. Springt der Schreiber zurück
+    (seek, etwa zum Nachpatchen eines Headers), ist der laufende Hash
+    ungültig und hexdigest() liefert None.
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, "wb")
+        self._digest = hashlib.sha256()
+        self._position = 0
+        self._valid = True
+
+    def write(self, data) -> int:
+        written = self._file.write(data)
+        if self._valid:
+            self._digest.update(data)
+        self._position += written
+        return written
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        position = self._file.seek(offset, whence)
+        if position != self._position:
+            self._valid = False
+        return position
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def hexdigest(self) -> Optional[str]:
+        """Gibt den Hash zurück oder None wenn nicht sequentiell geschrieben wurde"""
+        return self._digest.hexdigest() if self._valid else None
+
+
+class AudioHashIndex:
+    """Persistenter Index (Pfad, Größe, mtime) -> SHA256"""
+
+    def __init__(self, db_path: str = "data/sessions.db"):
+        self.db_path = db_path
+        self._init_db()
+
+    def _init_db(self):
+        """Erstellt die audio_hashes-Tabelle falls nicht vorhanden"""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS audio_hashes (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    sha256 TEXT NOT NULL
+                )
+            """)
+            conn.commit()
+
+    @staticmethod
+    def _key(path: str) -> str:
+        """Normalisiert den Pfad als Index-Schlüssel"""
+        return str(Path(path).resolve())
+
+    def get(self, path: str) -> Optional[str]:
+        """Gibt den gespeicherten Hash zurück, falls Größe und mtime noch passen"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute("""
+                SELECT sha256 FROM audio_hashes
+                WHERE path = ? AND size = ? AND mtime_ns = ?
+            """, (self._key(path), stat.st_size, stat.st_mtime_ns)).fetchone()
+
+        return row[0] if row else None
+
+    def put(self, path: str, sha256: str):
+        """Speichert den Hash einer Datei mit aktueller Größe und mtime"""
+        self.put_many([(path, sha256)])
+
+    def put_many(self, entries: Iterable[Tuple[str, str]]):
+        """Speichert mehrere (Pfad, Hash)-Paare in einer Transaktion"""
+        rows = []
+        for path, sha256 in entries:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            rows.append((self._key(path), stat.st_size, stat.st_mtime_ns, sha256))
+
+        if not rows:
+            return
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO audio_hashes (path, size, mtime_ns, sha256)
+                VALUES (?, ?, ?, ?)
+            """, rows)
+            conn.commit()
+
+    def hash_for(self, path: str) -> str:
+        """Gibt den Hash aus dem Index zurück oder berechnet und speichert ihn"""
+        sha256 = self.get(path)
+        if sha256 is None:
+            sha256 = hash_file(path)
+            self.put(path, sha256)
+        return sha256
+
+    def remove_many(self, paths: Iterable[str], conn: Optional[sqlite3.Connection] = None):
+        """Entfernt Index-Einträge (z.B. nach dem Löschen von Sessions)"""
+        rows = [(self._key(path),) for path in paths if path]
+        if not rows:
+            return
+
+        if conn is not None:
+            conn.executemany("DELETE FROM audio_hashes WHERE path = ?", rows)
+            return
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany("DELETE FROM audio_hashes WHERE path = ?", rows)
+            conn.commit()
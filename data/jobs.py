@@ -0,0 +1,418 @@
+"""
+SQLite Repository für die Transkriptions-Warteschlange
+
+Jobs überleben einen Neustart. Abgeholt wird nach Priorität und dann in
+Einreihungs-Reihenfolge.
+
+App und Kommandozeile (transcribe_backlog.py) teilen sich die Tabelle. Ein
+abgeholter Job gehört dem Prozess (owner: Host, PID und Startzeit) und hat
+eine Lease, die der Besitzer regelmäßig verlängert (renew_leases()). Nur
+Jobs mit abgelaufener Lease gelten als unterbrochen und werden wieder
+eingereiht - laufende Jobs eines anderen Prozesses bleiben unberührt.
+"""
+import os
+import socket
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Iterable, Tuple
+
+# Job-Zustände
+STATE_QUEUED = "queued"
+STATE_RUNNING = "running"
+STATE_DONE = "done"
+STATE_ERROR = "error"
+STATE_CANCELLED = "cancelled"
+
+ACTIVE_STATES = (STATE_QUEUED, STATE_RUNNING)
+# Platzhalter für "state IN (...)", Werte als Parameter ACTIVE_STATES
+ACTIVE_PLACEHOLDERS = ', '.join('?' * len(ACTIVE_STATES))
+
+# Prioritäten (höher = früher)
+PRIORITY_LOW = 0        # Bulk-Transkription
+PRIORITY_NORMAL = 10    # Neue Aufnahmen
+
+# Versuche pro Job (inklusive erstem Versuch)
+DEFAULT_MAX_ATTEMPTS = 3
+
+# Wartezeit vor erneutem Versuch: RETRY_DELAY_SEC * 2^(Versuch-1)
+RETRY_DELAY_SEC = 30
+
+# Fehlermeldung für Jobs, deren Bearbeiter wiederholt ohne Ergebnis verschwunden ist
+LEASE_EXPIRED_ERROR = "Bearbeitung wiederholt abgebrochen (Prozess beendet oder abgestürzt)"
+
+# Gültigkeit einer Lease und Intervall, in dem der Besitzer sie verlängert (Sekunden)
+LEASE_SEC = 120
+HEARTBEAT_SEC = 30
+
+# Besitzer-Kennung dieses Prozesses (Startzeit unterscheidet wiederverwendete PIDs)
+PROCESS_OWNER = f"{socket.gethostname()}:{os.getpid()}:{int(time.time())}"
+
+
+class JobRepository:
+    """Repository für Transkriptions-Jobs"""
+
+    def __init__(self, db_path: str = "data/sessions.db", owner: Optional[str] = None):
+        """
+        Args:
+            db_path: Pfad zur Datenbank
+            owner: Besitzer-Kennung für abgeholte Jobs (Standard: PROCESS_OWNER)
+        """
+        self.db_path = db_path
+        self.owner = owner or PROCESS_OWNER
+        self._init_db()
+
+    def _init_db(self):
+        """Erstellt die transcription_jobs-Tabelle falls nicht vorhanden"""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS transcription_jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    session_id INTEGER NOT NULL,
+                    audio_path TEXT NOT NULL,
+                    language TEXT NOT NULL DEFAULT 'de',
+                    state TEXT NOT NULL DEFAULT 'queued',
+                    priority INTEGER NOT NULL DEFAULT 0,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL DEFAULT 3,
+                    error TEXT,
+                    available_at TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_jobs_state_priority
+                ON transcription_jobs (state, priority DESC, id)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_jobs_session
+                ON transcription_jobs (session_id, state)
+            """)
+
+            # Besitzer und Lease laufender Jobs (Migration älterer Datenbanken)
+            columns = [col[1] for col in conn.execute("PRAGMA table_info(transcription_jobs)")]
+            if 'owner' not in columns:
+                conn.execute("ALTER TABLE transcription_jobs ADD COLUMN owner TEXT")
+            if 'lease_until' not in columns:
+                conn.execute("ALTER TABLE transcription_jobs ADD COLUMN lease_until TEXT")
+            conn.commit()
+
+    def enqueue_many(self, jobs: Iterable[Dict[str, Any]],
+                     priority: int = PRIORITY_LOW,
+                     max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> List[int]:
+        """
+        Reiht Jobs ein; Sessions mit aktivem Job werden übersprungen
+
+        Args:
+            jobs: Dicts mit session_id, audio_path, language
+
+        Returns:
+            Session-IDs, für die ein neuer Job angelegt wurde
+        """
+        now = datetime.now().isoformat()
+        added = []
+
+        with sqlite3.connect(self.db_path) as conn:
+            active = {row[0] for row in conn.execute(
+                f"SELECT session_id FROM transcription_jobs WHERE state IN ({ACTIVE_PLACEHOLDERS})",
+                ACTIVE_STATES
+            )}
+            rows = []
+            for job in jobs:
+                if job["session_id"] in active:
+                    continue
+                active.add(job["session_id"])
+                added.append(job["session_id"])
+                rows.append((job["session_id"], job["audio_path"], job.get("language", "de"),
+                             STATE_QUEUED, priority, max_attempts, now, now, now))
+
+            conn.executemany("""
+                INSERT INTO transcription_jobs
+                    (session_id, audio_path, language, state, priority, max_attempts,
+                     available_at, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            conn.commit()
+
+        return added
+
+    def enqueue(self, session_id: int, audio_path: str, language: str = "de",
+                priority: int = PRIORITY_NORMAL) -> bool:
+        """Reiht eine Session ein (False wenn bereits ein aktiver Job existiert)"""
+        return bool(self.enqueue_many(
+            [{"session_id": session_id, "audio_path": audio_path, "language": language}],
+            priority=priority
+        ))
+
+    def claim_next(self) -> Optional[Dict[str, Any]]:
+        """
+        Holt den nächsten fälligen Job und setzt ihn auf running (atomar)
+
+        Jobs mit abgelaufener Lease (Besitzer beendet oder hängt) werden
+        dabei wieder eingereiht und können abgeholt werden.
+
+        Returns:
+            Job-Dict oder None wenn nichts fällig ist
+        """
+        now = datetime.now()
+        lease_until = (now + timedelta(seconds=LEASE_SEC)).isoformat()
+        now = now.isoformat()
+
+        with sqlite3.connect(self.db_path, isolation_level=None) as conn:
+            conn.row_factory = sqlite3.Row
+            # IMMEDIATE: kein zweiter Prozess kann denselben Job abholen
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._requeue_expired(conn, now)
+
+                # Dauer der Session für Durchsatz/ETA mitliefern
+                row = conn.execute("""
+                    SELECT j.*, COALESCE(s.duration_sec, 0) AS duration_sec
+                    FROM transcription_jobs j
+                    LEFT JOIN sessions s ON s.id = j.session_id
+                    WHERE j.state = ? AND j.available_at <= ?
+                    ORDER BY j.priority DESC, j.id ASC
+                    LIMIT 1
+                """, (STATE_QUEUED, now)).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+
+                conn.execute("""
+                    UPDATE transcription_jobs
+                    SET state = ?, attempts = attempts + 1, owner = ?, lease_until = ?, updated_at = ?
+                    WHERE id = ?
+                """, (STATE_RUNNING, self.owner, lease_until, now, row["id"]))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+        job = dict(row)
+        job["state"] = STATE_RUNNING
+        job["attempts"] += 1
+        job["owner"] = self.owner
+        job["lease_until"] = lease_until
+        return job
+
+    def renew_leases(self) -> int:
+        """Verlängert die Leases aller laufenden Jobs dieses Besitzers (Heartbeat)"""
+        lease_until = (datetime.now() + timedelta(seconds=LEASE_SEC)).isoformat()
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute("""
+                UPDATE transcription_jobs SET lease_until = ?
+                WHERE state = ? AND owner = ?
+            """, (lease_until, STATE_RUNNING, self.owner))
+            conn.commit()
+            return cursor.rowcount
+
+    def next_available_at(self, include_leases: bool = False) -> Optional[datetime]:
+        """
+        Zeitpunkt des nächsten zurückgestellten Jobs (für Retry-Timer)
+
+        Args:
+            include_leases: Auch den Ablauf fremder Leases berücksichtigen
+                (um Jobs eines abgestürzten Prozesses zu übernehmen)
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT MIN(available_at) FROM transcription_jobs WHERE state = ?",
+                (STATE_QUEUED,)
+            ).fetchone()
+            times = [row[0]] if row and row[0] else []
+            if include_leases:
+                row = conn.execute("""
+                    SELECT MIN(lease_until) FROM transcription_jobs
+                    WHERE state = ? AND owner != ?
+                """, (STATE_RUNNING, self.owner)).fetchone()
+                if row and row[0]:
+                    times.append(row[0])
+        return datetime.fromisoformat(min(times)) if times else None
+
+    def mark_done(self, job_id: int):
+        """Markiert einen Job als erledigt"""
+        self._set_state(job_id, STATE_DONE, None)
+
+    def mark_failed(self, job_id: int, error: str, retryable: bool = True) -> str:
+        """
+        Verbucht einen Fehlversuch
+
+        Gehört der Job inzwischen einem anderen Prozess (Lease abgelaufen und
+        übernommen), bleibt er unverändert.
+
+        Returns:
+            Neuer Zustand: queued (erneuter Versuch später) oder error;
+            running wenn ein anderer Prozess den Job übernommen hat
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT attempts, max_attempts, state, owner FROM transcription_jobs WHERE id = ?",
+                (job_id,)
+            ).fetchone()
+            if row is None:
+                return STATE_ERROR
+            attempts, max_attempts, state, owner = row
+            if state == STATE_CANCELLED:
+                return STATE_CANCELLED
+            if owner is not None and owner != self.owner:
+                return state
+
+            now = datetime.now()
+            if retryable and attempts < max_attempts:
+                new_state = STATE_QUEUED
+                available_at = now + timedelta(seconds=RETRY_DELAY_SEC * 2 ** (attempts - 1))
+            else:
+                new_state = STATE_ERROR
+                available_at = now
+
+            conn.execute("""
+                UPDATE transcription_jobs
+                SET state = ?, error = ?, available_at = ?, owner = NULL, lease_until = NULL, updated_at = ?
+                WHERE id = ?
+            """, (new_state, error, available_at.isoformat(), now.isoformat(), job_id))
+            conn.commit()
+
+        return new_state
+
+    def get_state(self, job_id: int) -> Optional[str]:
+        """Gibt den aktuellen Zustand eines Jobs zurück"""
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT state FROM transcription_jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def cancel_for_sessions(self, session_ids: Iterable[int],
+                            conn: Optional[sqlite3.Connection] = None) -> List[int]:
+        """
+        Bricht aktive Jobs der Sessions ab (laufende Ergebnisse werden verworfen)
+
+        Returns:
+            Session-IDs mit abgebrochenem Job
+        """
+        session_ids = list(session_ids)
+        if not session_ids:
+            return []
+
+        if conn is not None:
+            return self._cancel(conn, session_ids)
+
+        with sqlite3.connect(self.db_path) as conn:
+            cancelled = self._cancel(conn, session_ids)
+            conn.commit()
+        return cancelled
+
+    @staticmethod
+    def _cancel(conn: sqlite3.Connection, session_ids: List[int]) -> List[int]:
+        """Abbruch innerhalb einer bestehenden Transaktion (ohne RETURNING, SQLite < 3.35)"""
+        placeholders = ', '.join('?' * len(session_ids))
+        where = f"session_id IN ({placeholders}) AND state IN ({ACTIVE_PLACEHOLDERS})"
+        params = [*session_ids, *ACTIVE_STATES]
+        cancelled = [row[0] for row in conn.execute(
+            f"SELECT DISTINCT session_id FROM transcription_jobs WHERE {where}", params
+        )]
+        conn.execute(
+            f"UPDATE transcription_jobs SET state = ?, updated_at = ? WHERE {where}",
+            [STATE_CANCELLED, datetime.now().isoformat(), *params]
+        )
+        return cancelled
+
+    def requeue_interrupted(self) -> int:
+        """
+        Reiht unterbrochene Jobs wieder ein (beim Start)
+
+        Unterbrochen sind laufende Jobs, deren Lease abgelaufen ist (oder die
+        noch keine haben, aus älteren Versionen). Jobs, die ein anderer
+        Prozess gerade bearbeitet, bleiben unberührt.
+
+        Returns:
+            Anzahl wieder eingereihter Jobs (ohne die, die dabei auf error gehen)
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            count = self._requeue_expired(conn, datetime.now().isoformat())
+            conn.commit()
+            return count
+
+    @staticmethod
+    def _requeue_expired(conn: sqlite3.Connection, now: str) -> int:
+        """
+        Setzt laufende Jobs mit abgelaufener Lease auf queued (innerhalb einer Transaktion)
+
+        Der abgebrochene Lauf zählt als Versuch: Ein Job, der seinen Prozess
+        jedes Mal abstürzen lässt (OOM, Absturz im Decoder), landet nach
+        max_attempts auf error statt endlos neu abgeholt zu werden.
+        """
+        expired = "state = ? AND (lease_until IS NULL OR lease_until < ?)"
+
+        # Session-Status der aufgegebenen Jobs gleich mitsetzen (gleicher Wert "error")
+        conn.execute(f"""
+            UPDATE sessions SET transcription_status = ?
+            WHERE id IN (SELECT session_id FROM transcription_jobs
+                         WHERE {expired} AND attempts >= max_attempts)
+        """, (STATE_ERROR, STATE_RUNNING, now))
+        conn.execute(f"""
+            UPDATE transcription_jobs
+            SET state = ?, error = ?, owner = NULL, lease_until = NULL, updated_at = ?
+            WHERE {expired} AND attempts >= max_attempts
+        """, (STATE_ERROR, LEASE_EXPIRED_ERROR, now, STATE_RUNNING, now))
+
+        cursor = conn.execute(f"""
+            UPDATE transcription_jobs
+            SET state = ?, owner = NULL, lease_until = NULL, available_at = ?, updated_at = ?
+            WHERE {expired}
+        """, (STATE_QUEUED, now, now, STATE_RUNNING, now))
+        return cursor.rowcount
+
+    def list_active(self) -> List[Dict[str, Any]]:
+        """Gibt alle wartenden und laufenden Jobs zurück"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(f"""
+                SELECT * FROM transcription_jobs
+                WHERE state IN ({ACTIVE_PLACEHOLDERS})
+                ORDER BY priority DESC, id ASC
+            """, ACTIVE_STATES).fetchall()
+        return [dict(row) for row in rows]
+
+    def remaining(self) -> Tuple[int, float]:
+        """Anzahl aktiver Jobs und ihre gesamte Audio-Dauer in Sekunden"""
+        with sqlite3.connect(self.db_path) as conn:
+            count, seconds = conn.execute(f"""
+                SELECT COUNT(*), COALESCE(SUM(s.duration_sec), 0)
+                FROM transcription_jobs j
+                LEFT JOIN sessions s ON s.id = j.session_id
+                WHERE j.state IN ({ACTIVE_PLACEHOLDERS})
+            """, ACTIVE_STATES).fetchone()
+        return count, float(seconds)
+
+    def counts(self) -> Dict[str, int]:
+        """Anzahl Jobs pro Zustand"""
+        with sqlite3.connect(self.db_path) as conn:
+            return dict(conn.execute(
+                "SELECT state, COUNT(*) FROM transcription_jobs GROUP BY state"
+            ))
+
+    def purge_finished(self, older_than_days: int = 30) -> int:
+        """Entfernt erledigte/abgebrochene Jobs älter als older_than_days"""
+        cutoff = (datetime.now() - timedelta(days=older_than_days)).isoformat()
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute("""
+                DELETE FROM transcription_jobs
+                WHERE state IN (?, ?, ?) AND updated_at < ?
+            """, (STATE_DONE, STATE_ERROR, STATE_CANCELLED, cutoff))
+            conn.commit()
+            return cursor.rowcount
+
+    def _set_state(self, job_id: int, state: str, error: Optional[str]):
+        """Setzt Zustand und Fehlermeldung eines Jobs (nicht bei Jobs eines anderen Besitzers)"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                UPDATE transcription_jobs
+                SET state = ?, error = ?, owner = NULL, lease_until = NULL, updated_at = ?
+                WHERE id = ? AND state != ? AND (owner IS NULL OR owner = ?)
+            """, (state, error, datetime.now().isoformat(), job_id, STATE_CANCELLED, self.owner))
+            conn.commit()
@@ -1,10 +1,25 @@
 """
 SQLite Repository für Session-Verwaltung
 """
+import os
 import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Tuple
+
+from data.artifacts import ArtifactRepository, KIND_TRANSCRIPT, SEARCH_TABLE, register_functions
+from data.audio_hashes import AudioHashIndex
+from data.jobs import JobRepository
+
+
+# Spalten für Listenansichten - ohne große Textspalten (transcript_text)
+LIST_COLUMNS = (
+    "id", "title", "recorded_at", "duration_sec", "path", "samplerate",
+    "channels", "notes", "transcript_tokens", "transcription_status"
+)
+
+# Spalten für Exporte (inklusive Transkript und berechneter Dateigröße)
+EXPORT_COLUMNS = LIST_COLUMNS + ("transcript_text", "file_size")
 
 
 class SessionRepository:
@@ -13,6 +28,10 @@ class SessionRepository:
     def __init__(self, db_path: str = "data/sessions.db"):
         self.db_path = db_path
         self._init_db()
+        self.artifacts = ArtifactRepository(db_path)
+        self.hashes = AudioHashIndex(db_path)
+        self.jobs = JobRepository(db_path)
+        self._migrate_transcripts_to_artifacts()
 
     def _init_db(self):
         """Initialisiert die Datenbank und erstellt Tabellen falls nicht vorhanden"""
@@ -55,63 +74,277 @@ class SessionRepository:
             if 'transcription_status' not in columns:
                 conn.execute("ALTER TABLE sessions ADD COLUMN transcription_status TEXT")
 
+            if 'content_hash' not in columns:
+                conn.execute("ALTER TABLE sessions ADD COLUMN content_hash TEXT")
+
+            # Zwischengespeicherte Dateigröße (NULL = noch nicht ermittelt)
+            if 'file_size' not in columns:
+                conn.execute("ALTER TABLE sessions ADD COLUMN file_size INTEGER")
+
+            # Indizes für Sortierung und Filter der Session-Liste
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_sessions_recorded_at
+                ON sessions (recorded_at DESC)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_sessions_status_recorded_at
+                ON sessions (transcription_status, recorded_at DESC)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_sessions_duration
+                ON sessions (duration_sec)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_sessions_content_hash
+                ON sessions (content_hash)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_sessions_path
+                ON sessions (path)
+            """)
+
+            conn.commit()
+
+    def _migrate_transcripts_to_artifacts(self):
+        """Verschiebt inline gespeicherte Transkripte in die artifacts-Tabelle"""
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute("""
+                SELECT id, transcript_text, transcript_tokens FROM sessions
+                WHERE transcript_text IS NOT NULL
+            """).fetchall()
+
+            if not rows:
+                return
+
+            for session_id, text, tokens in rows:
+                self.artifacts.save(session_id, KIND_TRANSCRIPT, text,
+                                    tokens=tokens, conn=conn)
+
+            conn.execute("UPDATE sessions SET transcript_text = NULL WHERE transcript_text IS NOT NULL")
             conn.commit()
 
+        print(f"✓ {len(rows)} Transkripte in Artefakt-Speicher migriert")
+
     def create(self, title: str, recorded_at: str, path: str,
                duration_sec: int = 0, samplerate: int = 44100,
-               channels: int = 1, notes: str = '') -> int:
+               channels: int = 1, notes: str = '',
+               content_hash: Optional[str] = None) -> int:
         """Erstellt eine neue Session und gibt die ID zurück"""
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.execute("""
                 INSERT INTO sessions (title, recorded_at, duration_sec, path,
-                                     samplerate, channels, notes)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (title, recorded_at, duration_sec, path, samplerate, channels, notes))
+                                     samplerate, channels, notes, content_hash)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (title, recorded_at, duration_sec, path, samplerate, channels, notes,
+                  content_hash))
             conn.commit()
-            return cursor.lastrowid
 
-    def get_all(self, search_term: str = '') -> List[Dict[str, Any]]:
-        """Holt alle Sessions, optional gefiltert nach Suchbegriff"""
+        # Bekannten Hash im Index ablegen (spätere Cache-Lookups ohne Lesen der Datei)
+        if content_hash:
+            self.hashes.put(path, content_hash)
+
+        return cursor.lastrowid
+
+    def create_many(self, sessions: List[Dict[str, Any]]) -> int:
+        """
+        Erstellt mehrere Sessions in einer Transaktion (executemany)
+
+        Args:
+            sessions: Dicts mit den Feldern von create()
+
+        Returns:
+            Anzahl eingefügter Sessions
+        """
+        if not sessions:
+            return 0
+
+        rows = [(
+            s['title'], s['recorded_at'], s.get('duration_sec', 0), s['path'],
+            s.get('samplerate', 44100), s.get('channels', 1), s.get('notes', ''),
+            s.get('content_hash')
+        ) for s in sessions]
+
         with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+            conn.executemany("""
+                INSERT INTO sessions (title, recorded_at, duration_sec, path,
+                                     samplerate, channels, notes, content_hash)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            conn.commit()
 
-            if search_term:
-                cursor = conn.execute("""
-                    SELECT * FROM sessions
-                    WHERE title LIKE ? OR notes LIKE ? OR transcript_text LIKE ?
-                    ORDER BY recorded_at DESC
-                """, (f'%{search_term}%', f'%{search_term}%', f'%{search_term}%'))
-            else:
-                cursor = conn.execute("""
-                    SELECT * FROM sessions
-                    ORDER BY recorded_at DESC
-                """)
+        self.hashes.put_many(
+            (s['path'], s['content_hash']) for s in sessions if s.get('content_hash')
+        )
 
-            sessions = [dict(row) for row in cursor.fetchall()]
+        return len(rows)
 
-            # Dateigröße für jede Session berechnen
-            for session in sessions:
-                if session.get('path'):
-                    # Konvertiere relative Pfade zu absoluten (Legacy-Support)
-                    file_path = Path(session['path'])
-                    if not file_path.is_absolute():
-                        file_path = Path.cwd() / file_path
-                    session['path'] = str(file_path)
+    def get_existing_paths(self) -> set:
+        """Gibt alle bekannten Audio-Pfade zurück (für fortsetzbare Importe)"""
+        with sqlite3.connect(self.db_path) as conn:
+            return {row[0] for row in conn.execute("SELECT path FROM sessions")}
 
-                    try:
-                        if file_path.exists():
-                            session['file_size'] = file_path.stat().st_size
-                        else:
-                            session['file_size'] = 0
-                    except Exception:
-                        session['file_size'] = 0
-                else:
-                    session['file_size'] = 0
+    def get_existing_hashes(self, hashes: Iterable[str]) -> set:
+        """Gibt zurück welche der Content-Hashes bereits in der Datenbank sind"""
+        hashes = list(hashes)
+        found = set()
 
-            return sessions
+        with sqlite3.connect(self.db_path) as conn:
+            # SQLite-Limit für Parameter beachten
+            for i in range(0, len(hashes), 500):
+                part = hashes[i:i + 500]
+                placeholders = ', '.join('?' * len(part))
+                cursor = conn.execute(
+                    f"SELECT content_hash FROM sessions WHERE content_hash IN ({placeholders})",
+                    part
+                )
+                found.update(row[0] for row in cursor)
+
+        return found
+
+    def get_all(self, search_term: str = '') -> List[Dict[str, Any]]:
+        """Holt alle Sessions (ohne Transkript-Text), optional gefiltert nach Suchbegriff"""
+        return self.list_sessions(search_term=search_term)
+
+    def list_sessions(self, search_term: str = '',
+                      statuses: Optional[Iterable[Optional[str]]] = None,
+                      date_from: Optional[str] = None,
+                      date_to: Optional[str] = None,
+                      min_duration: Optional[int] = None,
+                      max_duration: Optional[int] = None,
+                      session_ids: Optional[Iterable[int]] = None) -> List[Dict[str, Any]]:
+        """
+        Holt Sessions für Listenansichten (ohne große Textspalten)
+
+        Args:
+            search_term: Suchbegriff für Titel, Notizen und Transkript
+            statuses: Transkriptions-Status (None in der Liste = kein Status)
+            date_from: Frühestes Aufnahmedatum (ISO-Format, inklusive)
+            date_to: Spätestes Aufnahmedatum (ISO-Format, inklusive)
+            min_duration: Minimale Dauer in Sekunden
+            max_duration: Maximale Dauer in Sekunden
+            session_ids: Nur diese Sessions (z.B. Mehrfachauswahl)
+
+        Returns:
+            Liste von Session-Dicts, neueste zuerst
+        """
+        where, params = self._build_filters(
+            search_term, statuses, date_from, date_to, min_duration, max_duration,
+            session_ids
+        )
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            register_functions(conn)
+            cursor = conn.execute(f"""
+                SELECT {', '.join(LIST_COLUMNS)}, file_size FROM sessions
+                {where}
+                ORDER BY recorded_at DESC
+            """, params)
+
+            sessions = [dict(row) for row in cursor.fetchall()]
+
+        # Dateigröße nur für Sessions ohne gespeicherte Größe ermitteln und merken
+        sizes = [(session['file_size'], session['id'])
+                 for session in sessions if self._resolve_path_and_size(session)]
+        if sizes:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany("UPDATE sessions SET file_size = ? WHERE id = ?", sizes)
+                conn.commit()
+
+        return sessions
+
+    def _build_filters(self, search_term: str = '',
+                       statuses: Optional[Iterable[Optional[str]]] = None,
+                       date_from: Optional[str] = None,
+                       date_to: Optional[str] = None,
+                       min_duration: Optional[int] = None,
+                       max_duration: Optional[int] = None,
+                       session_ids: Optional[Iterable[int]] = None) -> Tuple[str, list]:
+        """Baut die WHERE-Klausel für Listen-Filter"""
+        conditions = []
+        params = []
+
+        if search_term:
+            # Transkripte über den Suchindex (unkomprimiert, Trigramm-Index)
+            conditions.append(f"""(title LIKE ? OR notes LIKE ? OR id IN (
+                SELECT rowid FROM {SEARCH_TABLE} WHERE text LIKE ?
+            ))""")
+            params.extend([f'%{search_term}%'] * 3)
+
+        if statuses is not None:
+            statuses = list(statuses)
+            status_conditions = []
+            values = [status for status in statuses if status is not None]
+            if values:
+                placeholders = ', '.join('?' * len(values))
+                status_conditions.append(f"transcription_status IN ({placeholders})")
+                params.extend(values)
+            if None in statuses:
+                status_conditions.append("transcription_status IS NULL")
+            conditions.append(f"({' OR '.join(status_conditions) or '0'})")
+
+        if date_from:
+            conditions.append("recorded_at >= ?")
+            params.append(date_from)
+
+        if date_to:
+            if len(date_to) == 10:
+                # Datum ohne Uhrzeit: ganzen Tag einschließen
+                conditions.append("recorded_at < date(?, '+1 day')")
+            else:
+                conditions.append("recorded_at <= ?")
+            params.append(date_to)
+
+        if min_duration is not None:
+            conditions.append("duration_sec >= ?")
+            params.append(min_duration)
+
+        if max_duration is not None:
+            conditions.append("duration_sec <= ?")
+            params.append(max_duration)
+
+        if session_ids is not None:
+            session_ids = list(session_ids)
+            placeholders = ', '.join('?' * len(session_ids))
+            conditions.append(f"id IN ({placeholders})" if session_ids else "0")
+            params.extend(session_ids)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return where, params
+
+    @staticmethod
+    def _resolve_path_and_size(session: Dict[str, Any]) -> bool:
+        """
+        Setzt absoluten Pfad und Dateigröße einer Session
+
+        Die Größe kommt aus der Spalte file_size, nur wenn sie fehlt wird die
+        Datei angefasst (stat).
+
+        Returns:
+            True wenn die Größe neu ermittelt wurde und gespeichert werden kann
+        """
+        if not session.get('path'):
+            session['file_size'] = 0
+            return False
+
+        # Konvertiere relative Pfade zu absoluten (Legacy-Support)
+        # os.path statt Path: läuft für jede Zeile der Liste
+        file_path = session['path']
+        if not os.path.isabs(file_path):
+            file_path = session['path'] = os.path.join(os.getcwd(), file_path)
+
+        if session.get('file_size') is not None:
+            return False
+        try:
+            session['file_size'] = os.stat(file_path).st_size
+            return True
+        except OSError:
+            # Fehlende Datei nicht merken (kann wieder auftauchen, z.B. Laufwerk)
+            session['file_size'] = 0
+            return False
 
     def get_by_id(self, session_id: int) -> Optional[Dict[str, Any]]:
-        """Holt eine Session anhand der ID"""
+        """Holt eine Session anhand der ID (inklusive Transkript-Text)"""
         with sqlite3.connect(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute("SELECT * FROM sessions WHERE id = ?", (session_id,))
@@ -124,6 +357,8 @@ class SessionRepository:
                     if not file_path.is_absolute():
                         file_path = Path.cwd() / file_path
                     session['path'] = str(file_path)
+                # Transkript erst beim Öffnen einer Session laden
+                session['transcript_text'] = self.artifacts.load(session_id, KIND_TRANSCRIPT)
                 return session
             return None
 
@@ -131,6 +366,8 @@ class SessionRepository:
         """Aktualisiert eine Session mit den übergebenen Feldern"""
         if not kwargs:
             return
+        if 'path' in kwargs:
+            kwargs.setdefault('file_size', None)  # Größe der neuen Datei neu ermitteln
 
         fields = ', '.join([f"{key} = ?" for key in kwargs.keys()])
         values = list(kwargs.values()) + [session_id]
@@ -139,6 +376,33 @@ class SessionRepository:
             conn.execute(f"UPDATE sessions SET {fields} WHERE id = ?", values)
             conn.commit()
 
+    def update_many(self, updates: List[Dict[str, Any]]):
+        """
+        Aktualisiert mehrere Sessions in einer Transaktion
+
+        Args:
+            updates: Dicts mit 'id' und den zu ändernden Feldern
+        """
+        # Nach Feld-Kombination gruppieren, damit executemany möglich ist
+        groups: Dict[Tuple[str, ...], list] = {}
+        for update in updates:
+            if 'path' in update:
+                update = {'file_size': None, **update}  # Größe der neuen Datei neu ermitteln
+            fields = tuple(sorted(key for key in update if key != 'id'))
+            if fields:
+                groups.setdefault(fields, []).append(
+                    [update[key] for key in fields] + [update['id']]
+                )
+
+        if not groups:
+            return
+
+        with sqlite3.connect(self.db_path) as conn:
+            for fields, rows in groups.items():
+                assignments = ', '.join(f"{key} = ?" for key in fields)
+                conn.executemany(f"UPDATE sessions SET {assignments} WHERE id = ?", rows)
+            conn.commit()
+
     def delete(self, session_id: int) -> dict:
         """Löscht eine Session und die zugehörige Audio-Datei"""
         # Zuerst Session-Daten holen für Dateipfad
@@ -147,37 +411,83 @@ class SessionRepository:
         # Datenbankeintrag löschen
         with sqlite3.connect(self.db_path) as conn:
             conn.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+            self.artifacts.delete_for_session(session_id, conn=conn)
+            self.jobs.cancel_for_sessions([session_id], conn=conn)
+            if session:
+                self.hashes.remove_many([session.get('path')], conn=conn)
             conn.commit()
 
         # Audio-Datei löschen falls vorhanden
-        if session and session.get('path'):
-            file_path = Path(session['path'])
-            try:
-                if file_path.exists():
-                    file_path.unlink()
-                    return {"success": True, "file_deleted": True}
-                return {"success": True, "file_deleted": False, "reason": "Datei existiert nicht"}
-            except PermissionError:
-                return {"success": True, "file_deleted": False, "reason": "Keine Berechtigung"}
-            except Exception as e:
-                return {"success": True, "file_deleted": False, "reason": str(e)}
-
-        return {"success": True, "file_deleted": False, "reason": "Kein Pfad vorhanden"}
+        return self.delete_file(session.get('path') if session else None)
+
+    def delete_many(self, session_ids: Iterable[int]) -> List[str]:
+        """
+        Löscht mehrere Sessions in einer Transaktion (ohne Audio-Dateien)
+
+        Die Dateien werden nicht gelöscht, damit der Aufrufer das im
+        Hintergrund erledigen kann (siehe delete_file()).
+
+        Returns:
+            Pfade der Audio-Dateien der gelöschten Sessions
+        """
+        rows = [(session_id,) for session_id in session_ids]
+        if not rows:
+            return []
+
+        with sqlite3.connect(self.db_path) as conn:
+            paths = []
+            for i in range(0, len(rows), 500):
+                part = [row[0] for row in rows[i:i + 500]]
+                placeholders = ', '.join('?' * len(part))
+                cursor = conn.execute(
+                    f"SELECT path FROM sessions WHERE id IN ({placeholders})", part
+                )
+                paths.extend(row[0] for row in cursor if row[0])
+
+            # Konvertiere relative Pfade zu absoluten (Legacy-Support)
+            paths = [str(Path(path) if Path(path).is_absolute() else Path.cwd() / path)
+                     for path in paths]
+
+            conn.executemany("DELETE FROM sessions WHERE id = ?", rows)
+            self.artifacts.delete_for_sessions([row[0] for row in rows], conn=conn)
+            for i in range(0, len(rows), 500):
+                self.jobs.cancel_for_sessions([row[0] for row in rows[i:i + 500]], conn=conn)
+            self.hashes.remove_many(paths, conn=conn)
+            conn.commit()
+
+        return paths
+
+    @staticmethod
+    def delete_file(path: Optional[str]) -> dict:
+        """Löscht eine Audio-Datei und gibt das Ergebnis zurück"""
+        if not path:
+            return {"success": True, "file_deleted": False, "reason": "Kein Pfad vorhanden"}
+
+        file_path = Path(path)
+        try:
+            if file_path.exists():
+                file_path.unlink()
+                return {"success": True, "file_deleted": True}
+            return {"success": True, "file_deleted": False, "reason": "Datei existiert nicht"}
+        except PermissionError:
+            return {"success": True, "file_deleted": False, "reason": "Keine Berechtigung"}
+        except Exception as e:
+            return {"success": True, "file_deleted": False, "reason": str(e)}
 
     def update_transcript(self, session_id: int, text: str, tokens: int, status: str = "completed"):
         """Aktualisiert Transkript einer Session"""
         with sqlite3.connect(self.db_path) as conn:
+            self.artifacts.save(session_id, KIND_TRANSCRIPT, text, tokens=tokens, conn=conn)
             conn.execute("""
                 UPDATE sessions
-                SET transcript_text = ?,
-                    transcript_tokens = ?,
+                SET transcript_tokens = ?,
                     transcription_status = ?
                 WHERE id = ?
-            """, (text, tokens, status, session_id))
+            """, (tokens, status, session_id))
             conn.commit()
 
     def set_transcription_status(self, session_id: int, status: str):
-        """Setzt nur den Status (pending/completed/error)"""
+        """Setzt nur den Status (queued/running/completed/error)"""
         with sqlite3.connect(self.db_path) as conn:
             conn.execute("""
                 UPDATE sessions
@@ -186,15 +496,88 @@ class SessionRepository:
             """, (status, session_id))
             conn.commit()
 
+    def set_transcription_status_many(self, session_ids: Iterable[int], status: Optional[str]):
+        """Setzt den Status mehrerer Sessions in einer Transaktion"""
+        rows = [(status, session_id) for session_id in session_ids]
+        if not rows:
+            return
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany("""
+                UPDATE sessions
+                SET transcription_status = ?
+                WHERE id = ?
+            """, rows)
+            conn.commit()
+
+    def count_sessions(self, **filters) -> int:
+        """Zählt Sessions mit denselben Filtern wie list_sessions()"""
+        where, params = self._build_filters(**filters)
+
+        with sqlite3.connect(self.db_path) as conn:
+            register_functions(conn)
+            return conn.execute(f"SELECT COUNT(*) FROM sessions {where}", params).fetchone()[0]
+
+    def iter_sessions(self, columns: Optional[Iterable[str]] = None,
+                      batch_size: int = 500, **filters) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Liefert Sessions blockweise über einen offenen Cursor (konstanter Speicher)
+
+        Args:
+            columns: Gewünschte Spalten aus EXPORT_COLUMNS (None = alle)
+            batch_size: Anzahl Zeilen pro Block
+            **filters: Filter wie bei list_sessions()
+
+        Yields:
+            Listen von Session-Dicts mit den gewünschten Spalten
+        """
+        columns = list(columns) if columns else list(EXPORT_COLUMNS)
+        unknown = [col for col in columns if col not in EXPORT_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unbekannte Spalten: {', '.join(unknown)}")
+
+        # path wird für Pfadauflösung und Dateigröße benötigt
+        select = [col for col in LIST_COLUMNS if col in columns or
+                  (col == 'path' and 'file_size' in columns)]
+        if 'file_size' in columns:
+            select.append('file_size')
+        if 'transcript_text' in columns:
+            select.append("""(
+                SELECT artifact_text(encoding, content) FROM artifacts
+                WHERE session_id = sessions.id AND kind = 'transcript' AND prompt_id = ''
+                ORDER BY created_at DESC LIMIT 1
+            ) AS transcript_text""")
+
+        where, params = self._build_filters(**filters)
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            register_functions(conn)
+            cursor = conn.execute(f"""
+                SELECT {', '.join(select)} FROM sessions
+                {where}
+                ORDER BY recorded_at DESC
+            """, params)
+
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+
+                batch = []
+                for row in rows:
+                    session = dict(row)
+                    if 'file_size' in columns:
+                        self._resolve_path_and_size(session)
+                    batch.append({col: session.get(col) for col in columns})
+                yield batch
+
     def export_to_csv(self, output_path: str):
-        """Exportiert alle Sessions als CSV"""
+        """Exportiert alle Sessions als CSV (blockweise, konstanter Speicher)"""
         import csv
 
-        sessions = self.get_all()
-        if not sessions:
-            return
-
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=sessions[0].keys())
+            writer = csv.DictWriter(f, fieldnames=EXPORT_COLUMNS)
             writer.writeheader()
-            writer.writerows(sessions)
+            for batch in self.iter_sessions():
+                writer.writerows(batch)
@@ -0,0 +1,50 @@
+"""
+Importiert bestehende Audio-Archive als Sessions (Kommandozeile)
+
+Verwendung:
+    python import_archive.py /pfad/zum/archiv [/weiteres/archiv ...]
+"""
+import argparse
+import sys
+
+from data.repo import SessionRepository
+from services.import_service import ArchiveImporter
+
+
+def main():
+    """Hauptfunktion"""
+    parser = argparse.ArgumentParser(description="Audio-Archive als Sessions importieren")
+    parser.add_argument("directories", nargs="+", help="Zu durchsuchende Verzeichnisse")
+    parser.add_argument("--db", default="data/sessions.db", help="Pfad zur Session-Datenbank")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Anzahl paralleler Prozesse (Standard: CPU-Anzahl)")
+    parser.add_argument("--batch-size", type=int, default=200,
+                        help="Sessions pro Transaktion")
+    args = parser.parse_args()
+
+    importer = ArchiveImporter(
+        SessionRepository(args.db),
+        max_workers=args.workers,
+        batch_size=args.batch_size
+    )
+
+    def on_progress(done: int, total: int):
+        print(f"\r📦 {done}/{total} Dateien verarbeitet", end="", flush=True)
+
+    try:
+        stats = importer.run(args.directories, progress_callback=on_progress)
+    except KeyboardInterrupt:
+        print("\n⚠️ Abgebrochen - erneuter Aufruf setzt den Import fort")
+        return 1
+
+    print()
+    print(f"✅ Importiert: {stats['imported']}, bereits vorhanden: {stats['skipped']}, "
+          f"Dubletten: {stats['duplicates']}, Fehler: {stats['failed']}")
+    for error in stats["errors"]:
+        print(f"  ✗ {error}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,9 @@
 """
 Audio Player für Wiedergabe von Sessions
+
+sounddevice und soundfile werden erst beim Laden bzw. Abspielen einer Datei
+importiert (PortAudio-Initialisierung nicht beim App-Start).
 """
-import sounddevice as sd
-import soundfile as sf
 import numpy as np
 from pathlib import Path
 from typing import Optional
@@ -30,7 +31,7 @@ class AudioPlayer(QObject):
         self.current_file: Optional[str] = None
         self.audio_data: Optional[np.ndarray] = None
         self.samplerate: int = 44100
-        self.stream: Optional[sd.OutputStream] = None
+        self.stream = None  # sd.OutputStream während der Wiedergabe
         self.current_frame: int = 0
         self.total_frames: int = 0
         self._position_timer = QTimer()
@@ -44,6 +45,7 @@ class AudioPlayer(QObject):
             if not Path(file_path).exists():
                 return False
 
+            import soundfile as sf
             self.audio_data, self.samplerate = sf.read(file_path, dtype='float32')
             self.current_file = file_path
             self.total_frames = len(self.audio_data)
@@ -149,6 +151,7 @@ class AudioPlayer(QObject):
                 channels = self.audio_data.shape[1]
 
             # Stream erstellen - Auto-select device für bessere macOS Kompatibilität
+            import sounddevice as sd
             self.stream = sd.OutputStream(
                 samplerate=self.samplerate,
                 channels=channels,
@@ -1,15 +1,20 @@
 """
 Audio Recorder mit Live-Pegelanzeige
+
+sounddevice wird erst bei der Geräteabfrage bzw. Aufnahme importiert: Der
+Import initialisiert PortAudio (Geräte-Scan), was auf dem Raspberry Pi den
+App-Start spürbar verzögert.
 """
-import sounddevice as sd
-import soundfile as sf
 import numpy as np
+import wave
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List
 from PySide6.QtCore import QObject, Signal
 import time
 
+from data.audio_hashes import HashingFile, hash_file
+
 
 class AudioRecorder(QObject):
     """Audio Recorder für Mikrofonaufnahmen"""
@@ -28,14 +33,16 @@ class AudioRecorder(QObject):
         self.frames = []
         self.paused_frames = []
         self.paused_device: Optional[int] = None
-        self.stream: Optional[sd.InputStream] = None
+        self.stream = None  # sd.InputStream während der Aufnahme
         self.output_path: Optional[str] = None
         self._start_time: Optional[float] = None
         self._recorded_frames = 0  # Frame-basierte Zeiterfassung (kein stream.time mehr)
         self._last_duration_seconds = 0  # Zwischenspeicher für Dauer nach stop_recording()
+        self.last_content_hash: Optional[str] = None  # SHA256 der zuletzt gespeicherten WAV
 
     def get_devices(self):
         """Gibt eine Liste aller verfügbaren Eingabegeräte zurück"""
+        import sounddevice as sd
         devices = sd.query_devices()
         input_devices = []
 
@@ -82,6 +89,8 @@ class AudioRecorder(QObject):
         if samplerate is not None:
             self.samplerate = samplerate
 
+        import sounddevice as sd
+
         # Device validieren und optimieren (für USB-Geräte)
         if device_index is not None:
             try:
@@ -104,6 +113,7 @@ class AudioRecorder(QObject):
         self.frames = []
         self._recorded_frames = 0
         self._last_duration_seconds = 0
+        self.last_content_hash = None
 
         # Stream mit USB-optimierten Parametern starten
         self.stream = sd.InputStream(
@@ -149,8 +159,7 @@ class AudioRecorder(QObject):
         # Daten zusammenfügen und speichern (vor State-Reset!)
         output_file = None
         if frames_to_save and self.output_path:
-            audio_data = np.concatenate(frames_to_save, axis=0)
-            sf.write(self.output_path, audio_data, self.samplerate)
+            self.last_content_hash = self._write_wav(self.output_path, frames_to_save, total_frames)
             output_file = self.output_path
             print(f"✅ Audio gespeichert: {output_file}")
 
@@ -169,6 +178,34 @@ class AudioRecorder(QObject):
 
         return output_file
 
+    def _write_wav(self, path: str, frames: List[np.ndarray], total_frames: int) -> str:
+        """
+        Schreibt die Aufnahme blockweise als 16-bit WAV und berechnet dabei den SHA256
+
+        Die Frame-Anzahl steht vorab fest, dadurch wird der Header nicht
+        nachträglich gepatcht und der Hash kann beim Schreiben mitlaufen.
+
+        Returns:
+            SHA256 der geschriebenen Datei
+        """
+        target = HashingFile(path)
+        try:
+            with wave.open(target, 'wb') as wav:
+                wav.setnchannels(self.channels)
+                wav.setsampwidth(2)
+                wav.setframerate(self.samplerate)
+                wav.setnframes(total_frames)
+
+                for block in frames:
+                    # float32 [-1, 1] -> int16 (wie PCM_16 bei soundfile)
+                    pcm = (np.clip(block, -1.0, 1.0) * 32767).astype('<i2')
+                    wav.writeframesraw(pcm.tobytes())
+        finally:
+            target.close()
+
+        # Fallback falls der Header doch nachgepatcht wurde
+        return target.hexdigest() or hash_file(path)
+
     def pause_recording(self) -> bool:
         """Pausiert die Aufnahme ohne Datei zu speichern"""
         if not self.is_recording or self.is_paused:
@@ -212,6 +249,7 @@ class AudioRecorder(QObject):
         print(f"▶️ Aufnahme fortgesetzt: {len(self.frames)} Chunks, {duration:.2f} Sekunden wiederhergestellt")
 
         # Stream mit USB-optimierten Parametern neu starten
+        import sounddevice as sd
         self.stream = sd.InputStream(
             device=self.paused_device,
             channels=self.channels,
@@ -0,0 +1,207 @@
+"""
+Prozessweite OpenAI-Clients mit Connection-Pooling und Retry
+
+Ein Client pro (API Key, Timeout) wird wiederverwendet, damit aufeinander
+folgende Jobs bestehende Keep-Alive-Verbindungen (und TLS-Sessions) nutzen.
+Ändern sich Key oder Timeout, wird der alte Client ausgemustert und erst
+geschlossen, wenn keine Anfrage mehr über ihn läuft (holds_client()).
+Vorübergehende Fehler (Rate Limit, Timeout, Verbindungs- und Serverfehler)
+werden mit exponentiellem Backoff und Jitter wiederholt.
+"""
+import functools
+import inspect
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional, Tuple, TypeVar
+
+from openai import (
+    OpenAI, DefaultHttpxClient, RateLimitError, APIConnectionError, InternalServerError
+)
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Standard-Timeout für API-Anfragen (Sekunden)
+DEFAULT_TIMEOUT_SEC = 120.0
+
+# Standard-Anzahl Wiederholungen bei vorübergehenden Fehlern
+DEFAULT_MAX_RETRIES = 3
+
+# Backoff: Basis und Obergrenze der Wartezeit (Sekunden)
+BACKOFF_BASE_SEC = 1.0
+BACKOFF_MAX_SEC = 30.0
+
+# Verbindungen im Pool (parallele Chunk-Uploads + Transformation)
+POOL_MAX_CONNECTIONS = 16
+POOL_KEEPALIVE_SEC = 120.0
+
+# Fehler, bei denen sich eine Wiederholung lohnt (APITimeoutError erbt von APIConnectionError)
+RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+
+T = TypeVar("T")
+
+_clients: Dict[Tuple[str, float, Optional[str]], OpenAI] = {}
+_clients_lock = threading.Lock()
+
+# Laufende Aufrufe pro Client (id) und ausgemusterte, noch benutzte Clients
+_in_use: Dict[int, int] = {}
+_retired: Dict[int, OpenAI] = {}
+
+
+def _create_http_client():
+    """Erstellt den HTTP-Client mit Keep-Alive-Pool (None = OpenAI-Standard)"""
+    if httpx is None:
+        return None
+    return DefaultHttpxClient(
+        limits=httpx.Limits(
+            max_connections=POOL_MAX_CONNECTIONS,
+            max_keepalive_connections=POOL_MAX_CONNECTIONS,
+            keepalive_expiry=POOL_KEEPALIVE_SEC
+        )
+    )
+
+
+def get_client(api_key: str, timeout: float = DEFAULT_TIMEOUT_SEC,
+               base_url: Optional[str] = None) -> OpenAI:
+    """
+    Gibt den gemeinsamen Client für einen API Key zurück (thread-safe)
+
+    Das SDK-eigene Retry ist abgeschaltet, Wiederholungen laufen über with_retry().
+    base_url erlaubt einen kompatiblen Ersatz-Endpunkt (None = OpenAI bzw. OPENAI_BASE_URL).
+    Clients mit anderem Key oder Timeout (Einstellungen geändert) werden dabei
+    ausgemustert.
+    """
+    key = (api_key, float(timeout), base_url)
+    stale = []
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            for other in [other for other in _clients if other != key]:
+                stale.append(_retire(_clients.pop(other)))
+            client = OpenAI(
+                api_key=api_key,
+                base_url=base_url,
+                timeout=timeout,
+                max_retries=0,
+                http_client=_create_http_client()
+            )
+            _clients[key] = client
+
+    for retired in filter(None, stale):
+        _close(retired)
+    return client
+
+
+def _retire(client: OpenAI) -> Optional[OpenAI]:
+    """
+    Mustert einen Client aus (Aufrufer hält _clients_lock)
+
+    Returns:
+        Den Client, wenn er sofort geschlossen werden kann; None wenn noch
+        Aufrufe laufen (dann schließt ihn der letzte holds_client()-Aufruf)
+    """
+    if _in_use.get(id(client)):
+        _retired[id(client)] = client
+        return None
+    return client
+
+
+@contextmanager
+def client_in_use(client: Optional[OpenAI]):
+    """Markiert den Client als benutzt; ein ausgemusterter Client wird erst danach geschlossen"""
+    if client is None:
+        yield client
+        return
+
+    with _clients_lock:
+        _in_use[id(client)] = _in_use.get(id(client), 0) + 1
+    try:
+        yield client
+    finally:
+        retired = None
+        with _clients_lock:
+            count = _in_use.pop(id(client)) - 1
+            if count:
+                _in_use[id(client)] = count
+            else:
+                retired = _retired.pop(id(client), None)
+        if retired is not None:
+            _close(retired)
+
+
+def holds_client(method):
+    """Decorator: self.client bleibt während des Aufrufs offen (auch bei Generatoren)"""
+    if inspect.isgeneratorfunction(method):
+        @functools.wraps(method)
+        def generator_wrapper(self, *args, **kwargs):
+            with client_in_use(self.client):
+                return (yield from method(self, *args, **kwargs))
+        return generator_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with client_in_use(self.client):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _close(client: OpenAI):
+    """Schließt einen Client und seinen Verbindungs-Pool"""
+    try:
+        client.close()
+    except Exception as e:
+        print(f"Warnung: OpenAI-Client konnte nicht geschlossen werden: {e}")
+
+
+def close_clients():
+    """Schließt alle Clients und ihre Verbindungen (beim Beenden der App)"""
+    with _clients_lock:
+        clients = [*_clients.values(), *_retired.values()]
+        _clients.clear()
+        _retired.clear()
+    for client in clients:
+        _close(client)
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Liest den Retry-After-Header einer Fehlerantwort (Sekunden)"""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    try:
+        return float(response.headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None,
+                  base: float = BACKOFF_BASE_SEC, cap: float = BACKOFF_MAX_SEC) -> float:
+    """Wartezeit vor Versuch attempt+1: Full Jitter, mindestens Retry-After"""
+    delay = random.uniform(0, min(cap, base * (2 ** attempt)))
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, cap))
+    return delay
+
+
+def with_retry(call: Callable[[], T], max_retries: int = DEFAULT_MAX_RETRIES,
+               sleep: Callable[[float], None] = time.sleep) -> T:
+    """
+    Führt call() aus und wiederholt bei vorübergehenden API-Fehlern
+
+    Nach max_retries Wiederholungen wird der letzte Fehler weitergereicht.
+    """
+    attempt = 0
+    while True:
+        try:
+            return call()
+        except RETRYABLE_ERRORS as e:
+            if attempt >= max_retries:
+                raise
+            delay = backoff_delay(attempt, _retry_after(e))
+            attempt += 1
+            print(f"⏳ {type(e).__name__}, Wiederholung {attempt}/{max_retries} in {delay:.1f}s")
+            sleep(delay)
@@ -2,77 +2,326 @@
 Audio Transcription & GPT-5 Transformation Service
 Basierend auf docs/AUDIO_TRANSCRIPTION_GPT5_INTEGRATION.md
 """
-from openai import OpenAI, OpenAIError, APIError, RateLimitError, APITimeoutError
+from openai import OpenAIError, APIError, RateLimitError, APITimeoutError
 from pathlib import Path
-from typing import Optional, Dict, Any
-import json
-import hashlib
+from typing import Optional, Dict, Any, Iterator
 import sys
 import tempfile
 import os
-import platform
 import subprocess
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# Platform detection: Raspberry Pi verwendet ffmpeg direkt (Python 3.13 kompatibel)
-IS_RASPBERRY_PI = platform.machine().startswith('aarch') or platform.machine().startswith('arm')
-
-# Conditional imports: pydub nur auf nicht-Raspberry-Pi Plattformen
-if not IS_RASPBERRY_PI:
-    from pydub import AudioSegment
-    from pydub.utils import which
+import numpy as np
 
 sys.path.append(str(Path(__file__).parent.parent))
 from settings import SettingsManager
+from data.audio_hashes import AudioHashIndex
+from services.transcript_cache import TranscriptCache
+from services.wav_info import read_wav_info, wav_duration
+from services.resampler import StreamingResampler, iter_wav_blocks, is_supported, to_int16
+from services.chunk_planner import plan_chunks, merge_transcripts
+from services.binaries import find_binary
+from services.api_client import get_client, holds_client, with_retry, DEFAULT_TIMEOUT_SEC, DEFAULT_MAX_RETRIES
+from services.throughput import RateLimiter, get_rate_limiter, AUDIO_TOKENS_PER_SEC
+from services.transform_cache import TransformCache, KIND_SECTION, KIND_RESULT, cache_key, text_hash
+from services.model_router import ModelRouter, DEFAULT_MODELS, models_for_prompt, uses_reasoning
+from services.map_reduce import (
+    CONTEXT_BUDGET_TOKENS, MAP_CONCURRENCY, MAP_PROMPT, estimate_tokens, split_sections,
+    join_partials
+)
+
+
+# Modell für Transkription (Teil des Cache-Schlüssels)
+TRANSCRIBE_MODEL = "gpt-4o-transcribe"
+
+# Standard-Anzahl gleichzeitiger Chunk-Uploads
+DEFAULT_TRANSCRIPTION_CONCURRENCY = 4
+
+# MP3-Zielformat: 64 kbps -> 8000 Bytes pro Sekunde
+MP3_BYTES_PER_SECOND = 64000 // 8
+
+# Chunk-Länge für lange Aufnahmen (15 Minuten, Obergrenze)
+CHUNK_DURATION_SEC = 15 * 60
+
+# Kürzere Chunks lohnen sich für parallele Uploads nicht
+MIN_PARALLEL_CHUNK_SEC = 3 * 60
+
+
+class _FfmpegSegmenter:
+    """
+    Kodiert eine Audio-Datei in einem ffmpeg-Lauf zu MP3-Segmenten
+
+    Fertige Segmente werden über die Segment-Liste (CSV) erkannt, damit der
+    Upload von Segment N schon läuft während ffmpeg Segment N+1 kodiert.
+    """
+
+    POLL_INTERVAL = 0.1
+
+    def __init__(self, audio_file_path: str, cut_points: list):
+        """
+        Args:
+            audio_file_path: Pfad zur Original-WAV-Datei
+            cut_points: Schnittzeitpunkte in Sekunden (leer = ein Segment)
+        """
+        self.audio_file_path = audio_file_path
+        self.cut_points = cut_points
+        prefix = os.path.join(tempfile.gettempdir(), f"audio_{uuid.uuid4().hex}")
+        self.pattern = f"{prefix}_chunk_%03d.mp3"
+        self.list_path = f"{prefix}_segments.csv"
+        self.process = None
+        self.total = len(cut_points) + 1
+
+    def _start(self):
+        """Startet ffmpeg (einmalig, beim ersten angeforderten Segment)"""
+        # ffmpeg Konvertierung: 16kHz, Mono, 64kbps
+        # -max_muxing_queue_size für Raspberry Pi Stabilität
+        command = [
+            find_binary('ffmpeg'), '-v', 'error', '-i', self.audio_file_path,
+            '-ar', '16000',  # Sample rate: 16kHz
+            '-ac', '1',      # Channels: Mono
+            '-b:a', '64k',   # Bitrate: 64kbps
+            '-max_muxing_queue_size', '1024',  # Größere Buffer für USB-Audio
+            '-f', 'segment',
+            '-segment_list', self.list_path,
+            '-segment_list_type', 'csv',
+            '-reset_timestamps', '1',
+        ]
+        if self.cut_points:
+            command += ['-segment_times', ','.join(f"{point:.3f}" for point in self.cut_points)]
+        else:
+            # Nur ein Segment: keine Schnitte
+            command += ['-segment_time', '999999']
+        command += ['-y', self.pattern]
+
+        self.process = subprocess.Popen(
+            command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+        )
+
+    def _finished_segments(self) -> int:
+        """Anzahl der laut Segment-Liste vollständig geschriebenen Segmente"""
+        try:
+            with open(self.list_path, "r", encoding="utf-8") as f:
+                return sum(1 for line in f if line.endswith("\n"))
+        except FileNotFoundError:
+            return 0
+
+    def wait_for_segment(self, index: int) -> str:
+        """Wartet bis Segment `index` fertig ist und gibt den Pfad zurück"""
+        if self.process is None:
+            self._start()
+
+        while self._finished_segments() <= index:
+            if self.process.poll() is not None:
+                # ffmpeg beendet: Liste ein letztes Mal prüfen
+                if self._finished_segments() > index:
+                    break
+                stderr = self.process.stderr.read().decode("utf-8", errors="replace")
+                if self.process.returncode != 0:
+                    raise Exception(f"ffmpeg Fehler: {stderr}")
+                raise Exception(f"ffmpeg hat Segment {index + 1}/{self.total} nicht erzeugt")
+            time.sleep(self.POLL_INTERVAL)
+
+        if index == self.total - 1:
+            # Letztes Segment: ffmpeg sauber beenden lassen
+            self.process.wait()
+
+        return self.pattern % index
+
+    def close(self):
+        """Beendet ffmpeg (falls noch aktiv) und löscht Liste und übrige Segmente"""
+        if self.process is not None:
+            if self.process.poll() is None:
+                self.process.kill()
+            self.process.wait()
+            self.process.stderr.close()
+
+        paths = [self.list_path] + [self.pattern % index for index in range(self.total + 1)]
+        for path in paths:
+            try:
+                if os.path.exists(path):
+                    os.unlink(path)
+            except OSError as e:
+                print(f"Warnung: Temp-Datei konnte nicht gelöscht werden: {path} - {e}")
+
+
+class _StreamingChunkEncoder:
+    """
+    Kodiert eine WAV-Datei chunkweise zu MP3, gespeist aus einem einzigen Stream
+
+    Die Samples werden blockweise gelesen, auf Mono gemischt, auf 16 kHz
+    resampled und als 16-bit PCM an einen ffmpeg-Encoder pro Chunk
+    geschrieben. Es liegt nie mehr als ein Block im Speicher.
+    """
+
+    TARGET_RATE = 16000
+
+    def __init__(self, audio_file_path: str, info: dict, ranges: list):
+        """
+        Args:
+            audio_file_path: Pfad zur WAV-Datei
+            info: Header-Infos aus read_wav_info()
+            ranges: (start, dauer) in Sekunden pro Chunk (dauer None = bis zum Ende)
+        """
+        self.blocks = iter_wav_blocks(audio_file_path, info)
+        self.resampler = StreamingResampler(info["samplerate"], self.TARGET_RATE)
+        self.chunk_ends = [
+            None if duration is None else int(round((start + duration) * self.TARGET_RATE))
+            for start, duration in ranges
+        ]
+        self.chunk_ends[-1] = None  # Letzter Chunk nimmt alles Übrige
+
+        # Überlappung: Chunk i beginnt vor dem Ende von Chunk i-1
+        self.overlaps = [0] + [
+            max(0, self.chunk_ends[index - 1] - int(round(start * self.TARGET_RATE)))
+            for index, (start, _duration) in enumerate(ranges) if index > 0
+        ]
+        self.max_overlap = max(self.overlaps)
+        self.tail = np.zeros(0, dtype=np.float32)  # Zuletzt geschriebene Samples
+        self.carry = np.zeros(0, dtype=np.float32)
+        self.exhausted = False
+        self.written = 0
+        self.process = None
+        self.paths = []
+
+    def _next_samples(self) -> np.ndarray:
+        """Liest und resampled den nächsten Block"""
+        try:
+            return self.resampler.process(next(self.blocks))
+        except StopIteration:
+            self.exhausted = True
+            return self.resampler.flush()
+
+    def encode_chunk(self, index: int) -> str:
+        """Kodiert Chunk `index` (Aufruf in Reihenfolge) und gibt den MP3-Pfad zurück"""
+        temp_chunk = tempfile.NamedTemporaryFile(delete=False, suffix=f"_chunk_{index}.mp3")
+        temp_chunk.close()
+        self.paths.append(temp_chunk.name)
+
+        stderr = tempfile.TemporaryFile()
+        self.process = subprocess.Popen([
+            find_binary('ffmpeg'), '-v', 'error',
+            '-f', 's16le', '-ar', str(self.TARGET_RATE), '-ac', '1', '-i', 'pipe:0',
+            '-b:a', '64k',   # Bitrate: 64kbps
+            '-y', temp_chunk.name
+        ], stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=stderr)
+
+        end = self.chunk_ends[index]
+        overlap = self.overlaps[index]
+        try:
+            # Ende des vorherigen Chunks erneut einspeisen
+            if overlap:
+                self.process.stdin.write(to_int16(self.tail[-overlap:]))
+
+            while end is None or self.written < end:
+                if not len(self.carry):
+                    if self.exhausted:
+                        break
+                    self.carry = self._next_samples()
+                    continue
+
+                take = len(self.carry) if end is None else min(len(self.carry), end - self.written)
+                self.process.stdin.write(to_int16(self.carry[:take]))
+                if self.max_overlap:
+                    self.tail = np.concatenate([self.tail, self.carry[:take]])[-self.max_overlap:]
+                self.carry = self.carry[take:]
+                self.written += take
+
+            self.process.stdin.close()
+        except BrokenPipeError:
+            pass
+
+        returncode = self.process.wait()
+        self.process = None
+        stderr.seek(0)
+        message = stderr.read().decode("utf-8", errors="replace")
+        stderr.close()
+
+        if returncode != 0:
+            raise Exception(f"ffmpeg Fehler: {message}")
+
+        return temp_chunk.name
+
+    def close(self):
+        """Beendet einen laufenden Encoder und löscht erzeugte Temp-Dateien"""
+        if self.process is not None:
+            self.process.kill()
+            self.process.wait()
+            self.process = None
+        self.blocks.close()
+
+        for path in self.paths:
+            try:
+                if os.path.exists(path):
+                    os.unlink(path)
+            except OSError as e:
+                print(f"Warnung: Temp-Datei konnte nicht gelöscht werden: {path} - {e}")
 
-# Konfiguriere ffmpeg Pfad für pydub (für PyInstaller-gebaute Apps)
-def _setup_ffmpeg():
-    """Findet und setzt ffmpeg/ffprobe Pfad für pydub (nur auf nicht-Raspberry-Pi)"""
-    if IS_RASPBERRY_PI:
-        return  # Auf Raspberry Pi wird ffmpeg direkt verwendet
-
-    # Prüfe ob wir in einer PyInstaller-App laufen
-    if getattr(sys, 'frozen', False):
-        # In PyInstaller-App: Binaries sind im gleichen Verzeichnis wie die Executable
-        bundle_dir = Path(sys._MEIPASS) if hasattr(sys, '_MEIPASS') else Path(sys.executable).parent
-        ffmpeg_path = bundle_dir / 'ffmpeg'
-        ffprobe_path = bundle_dir / 'ffprobe'
-
-        if ffmpeg_path.exists():
-            AudioSegment.converter = str(ffmpeg_path)
-            AudioSegment.ffmpeg = str(ffmpeg_path)
-        if ffprobe_path.exists():
-            AudioSegment.ffprobe = str(ffprobe_path)
-    else:
-        # Development-Modus: Versuche ffmpeg im PATH zu finden
-        ffmpeg = which("ffmpeg")
-        ffprobe = which("ffprobe")
-        if ffmpeg:
-            AudioSegment.converter = ffmpeg
-            AudioSegment.ffmpeg = ffmpeg
-        if ffprobe:
-            AudioSegment.ffprobe = ffprobe
-
-# ffmpeg beim Import konfigurieren
-_setup_ffmpeg()
+
+_services = {}
+_services_lock = threading.Lock()
+
+
+def get_service(api_key: str) -> "AudioSessionService":
+    """
+    Gibt den prozessweiten Service für einen API Key zurück
+
+    Timeout und Retry-Anzahl kommen aus den Settings; ändern sie sich,
+    wird ein neuer Service (mit eigenem Client) angelegt. Services einer
+    alten Konfiguration werden verworfen; ihre Clients schließt get_client(),
+    sobald keine Anfrage mehr über sie läuft.
+    """
+    settings = SettingsManager.instance()
+    key = (api_key, settings.get_api_timeout(), settings.get_api_max_retries())
+    rate_limiter = get_rate_limiter(
+        settings.get_rate_limit_rpm(), settings.get_rate_limit_tpm()
+    )
+    with _services_lock:
+        service = _services.get(key)
+        if service is None:
+            # Nur die aktuelle Konfiguration behalten; alte Clients schließt get_client()
+            _services.clear()
+            service = AudioSessionService(api_key=api_key, timeout=key[1], max_retries=key[2],
+                                          rate_limiter=rate_limiter)
+            _services[key] = service
+        return service
 
 
 class AudioSessionService:
     """Service für Audio-Transkription und Text-Transformation"""
 
-    def __init__(self, api_key: str = None, cache_dir: str = ".transcripts_cache"):
+    def __init__(self, api_key: str = None, cache_dir: str = ".transcripts_cache",
+                 hash_index: Optional[AudioHashIndex] = None,
+                 timeout: float = DEFAULT_TIMEOUT_SEC, max_retries: int = DEFAULT_MAX_RETRIES,
+                 rate_limiter: Optional[RateLimiter] = None, base_url: Optional[str] = None):
         """
         Initialisiert den Service
 
         Args:
             api_key: OpenAI API Key
             cache_dir: Verzeichnis für Transkript-Cache
+            hash_index: Persistenter Hash-Index (Standard: data/sessions.db)
+            timeout: Timeout pro API-Anfrage in Sekunden
+            max_retries: Wiederholungen bei Rate Limit, Timeout und Serverfehlern
+            rate_limiter: Begrenzung Anfragen/Tokens pro Minute (Standard: unbegrenzt)
+            base_url: Alternativer API-Endpunkt (z.B. Test-Server)
         """
-        self.client = OpenAI(api_key=api_key) if api_key else None
+        # Gemeinsamer Client: Verbindungen bleiben zwischen Jobs offen
+        self.client = get_client(api_key, timeout, base_url) if api_key else None
+        self.max_retries = max_retries
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.transform_cache = TransformCache()
+        # Modell-Verfügbarkeit und Circuit Breaker (pro Service und damit pro API Key)
+        self.router = ModelRouter(self.client)
         self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(exist_ok=True)
+        self.cache = TranscriptCache(cache_dir)
+        self.hash_index = hash_index or AudioHashIndex()
 
+    @holds_client
     def transcribe(self, audio_file_path: str, language: str = "de", use_cache: bool = True,
-                   progress_callback=None) -> dict:
+                   progress_callback=None, max_concurrency: Optional[int] = None) -> dict:
         """
         Transkribiert Audio-Datei mit gpt-4o-transcribe
 
@@ -80,7 +329,8 @@ class AudioSessionService:
             audio_file_path: Pfad zur Audio-Datei (WAV)
             language: Sprache als ISO-639-1 Code ("de", "en")
             use_cache: Cache verwenden für schnellere Wiederverarbeitung
-            progress_callback: Callback-Funktion für Progress (current_chunk, total_chunks)
+            progress_callback: Callback-Funktion für Progress (fertige_chunks, total_chunks)
+            max_concurrency: Maximale Anzahl gleichzeitiger Chunk-Uploads
 
         Returns:
             {
@@ -106,45 +356,71 @@ class AudioSessionService:
         if not audio_path.exists():
             return {"success": False, "error": f"Audio-Datei nicht gefunden: {audio_file_path}"}
 
-        # Cache-Check (basierend auf Original-WAV)
-        if use_cache:
-            cached = self._load_from_cache(audio_file_path)
+        # Cache-Check (basierend auf Original-WAV, Hash nur einmal ermitteln)
+        file_hash = self._get_audio_hash(audio_file_path) if use_cache else None
+        if file_hash:
+            cached = self.cache.get(file_hash, language, TRANSCRIBE_MODEL)
             if cached:
                 cached["success"] = True
                 return cached
 
         audio_chunks = []
+        encode_futures = []
+        close_plan = None
 
         try:
-            # 1. Audio vorbereiten (MP3 + ggf. Chunking)
-            audio_chunks = self._prepare_audio_for_transcription(audio_file_path)
-            total_chunks = len(audio_chunks)
-
-            # 2. Jeden Chunk einzeln transkribieren
-            all_transcripts = []
-            total_tokens = 0
+            # 1. Chunks planen (Kodierung folgt im Hintergrund)
+            concurrency = max_concurrency or DEFAULT_TRANSCRIPTION_CONCURRENCY
+            encode_jobs, close_plan = self._plan_audio_chunks(
+                audio_file_path, concurrency=concurrency
+            )
+            total_chunks = len(encode_jobs)
+
+            # 2. Pipeline: Chunk N+1 wird kodiert während Chunk N hochlädt,
+            #    Uploads laufen parallel (Reihenfolge bleibt erhalten)
+            all_transcripts = [None] * total_chunks
+            progress = {"completed": 0, "tokens": 0}
+            workers = max(1, min(concurrency, total_chunks))
+
+            if progress_callback:
+                progress_callback(0, total_chunks)
+
+            def collect(future, index):
+                text, tokens = future.result()
+                all_transcripts[index] = text
+                progress["tokens"] += tokens
+                progress["completed"] += 1
 
-            for i, chunk_path in enumerate(audio_chunks):
                 # Progress-Callback (für UI-Update)
                 if progress_callback:
-                    progress_callback(i + 1, total_chunks)
-
-                # API-Call
-                with open(chunk_path, "rb") as audio_file:
-                    transcript = self.client.audio.transcriptions.create(
-                        model="gpt-4o-transcribe",
-                        file=audio_file,
-                        language=language,
-                        response_format="json",
-                        prompt="Audio Sessions, Transkription, Notizen"
-                    )
+                    progress_callback(progress["completed"], total_chunks)
+
+            encoder = ThreadPoolExecutor(max_workers=1)
+            uploader = ThreadPoolExecutor(max_workers=workers)
+            try:
+                encode_futures = [encoder.submit(job) for job in encode_jobs]
+                pending = {}
+
+                for index, encode_future in enumerate(encode_futures):
+                    chunk_path = encode_future.result()
+                    audio_chunks.append(chunk_path)
+                    pending[uploader.submit(self._transcribe_chunk, chunk_path, language)] = index
+
+                    # Bereits fertige Uploads sofort melden
+                    for future in [f for f in pending if f.done()]:
+                        collect(future, pending.pop(future))
+
+                for future in as_completed(list(pending)):
+                    collect(future, pending.pop(future))
+            finally:
+                # Bei Fehler wartende Kodierungen/Uploads nicht mehr starten
+                encoder.shutdown(wait=True, cancel_futures=True)
+                uploader.shutdown(wait=True, cancel_futures=True)
 
-                # Transkript sammeln
-                all_transcripts.append(transcript.text)
-                total_tokens += getattr(transcript.usage, 'total_tokens', 0) if hasattr(transcript, 'usage') else 0
+            total_tokens = progress["tokens"]
 
             # 3. Transkripte zusammenführen
-            combined_text = " ".join(all_transcripts)
+            combined_text = merge_transcripts(all_transcripts)
 
             result = {
                 "success": True,
@@ -156,8 +432,8 @@ class AudioSessionService:
             }
 
             # Cache speichern
-            if use_cache:
-                self._save_to_cache(audio_file_path, result)
+            if file_hash:
+                self.cache.put(file_hash, language, TRANSCRIBE_MODEL, result)
 
             return result
 
@@ -180,16 +456,254 @@ class AudioSessionService:
             return {"success": False, "error": f"Unerwarteter Fehler: {str(e)}"}
 
         finally:
-            # 4. Temp-Dateien IMMER aufräumen (auch bei Fehler)
+            # 4. Temp-Dateien IMMER aufräumen (auch bei Fehler, inkl. bereits
+            #    kodierter Chunks die nicht mehr hochgeladen wurden)
+            for encode_future in encode_futures:
+                if encode_future.done() and not encode_future.cancelled() \
+                        and encode_future.exception() is None:
+                    if encode_future.result() not in audio_chunks:
+                        audio_chunks.append(encode_future.result())
             if audio_chunks:
                 self._cleanup_temp_files(audio_chunks)
+            if close_plan:
+                close_plan()
+
+    def _transcribe_chunk(self, chunk_path: str, language: str) -> tuple:
+        """Transkribiert einen einzelnen Chunk, gibt (text, tokens) zurück"""
+        # Tokens vorab aus der Chunk-Länge schätzen (MP3 mit fester Bitrate)
+        estimated = int(os.path.getsize(chunk_path) / MP3_BYTES_PER_SECOND * AUDIO_TOKENS_PER_SEC)
+
+        def upload():
+            # Datei pro Versuch neu öffnen (Upload beginnt wieder bei Byte 0)
+            with open(chunk_path, "rb") as audio_file:
+                return self.client.audio.transcriptions.create(
+                    model=TRANSCRIBE_MODEL,
+                    file=audio_file,
+                    language=language,
+                    response_format="json",
+                    prompt="Audio Sessions, Transkription, Notizen"
+                )
+
+        transcript = self._request(upload, estimated)
+
+        tokens = getattr(transcript.usage, 'total_tokens', 0) if hasattr(transcript, 'usage') else 0
+        self.rate_limiter.adjust(estimated, tokens or 0)
+        return transcript.text, tokens or 0
+
+    def _request(self, call, estimated_tokens: int = 0):
+        """API-Aufruf mit Rate Limit (pro Versuch) und Retry bei vorübergehenden Fehlern"""
+        def attempt():
+            self.rate_limiter.acquire(estimated_tokens)
+            return call()
+
+        return with_retry(attempt, self.max_retries)
+
+    @staticmethod
+    def _resolve_prompt(prompt_id: str) -> Optional[dict]:
+        """Lädt den Prompt aus den Settings (Fallback: erster Prompt)"""
+        settings_manager = SettingsManager.instance()
+        prompt_obj = settings_manager.get_prompt_by_id(prompt_id)
+
+        if not prompt_obj:
+            # Fallback: Ersten Prompt verwenden
+            all_prompts = settings_manager.get_all_prompts()
+            if not all_prompts:
+                return None
+            prompt_obj = all_prompts[0]
+
+        return {**prompt_obj, 'prompt_text': prompt_obj.get('prompt_text', '')}
 
+    @staticmethod
+    def _build_requests(prompt: str, text: str, reasoning_effort: str, verbosity: str,
+                        models: Optional[list] = None) -> list:
+        """
+        Baut die Anfragen für eine Transformation (Standard: GPT-5, Fallback GPT-4o)
+
+        Returns:
+            Liste von (model, kwargs) in Versuchsreihenfolge
+        """
+        full_input = f"{prompt}\n\n{text}"
+
+        # Verbosity in Prompt einbauen
+        verbosity_suffix = {
+            "low": " Sei kurz und prägnant.",
+            "medium": " Gib eine ausgewogene Antwort.",
+            "high": " Sei ausführlich und detailliert."
+        }
+        full_input += verbosity_suffix.get(verbosity, verbosity_suffix["medium"])
+
+        # Reasoning effort auf temperature mappen (GPT-4o)
+        temperature_map = {
+            "minimal": 0.3,
+            "low": 0.5,
+            "medium": 0.7,
+            "high": 0.9
+        }
+
+        messages = [
+            {"role": "system", "content": "Du bist ein hilfreicher Assistent für Textverarbeitung."},
+            {"role": "user", "content": full_input}
+        ]
+        requests = []
+        for model in models or DEFAULT_MODELS:
+            if uses_reasoning(model):
+                # GPT-5 verwendet reasoning_effort als Parameter
+                requests.append((model, {
+                    "messages": messages,
+                    "reasoning_effort": reasoning_effort if reasoning_effort else "medium",
+                    "max_completion_tokens": 4096
+                }))
+            else:
+                requests.append((model, {
+                    "messages": messages,
+                    "temperature": temperature_map.get(reasoning_effort, 0.7),
+                    "max_tokens": 4096
+                }))
+        return requests
+
+    def _complete(self, requests: list) -> tuple:
+        """
+        Führt eine Anfrage aus, bei Fehlern mit dem nächsten Modell der Liste
+
+        Returns:
+            (text, tokens, model)
+        """
+        estimated = estimate_tokens(requests[0][1]["messages"][-1]["content"])
+        for index, (model, kwargs) in enumerate(requests):
+            try:
+                response = self._request(
+                    lambda: self.client.chat.completions.create(model=model, **kwargs),
+                    estimated
+                )
+                self.router.record_success(model)
+                break
+            except Exception as e:
+                self.router.record_failure(model, e)
+                if index == len(requests) - 1:
+                    raise
+                print(f"{model} nicht verfügbar, Fallback: {str(e)}")
+
+        tokens = response.usage.total_tokens if response.usage else 0
+        self.rate_limiter.adjust(estimated, tokens or 0)
+        return response.choices[0].message.content or "", tokens or 0, model
+
+    def _map_stage(self, text: str, cancel_event: Optional[threading.Event] = None,
+                   max_concurrency: int = MAP_CONCURRENCY):
+        """
+        Verdichtet ein langes Transkript abschnittsweise (Generator)
+
+        Abschnitte laufen parallel (höchstens max_concurrency Anfragen).
+        Zwischenergebnisse werden pro Abschnitts-Hash gecacht und sind
+        damit für jeden finalen Prompt wiederverwendbar. Passen die
+        Zwischenergebnisse noch immer nicht ins Budget, wird erneut verdichtet.
+
+        Yields:
+            {"type": "progress", "done": int, "total": int}
+
+        Returns:
+            {"text": str, "tokens": int, "sections": int, "cached": int}
+            oder None bei Abbruch
+        """
+        prompt_hash = text_hash(MAP_PROMPT)
+        tokens = 0
+        cached = 0
+        section_count = 0
+
+        while True:
+            sections = split_sections(text)
+            section_count += len(sections)
+            partials = [None] * len(sections)
+            keys = [cache_key(KIND_SECTION, text_hash(section), prompt_hash) for section in sections]
+
+            for index, key in enumerate(keys):
+                entry = self.transform_cache.get(key)
+                if entry is not None:
+                    partials[index] = entry["text"]
+                    cached += 1
+
+            missing = [index for index, partial in enumerate(partials) if partial is None]
+            done = len(sections) - len(missing)
+            print(f"📚 Map-Stufe: {len(sections)} Abschnitte, {done} aus dem Cache")
+            yield {"type": "progress", "done": done, "total": len(sections)}
+
+            def summarize(index):
+                requests = self._build_requests(MAP_PROMPT, sections[index], "low", "medium",
+                                                self.router.route(DEFAULT_MODELS))
+                return self._complete(requests)
+
+            if missing:
+                executor = ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(missing))))
+                try:
+                    futures = {executor.submit(summarize, index): index for index in missing}
+                    for future in as_completed(futures):
+                        index = futures[future]
+                        partial, used, model = future.result()
+                        partials[index] = partial
+                        tokens += used
+                        self.transform_cache.put(keys[index], KIND_SECTION, partial, model, used)
+                        done += 1
+                        yield {"type": "progress", "done": done, "total": len(sections)}
+
+                        if cancel_event is not None and cancel_event.is_set():
+                            return None
+                finally:
+                    # Bei Abbruch oder Fehler keine weiteren Abschnitte starten
+                    executor.shutdown(wait=False, cancel_futures=True)
+
+            text = join_partials(partials)
+            if len(sections) == 1 or estimate_tokens(text) <= CONTEXT_BUDGET_TOKENS:
+                break
+
+        return {"text": text, "tokens": tokens, "sections": section_count, "cached": cached}
+
+    def transform_request(self, text: str, prompt_id: str, reasoning_effort: str = "medium",
+                          verbosity: str = "low") -> Optional[dict]:
+        """
+        Request-Body einer Transformation für die Batch API (ohne Fallback)
+
+        Returns:
+            Body für /v1/chat/completions oder None (kein Prompt, Text über dem Kontext-Budget)
+        """
+        prompt = self._resolve_prompt(prompt_id)
+        if prompt is None or estimate_tokens(text) > CONTEXT_BUDGET_TOKENS:
+            return None
+
+        model, kwargs = self._build_requests(
+            prompt['prompt_text'], text, reasoning_effort, verbosity,
+            self.router.route(models_for_prompt(prompt))
+        )[0]
+        return {"model": model, **kwargs}
+
+    @staticmethod
+    def _result_key(text: str, prompt: str, model: str, reasoning_effort: str, verbosity: str) -> str:
+        """Cache-Schlüssel eines Transformations-Ergebnisses (angefragtes Modell)"""
+        return cache_key(KIND_RESULT, text_hash(text), text_hash(prompt), model,
+                         reasoning_effort, verbosity)
+
+    def _cached_result(self, key: str) -> Optional[dict]:
+        """Ergebnis aus dem Cache im Format von transform() (oder None)"""
+        entry = self.transform_cache.get(key)
+        if entry is None:
+            return None
+        print(f"📦 Transformation aus dem Cache ({entry['model']}, {entry['tokens']} Tokens gespart)")
+        return {
+            "success": True,
+            "result": entry["text"],
+            "tokens_used": 0,
+            "model": entry["model"],
+            "cached": True,
+            "cached_at": entry["created_at"],
+            "tokens_saved": entry["tokens"]
+        }
+
+    @holds_client
     def transform(
         self,
         text: str,
         prompt_id: str = "zusammenfassen",
         reasoning_effort: str = "medium",
-        verbosity: str = "low"
+        verbosity: str = "low",
+        use_cache: bool = True
     ) -> dict:
         """
         Transformiert Text mit Responses API
@@ -199,98 +713,67 @@ class AudioSessionService:
             prompt_id: ID des zu verwendenden Prompts
             reasoning_effort: "minimal" | "low" | "medium" | "high"
             verbosity: "low" | "medium" | "high"
+            use_cache: Gleiche Anfrage (Text, Prompt, Modell, Parameter) aus dem Cache beantworten
 
         Returns:
             {
                 "success": True/False,
                 "result": str,
                 "tokens_used": int,
+                "model": str,
+                "sections": int,         # nur bei Map-Reduce (langes Transkript)
+                "cached_sections": int,  # davon aus dem Cache
+                "cached": bool,          # nur bei Cache-Treffer, dazu "cached_at", "tokens_saved"
                 "error": str (nur bei success=False)
             }
         """
         if not self.client:
             return {"success": False, "error": "Kein API Key konfiguriert"}
 
-        # Prompt aus Settings laden
-        settings_manager = SettingsManager()
-        prompt_obj = settings_manager.get_prompt_by_id(prompt_id)
-
-        if not prompt_obj:
-            # Fallback: Ersten Prompt verwenden
-            all_prompts = settings_manager.get_all_prompts()
-            if all_prompts:
-                prompt_obj = all_prompts[0]
-            else:
-                return {"success": False, "error": "Keine Prompts verfügbar"}
+        prompt = self._resolve_prompt(prompt_id)
+        if prompt is None:
+            return {"success": False, "error": "Keine Prompts verfügbar"}
 
-        prompt = prompt_obj.get('prompt_text', '')
-        full_input = f"{prompt}\n\n{text}"
+        models = models_for_prompt(prompt)
+        key = self._result_key(text, prompt['prompt_text'], models[0], reasoning_effort, verbosity)
+        if use_cache:
+            cached = self._cached_result(key)
+            if cached is not None:
+                return cached
 
         try:
-            # Versuche zuerst GPT-5 mit Chat Completions
-            try:
-                # Verbosity in Prompt einbauen für GPT-5
-                verbosity_suffix = {
-                    "low": " Sei kurz und prägnant.",
-                    "medium": " Gib eine ausgewogene Antwort.",
-                    "high": " Sei ausführlich und detailliert."
-                }
-                gpt5_input = full_input + verbosity_suffix.get(verbosity, verbosity_suffix["medium"])
-
-                # GPT-5 verwendet reasoning_effort als Parameter
-                response = self.client.chat.completions.create(
-                    model="gpt-5",
-                    messages=[
-                        {"role": "system", "content": "Du bist ein hilfreicher Assistent für Textverarbeitung."},
-                        {"role": "user", "content": gpt5_input}
-                    ],
-                    reasoning_effort=reasoning_effort if reasoning_effort else "medium",
-                    max_completion_tokens=4096
-                )
-
-                output_text = response.choices[0].message.content
-                tokens = response.usage.total_tokens
-                print(f"GPT-5 erfolgreich verwendet (Reasoning: {reasoning_effort}, Tokens: {tokens})")
-
-            except Exception as gpt5_error:
-                # Fallback auf Chat Completions mit gpt-4o
-                print(f"GPT-5 nicht verfügbar, Fallback auf GPT-4o: {str(gpt5_error)}")
-
-                # Reasoning effort auf temperature mappen
-                temperature_map = {
-                    "minimal": 0.3,
-                    "low": 0.5,
-                    "medium": 0.7,
-                    "high": 0.9
-                }
-                temperature = temperature_map.get(reasoning_effort, 0.7)
-
-                # Verbosity in Prompt einbauen
-                verbosity_suffix = {
-                    "low": " Sei kurz und prägnant.",
-                    "medium": " Gib eine ausgewogene Antwort.",
-                    "high": " Sei ausführlich und detailliert."
-                }
-                full_input += verbosity_suffix.get(verbosity, verbosity_suffix["medium"])
-
-                response = self.client.chat.completions.create(
-                    model="gpt-4o",
-                    messages=[
-                        {"role": "system", "content": "Du bist ein hilfreicher Assistent für Textverarbeitung."},
-                        {"role": "user", "content": full_input}
-                    ],
-                    temperature=temperature,
-                    max_tokens=4096
-                )
-
-                output_text = response.choices[0].message.content
-                tokens = response.usage.total_tokens
+            # Lange Transkripte: zuerst abschnittsweise verdichten
+            mapped = None
+            if estimate_tokens(text) > CONTEXT_BUDGET_TOKENS:
+                stage = self._map_stage(text)
+                while True:
+                    try:
+                        next(stage)
+                    except StopIteration as stop:
+                        mapped = stop.value
+                        break
+                text = mapped["text"]
+
+            output_text, tokens, model = self._complete(
+                self._build_requests(prompt['prompt_text'], text, reasoning_effort, verbosity,
+                                     self.router.route(models))
+            )
+            print(f"{model} erfolgreich verwendet (Reasoning: {reasoning_effort}, Tokens: {tokens})")
 
-            return {
+            result = {
                 "success": True,
                 "result": output_text,
-                "tokens_used": tokens
+                "tokens_used": tokens,
+                "model": model
             }
+            if mapped:
+                result["tokens_used"] += mapped["tokens"]
+                result["sections"] = mapped["sections"]
+                result["cached_sections"] = mapped["cached"]
+            # Der Schlüssel nennt das angefragte Modell: Fallback-Ergebnisse nicht cachen
+            if model == models[0]:
+                self.transform_cache.put(key, KIND_RESULT, output_text, model, result["tokens_used"])
+            return result
 
         except RateLimitError:
             return {"success": False, "error": "Rate Limit erreicht. Bitte später erneut versuchen."}
@@ -301,73 +784,224 @@ class AudioSessionService:
         except Exception as e:
             return {"success": False, "error": f"Fehler: {str(e)}"}
 
-    def _prepare_audio_for_transcription(self, audio_file_path: str, max_mb: int = 20) -> list:
+    @holds_client
+    def transform_stream(
+        self,
+        text: str,
+        prompt_id: str = "zusammenfassen",
+        reasoning_effort: str = "medium",
+        verbosity: str = "low",
+        cancel_event: Optional[threading.Event] = None,
+        use_cache: bool = True
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Bereitet Audio für Whisper API vor
+        Transformiert Text und liefert die Antwort schrittweise
 
-        1. Konvertiert WAV → MP3 (16 kHz, 64 kbps, Mono)
-        2. Splittet in 15-Min-Chunks wenn >20 MB
+        Yields:
+            {"type": "delta", "text": str}      # neuer Text-Abschnitt
+            {"type": "done", "result": dict}    # immer als letztes Event
 
-        Args:
-            audio_file_path: Pfad zur Original-WAV-Datei
-            max_mb: Maximale Dateigröße in MB (Standard: 20)
+        Das Result-Dict entspricht transform(), zusätzlich mit
+        "ttft" (Sekunden bis zum ersten Token) und "cancelled".
+        Ein Fallback auf GPT-4o erfolgt nur, solange noch kein Text kam.
 
-        Returns:
-            Liste von Temp-MP3-Dateipfaden (1+ Chunks)
-        """
-        if IS_RASPBERRY_PI:
-            return self._prepare_audio_ffmpeg(audio_file_path, max_mb)
-        else:
-            return self._prepare_audio_pydub(audio_file_path, max_mb)
+        Bei langen Transkripten kommen vorab Events der Map-Stufe:
+            {"type": "progress", "done": int, "total": int}
 
-    def _prepare_audio_pydub(self, audio_file_path: str, max_mb: int = 20) -> list:
-        """
-        Bereitet Audio mit pydub vor (für macOS, Windows, x86 Linux)
+        Ein Cache-Treffer kommt als ein einziges Delta mit dem ganzen Text.
         """
-        # 1. WAV laden und zu MP3 konvertieren
-        audio = AudioSegment.from_wav(audio_file_path)
-        audio = audio.set_frame_rate(16000)  # Whisper-optimiert
-        audio = audio.set_channels(1)  # Mono
+        if not self.client:
+            yield {"type": "done", "result": {"success": False, "error": "Kein API Key konfiguriert"}}
+            return
 
-        # Temp-MP3 erstellen
-        temp_mp3 = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
-        audio.export(temp_mp3.name, format="mp3", bitrate="64k")
-        temp_mp3.close()
+        prompt = self._resolve_prompt(prompt_id)
+        if prompt is None:
+            yield {"type": "done", "result": {"success": False, "error": "Keine Prompts verfügbar"}}
+            return
 
-        # 2. Dateigröße prüfen
-        file_size_mb = os.path.getsize(temp_mp3.name) / (1024 * 1024)
+        models = models_for_prompt(prompt)
+        key = self._result_key(text, prompt['prompt_text'], models[0], reasoning_effort, verbosity)
+        if use_cache:
+            cached = self._cached_result(key)
+            if cached is not None:
+                yield {"type": "delta", "text": cached["result"]}
+                yield {"type": "done", "result": cached}
+                return
+
+        started = time.monotonic()
+        parts = []
+        ttft = None
+        tokens = 0
+        model = None
+        stream = None
+        mapped = None
 
-        # 3. Wenn klein genug: Direkt zurückgeben
-        if file_size_mb <= max_mb:
-            return [temp_mp3.name]
+        try:
+            # Lange Transkripte: Map-Stufe parallel, danach Reduce-Stufe gestreamt
+            if estimate_tokens(text) > CONTEXT_BUDGET_TOKENS:
+                mapped = yield from self._map_stage(text, cancel_event)
+                if mapped is None:
+                    yield {"type": "done", "result": {
+                        "success": False, "cancelled": True, "error": "Abgebrochen", "result": ""
+                    }}
+                    return
+                text = mapped["text"]
+
+            requests = self._build_requests(prompt['prompt_text'], text, reasoning_effort, verbosity,
+                                            self.router.route(models))
+            estimated = estimate_tokens(requests[0][1]["messages"][-1]["content"])
+
+            for index, (model, kwargs) in enumerate(requests):
+                try:
+                    stream = self._request(
+                        lambda: self.client.chat.completions.create(
+                            model=model, stream=True, stream_options={"include_usage": True}, **kwargs
+                        ),
+                        estimated
+                    )
+                    for chunk in stream:
+                        if cancel_event is not None and cancel_event.is_set():
+                            print(f"Transformation abgebrochen nach {len(parts)} Abschnitten")
+                            yield {"type": "done", "result": {
+                                "success": False, "cancelled": True, "error": "Abgebrochen",
+                                "result": "".join(parts), "model": model, "ttft": ttft
+                            }}
+                            return
+
+                        if chunk.usage is not None:
+                            tokens = chunk.usage.total_tokens
+                        if not chunk.choices:
+                            continue
+                        delta = chunk.choices[0].delta.content
+                        if delta:
+                            if ttft is None:
+                                ttft = time.monotonic() - started
+                                print(f"{model}: erstes Token nach {ttft:.2f}s")
+                            parts.append(delta)
+                            yield {"type": "delta", "text": delta}
+                    self.router.record_success(model)
+                    break
+
+                except Exception as e:
+                    self.router.record_failure(model, e)
+                    # Fallback nur, solange noch nichts angezeigt wurde
+                    if parts or index == len(requests) - 1:
+                        raise
+                    print(f"{model} nicht verfügbar, Fallback: {str(e)}")
+                finally:
+                    if stream is not None:
+                        stream.close()
+                        stream = None
+
+            self.rate_limiter.adjust(estimated, tokens or 0)
+            result = {
+                "success": True,
+                "result": "".join(parts),
+                "tokens_used": tokens,
+                "model": model,
+                "ttft": ttft,
+                "cancelled": False
+            }
+            if mapped:
+                result["tokens_used"] += mapped["tokens"]
+                result["sections"] = mapped["sections"]
+                result["cached_sections"] = mapped["cached"]
+            # Der Schlüssel nennt das angefragte Modell: Fallback-Ergebnisse nicht cachen
+            if model == models[0]:
+                self.transform_cache.put(key, KIND_RESULT, result["result"], model, result["tokens_used"])
+            yield {"type": "done", "result": result}
 
-        # 4. Zu groß: In 15-Min-Chunks aufteilen
-        chunk_length_ms = 15 * 60 * 1000  # 15 Minuten in Millisekunden
-        chunks = []
+        except RateLimitError:
+            yield {"type": "done", "result": {
+                "success": False, "error": "Rate Limit erreicht. Bitte später erneut versuchen."
+            }}
 
-        for i in range(0, len(audio), chunk_length_ms):
-            chunk = audio[i:i + chunk_length_ms]
+        except APIError as e:
+            yield {"type": "done", "result": {"success": False, "error": f"API Fehler: {e.message}"}}
 
-            # Temp-Datei für Chunk
-            temp_chunk = tempfile.NamedTemporaryFile(delete=False, suffix=f"_chunk_{len(chunks)}.mp3")
-            chunk.export(temp_chunk.name, format="mp3", bitrate="64k")
-            temp_chunk.close()
+        except Exception as e:
+            yield {"type": "done", "result": {"success": False, "error": f"Fehler: {str(e)}"}}
 
-            chunks.append(temp_chunk.name)
+    def _plan_audio_chunks(self, audio_file_path: str, max_mb: int = 20,
+                           concurrency: int = 1) -> tuple:
+        """
+        Plant die Chunks für die Whisper API, ohne vorab zu kodieren
 
-        # Original-Temp-MP3 löschen (nicht mehr benötigt)
-        os.unlink(temp_mp3.name)
+        Die MP3-Größe (16 kHz, 64 kbps, Mono) ist aus der Dauer vorhersagbar,
+        kodiert wird direkt aus der Original-WAV (keine zweite Kodierung der
+        ganzen Datei).
 
-        return chunks
+        WAV-Dateien werden auf allen Plattformen blockweise gemischt und
+        resampled (konstanter Speicherbedarf) und in Sprechpausen geschnitten,
+        so dass alle parallelen Uploads ausgelastet sind. Andere Formate
+        werden über einen ffmpeg-Lauf an festen Offsets segmentiert.
+
+        Args:
+            audio_file_path: Pfad zur Original-WAV-Datei
+            max_mb: Maximale Dateigröße in MB (Standard: 20)
+            concurrency: Anzahl paralleler Uploads (bestimmt die Chunk-Größe)
+
+        Returns:
+            (jobs, close): Liste von Encode-Jobs (Funktionen ohne Argumente,
+            die den Pfad einer Temp-MP3-Datei zurückgeben) in Chunk-Reihenfolge
+            und eine Aufräum-Funktion (bricht laufende Kodierung ab)
+        """
+        info = read_wav_info(audio_file_path)
+        if info is None or not is_supported(info):
+            return self._plan_chunks_ffmpeg(audio_file_path, max_mb)
+
+        ranges = plan_chunks(
+            audio_file_path, info, self._chunk_target(info["duration"], max_mb, concurrency)
+        )
+        if len(ranges) > 1:
+            print(f"📦 Erstelle {len(ranges)} Chunks (Schnitte in Sprechpausen)...")
+
+        encoder = _StreamingChunkEncoder(audio_file_path, info, ranges)
+        jobs = [lambda index=index: encoder.encode_chunk(index) for index in range(len(ranges))]
+        return jobs, encoder.close
+
+    @staticmethod
+    def _chunk_target(total_duration: float, max_mb: int, concurrency: int) -> float:
+        """Ziel-Chunkdauer: Aufnahme gleichmäßig auf die Uploads verteilen"""
+        max_by_size = max_mb * 0.95 * 1024 * 1024 / MP3_BYTES_PER_SECOND
+        longest = min(CHUNK_DURATION_SEC, max_by_size)
+
+        if concurrency <= 1 and total_duration <= max_by_size:
+            return total_duration  # Ein Chunk, ganze Datei
+
+        target = max(MIN_PARALLEL_CHUNK_SEC, total_duration / max(1, concurrency))
+        return min(target, longest)
+
+    @staticmethod
+    def _chunk_ranges(total_duration: float, max_mb: int) -> list:
+        """Berechnet (start, dauer) in Sekunden für alle Chunks"""
+        estimated_mb = total_duration * MP3_BYTES_PER_SECOND / (1024 * 1024)
+        if estimated_mb <= max_mb * 0.95:
+            return [(0.0, None)]  # Ein Chunk, ganze Datei
+
+        ranges = []
+        start_time = 0.0
+        while start_time < total_duration:
+            ranges.append((start_time, min(CHUNK_DURATION_SEC, total_duration - start_time)))
+            start_time += CHUNK_DURATION_SEC
+        return ranges
 
     def _get_audio_duration(self, audio_file_path: str) -> float:
-        """Ermittelt Audio-Dauer mit ffprobe"""
-        result = subprocess.run([
-            'ffprobe', '-v', 'error',
-            '-show_entries', 'format=duration',
-            '-of', 'default=noprint_wrappers=1:nokey=1',
-            audio_file_path
-        ], capture_output=True, text=True)
+        """Ermittelt Audio-Dauer aus dem WAV-Header (ffprobe nur als Fallback)"""
+        duration = wav_duration(audio_file_path)
+        if duration is not None:
+            return duration
+
+        try:
+            result = subprocess.run([
+                find_binary('ffprobe'), '-v', 'error',
+                '-show_entries', 'format=duration',
+                '-of', 'default=noprint_wrappers=1:nokey=1',
+                audio_file_path
+            ], capture_output=True, text=True)
+        except FileNotFoundError:
+            print("⚠️ ffprobe nicht gefunden, Dauer unbekannt")
+            return 0.0
 
         if result.returncode != 0:
             print(f"⚠️ ffprobe Warnung: {result.stderr}")
@@ -378,104 +1012,23 @@ class AudioSessionService:
         except ValueError:
             return 0.0
 
-    def _prepare_audio_ffmpeg(self, audio_file_path: str, max_mb: int = 20) -> list:
-        """
-        Bereitet Audio mit ffmpeg vor (für Raspberry Pi / Python 3.13)
+    def _plan_chunks_ffmpeg(self, audio_file_path: str, max_mb: int = 20) -> tuple:
         """
-        # Original-Dauer ermitteln für Validierung
-        original_duration = self._get_audio_duration(audio_file_path)
-        print(f"📊 Original Audio-Dauer: {original_duration:.2f} Sekunden")
-
-        # 1. WAV zu MP3 konvertieren mit ffmpeg
-        temp_mp3 = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
-        temp_mp3.close()
-
-        # ffmpeg Konvertierung: 16kHz, Mono, 64kbps
-        # -max_muxing_queue_size für Raspberry Pi Stabilität
-        result = subprocess.run([
-            'ffmpeg', '-i', audio_file_path,
-            '-ar', '16000',  # Sample rate: 16kHz
-            '-ac', '1',      # Channels: Mono
-            '-b:a', '64k',   # Bitrate: 64kbps
-            '-max_muxing_queue_size', '1024',  # Größere Buffer für USB-Audio
-            '-y',            # Overwrite output
-            temp_mp3.name
-        ], capture_output=True, text=True)
-
-        if result.returncode != 0:
-            raise Exception(f"ffmpeg Fehler: {result.stderr}")
-
-        # VALIDIERUNG: Prüfe ob konvertierte Dauer korrekt ist
-        converted_duration = self._get_audio_duration(temp_mp3.name)
-        print(f"📊 Konvertierte Audio-Dauer: {converted_duration:.2f} Sekunden")
+        Plant Chunks mit ffmpeg (für Formate die nicht blockweise gelesen werden können)
 
-        if original_duration > 0 and abs(converted_duration - original_duration) > 1.0:
-            print(f"⚠️ WARNUNG: Audio-Dauer-Verlust! Original: {original_duration:.2f}s, Konvertiert: {converted_duration:.2f}s")
-            print(f"⚠️ Differenz: {abs(converted_duration - original_duration):.2f} Sekunden verloren!")
-
-        # 2. Dateigröße prüfen
-        file_size_mb = os.path.getsize(temp_mp3.name) / (1024 * 1024)
-        print(f"📦 MP3 Dateigröße: {file_size_mb:.2f} MB")
-
-        # 3. Wenn klein genug: Direkt zurückgeben
-        if file_size_mb <= max_mb:
-            return [temp_mp3.name]
-
-        # 4. Zu groß: Audio-Dauer ermitteln und in 15-Min-Chunks aufteilen
-        print(f"📦 Datei zu groß ({file_size_mb:.2f} MB), erstelle Chunks...")
-
-        total_duration = converted_duration  # Verwende bereits ermittelte Dauer
-        chunk_duration = 15 * 60  # 15 Minuten in Sekunden
-        chunks = []
-        total_chunk_duration = 0.0
-
-        # Chunks erstellen
-        start_time = 0
-        chunk_index = 0
-        while start_time < total_duration:
-            temp_chunk = tempfile.NamedTemporaryFile(delete=False, suffix=f"_chunk_{chunk_index}.mp3")
-            temp_chunk.close()
-
-            # Berechne verbleibende Dauer für letzten Chunk
-            remaining_duration = total_duration - start_time
-            actual_chunk_duration = min(chunk_duration, remaining_duration)
-
-            print(f"📊 Erstelle Chunk {chunk_index + 1}: Start={start_time:.1f}s, Dauer={actual_chunk_duration:.1f}s")
-
-            # Chunk mit ffmpeg extrahieren
-            result = subprocess.run([
-                'ffmpeg', '-i', audio_file_path,
-                '-ss', str(start_time),      # Start time
-                '-t', str(actual_chunk_duration),   # Exakte Duration für letzten Chunk
-                '-ar', '16000',
-                '-ac', '1',
-                '-b:a', '64k',
-                '-max_muxing_queue_size', '1024',
-                '-y',
-                temp_chunk.name
-            ], capture_output=True, text=True)
-
-            if result.returncode != 0:
-                raise Exception(f"ffmpeg Chunk-Fehler: {result.stderr}")
-
-            # VALIDIERUNG: Chunk-Dauer prüfen
-            chunk_duration_actual = self._get_audio_duration(temp_chunk.name)
-            total_chunk_duration += chunk_duration_actual
-            print(f"  ✓ Chunk {chunk_index + 1} Dauer: {chunk_duration_actual:.2f}s")
-
-            chunks.append(temp_chunk.name)
-            start_time += chunk_duration
-            chunk_index += 1
-
-        # FINAL-VALIDIERUNG: Prüfe Gesamt-Chunk-Dauer
-        print(f"📊 Gesamt-Chunk-Dauer: {total_chunk_duration:.2f}s von {total_duration:.2f}s")
-        if abs(total_chunk_duration - total_duration) > 2.0:
-            print(f"⚠️ WARNUNG: Chunk-Dauer-Verlust! Erwartet: {total_duration:.2f}s, Chunks: {total_chunk_duration:.2f}s")
+        Ein einziger ffmpeg-Prozess kodiert und segmentiert die ganze Datei
+        (Segment-Muxer), die Jobs warten jeweils auf ihr fertiges Segment.
+        """
+        total_duration = self._get_audio_duration(audio_file_path)
+        print(f"📊 Original Audio-Dauer: {total_duration:.2f} Sekunden")
 
-        # Original-Temp-MP3 löschen (nicht mehr benötigt)
-        os.unlink(temp_mp3.name)
+        ranges = self._chunk_ranges(total_duration, max_mb)
+        if len(ranges) > 1:
+            print(f"📦 Aufnahme zu lang für eine Datei, erstelle {len(ranges)} Chunks...")
 
-        return chunks
+        segmenter = _FfmpegSegmenter(audio_file_path, [start for start, _ in ranges[1:]])
+        jobs = [lambda index=index: segmenter.wait_for_segment(index) for index in range(len(ranges))]
+        return jobs, segmenter.close
 
     def _cleanup_temp_files(self, file_paths: list):
         """Löscht temporäre Audio-Dateien"""
@@ -486,28 +1039,11 @@ class AudioSessionService:
             except Exception as e:
                 print(f"Warnung: Temp-Datei konnte nicht gelöscht werden: {path} - {e}")
 
-    def _load_from_cache(self, audio_file_path: str) -> Optional[dict]:
-        """Lädt Transkript aus Cache"""
-        file_hash = self._get_audio_hash(audio_file_path)
-        cache_file = self.cache_dir / f"{file_hash}.json"
-
-        if cache_file.exists():
-            with open(cache_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        return None
-
-    def _save_to_cache(self, audio_file_path: str, data: dict):
-        """Speichert Transkript im Cache"""
-        file_hash = self._get_audio_hash(audio_file_path)
-        cache_file = self.cache_dir / f"{file_hash}.json"
-
-        # success-Flag entfernen vor dem Speichern
-        cache_data = {k: v for k, v in data.items() if k != "success"}
-
-        with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump(cache_data, f, ensure_ascii=False, indent=2)
-
-    def _get_audio_hash(self, audio_file_path: str) -> str:
-        """Berechnet SHA256-Hash der Audio-Datei"""
-        with open(audio_file_path, "rb") as f:
-            return hashlib.sha256(f.read()).hexdigest()
+    def _get_audio_hash(self, audio_file_path: str) -> Optional[str]:
+        """SHA256-Hash der Audio-Datei (Index-Treffer oder blockweise berechnet)"""
+        try:
+            return self.hash_index.hash_for(audio_file_path)
+        except Exception as e:
+            # Ohne Hash wird nur der Cache übersprungen
+            print(f"Warnung: Audio-Hash konnte nicht berechnet werden: {e}")
+            return None
@@ -0,0 +1,315 @@
+"""
+Batch-Transformation: ein Prompt über viele Sessions
+
+Zwei Wege:
+- Direkt: Transformationen laufen parallel über AudioSessionService
+  (Rate Limit, Retry, Modell-Routing und Ergebnis-Cache inklusive), jedes
+  Ergebnis wird sofort als Artefakt der Session gespeichert.
+- Batch API: Die Anfragen werden als JSONL-Datei im Format der OpenAI
+  Batch API geschrieben und eingereicht (günstiger, Ergebnis innerhalb von
+  24 h). collect_batch() holt die Ergebnisse ab und speichert sie.
+"""
+import functools
+import json
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterable, List, Callable
+
+from data.repo import SessionRepository
+from data.artifacts import KIND_TRANSCRIPT, KIND_TRANSFORM
+from services.throughput import ThroughputMeter
+
+# Endpunkt und Zeitfenster für die Batch API
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+
+# Präfix der custom_id in Batch-Dateien (gefolgt von der Session-ID)
+CUSTOM_ID_PREFIX = "session-"
+
+
+def _holds_client(method):
+    """Wie api_client.holds_client(), lädt openai aber erst beim Aufruf (Modul wird beim Start importiert)"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        from services.api_client import client_in_use
+        with client_in_use(self.client):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def select_sessions(repo: SessionRepository, prompt_id: str,
+                    filters: Optional[Dict[str, Any]] = None,
+                    overwrite: bool = False) -> List[Dict[str, Any]]:
+    """
+    Sessions mit Transkript, gefiltert wie SessionRepository.list_sessions()
+
+    Sessions, die bereits ein Ergebnis für den Prompt haben, werden
+    übersprungen, außer overwrite ist gesetzt.
+    """
+    filters = dict(filters or {})
+    filters.setdefault("statuses", ["completed"])
+    sessions = repo.list_sessions(**filters)
+    if overwrite:
+        return sessions
+
+    done = repo.artifacts.session_ids_with(KIND_TRANSFORM, prompt_id)
+    return [session for session in sessions if session["id"] not in done]
+
+
+class BatchTransformer:
+    """Wendet einen Prompt auf viele Sessions an"""
+
+    def __init__(self, service, repo: Optional[SessionRepository] = None):
+        """
+        Args:
+            service: AudioSessionService (bestimmt API Key, Limits und Caches)
+            repo: Session-Repository (Standard: data/sessions.db)
+        """
+        self.service = service
+        self.repo = repo or SessionRepository()
+
+    @property
+    def client(self):
+        """OpenAI-Client des Services (None ohne API Key)"""
+        return self.service.client
+
+    def run(
+        self,
+        sessions: Iterable[Dict[str, Any]],
+        prompt_id: str,
+        reasoning_effort: str = "medium",
+        verbosity: str = "low",
+        max_workers: int = 2,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None
+    ) -> dict:
+        """
+        Transformiert die Sessions parallel und speichert jedes Ergebnis
+
+        Args:
+            sessions: Session-Dicts (z.B. aus select_sessions())
+            prompt_id: ID des Prompts
+            reasoning_effort: "minimal" | "low" | "medium" | "high"
+            verbosity: "low" | "medium" | "high"
+            max_workers: Gleichzeitige Transformationen
+            progress_callback: Callback mit ThroughputMeter.snapshot() nach jeder Session
+            is_cancelled: Callback, der True liefert wenn abgebrochen werden soll
+
+        Returns:
+            {
+                "success": True,
+                "done": int, "failed": int, "cached": int,
+                "tokens": int, "elapsed": float,
+                "cancelled": bool,
+                "errors": [(session_id, str)]
+            }
+        """
+        pending = list(sessions)
+        total = len(pending)
+        meter = ThroughputMeter()
+        meter.start()
+        errors = []
+        cached = 0
+        cancelled = False
+        running = {}
+
+        def transform(session):
+            text = self.repo.artifacts.load(session["id"], KIND_TRANSCRIPT)
+            if not text:
+                return {"success": False, "error": "Kein Transkript vorhanden"}
+            return self.service.transform(text, prompt_id, reasoning_effort, verbosity)
+
+        def report():
+            if progress_callback:
+                remaining = total - meter.jobs_done - meter.jobs_failed
+                audio = sum(session.get("duration_sec") or 0 for session in pending) + \
+                    sum(session.get("duration_sec") or 0 for session in running.values())
+                progress_callback(meter.snapshot(remaining, audio))
+
+        executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+        try:
+            while pending or running:
+                if is_cancelled and is_cancelled():
+                    cancelled = True
+                    break
+
+                while pending and len(running) < max(1, max_workers):
+                    session = pending.pop(0)
+                    running[executor.submit(transform, session)] = session
+
+                done, _ = wait(running, timeout=0.5, return_when=FIRST_COMPLETED)
+                for future in done:
+                    session = running.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = {"success": False, "error": str(e)}
+
+                    if result.get("success"):
+                        self.repo.artifacts.save(
+                            session["id"], KIND_TRANSFORM, result["result"],
+                            prompt_id=prompt_id,
+                            model=result.get("model", ""),
+                            tokens=result.get("tokens_used")
+                        )
+                        cached += 1 if result.get("cached") else 0
+                        meter.record(session.get("duration_sec") or 0, result.get("tokens_used") or 0)
+                    else:
+                        errors.append((session["id"], result.get("error", "Unbekannter Fehler")))
+                        meter.record(0, success=False)
+                        print(f"✗ Batch-Transformation Session {session['id']}: {errors[-1][1]}")
+                if done:
+                    report()
+        finally:
+            # Laufende Anfragen dürfen fertig werden, neue starten nicht
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        stats = meter.snapshot(0, 0)
+        print(f"✅ Batch-Transformation: {stats['done']} fertig ({cached} aus dem Cache), "
+              f"{stats['failed']} Fehler, {stats['elapsed']:.0f}s")
+        return {
+            "success": True,
+            "done": stats["done"],
+            "failed": stats["failed"],
+            "cached": cached,
+            "tokens": meter.tokens,
+            "elapsed": stats["elapsed"],
+            "cancelled": cancelled,
+            "errors": errors,
+        }
+
+    # ========== Batch API ==========
+
+    def build_batch_file(self, sessions: Iterable[Dict[str, Any]], prompt_id: str, output_path: str,
+                         reasoning_effort: str = "medium", verbosity: str = "low") -> dict:
+        """
+        Schreibt die Anfragen als JSONL im Format der Batch API
+
+        Pro Zeile: {"custom_id": "session-<id>", "method": "POST", "url": ..., "body": {...}}.
+        Transkripte über dem Kontext-Budget brauchen die Map-Stufe und
+        werden übersprungen (direkt mit run() verarbeiten).
+
+        Returns:
+            {"success": bool, "path": str, "requests": int, "skipped": [session_id], "error": str}
+        """
+        written = 0
+        skipped = []
+        try:
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, "w", encoding="utf-8") as f:
+                for session in sessions:
+                    text = self.repo.artifacts.load(session["id"], KIND_TRANSCRIPT)
+                    body = self.service.transform_request(text, prompt_id, reasoning_effort, verbosity) \
+                        if text else None
+                    if body is None:
+                        skipped.append(session["id"])
+                        continue
+
+                    f.write(json.dumps({
+                        "custom_id": f"{CUSTOM_ID_PREFIX}{session['id']}",
+                        "method": "POST",
+                        "url": BATCH_ENDPOINT,
+                        "body": body,
+                    }, ensure_ascii=False) + "\n")
+                    written += 1
+        except OSError as e:
+            return {"success": False, "error": str(e)}
+
+        print(f"📄 Batch-Datei: {written} Anfragen, {len(skipped)} übersprungen → {output_path}")
+        return {"success": True, "path": output_path, "requests": written, "skipped": skipped}
+
+    @_holds_client
+    def submit_batch(self, path: str, prompt_id: str) -> dict:
+        """
+        Lädt eine Batch-Datei hoch und startet den Batch
+
+        Returns:
+            {"success": bool, "batch_id": str, "status": str, "error": str}
+        """
+        client = self.client
+        if client is None:
+            return {"success": False, "error": "Kein API Key konfiguriert"}
+
+        try:
+            with open(path, "rb") as f:
+                uploaded = client.files.create(file=f, purpose="batch")
+            batch = client.batches.create(
+                input_file_id=uploaded.id,
+                endpoint=BATCH_ENDPOINT,
+                completion_window=BATCH_COMPLETION_WINDOW,
+                metadata={"prompt_id": prompt_id}
+            )
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+        print(f"📤 Batch gestartet: {batch.id} ({batch.status})")
+        return {"success": True, "batch_id": batch.id, "status": batch.status}
+
+    @_holds_client
+    def collect_batch(self, batch_id: str, prompt_id: Optional[str] = None) -> dict:
+        """
+        Holt die Ergebnisse eines Batches ab und speichert sie als Artefakte
+
+        Args:
+            batch_id: ID aus submit_batch()
+            prompt_id: Prompt-ID (Standard: aus den Metadaten des Batches)
+
+        Returns:
+            {
+                "success": bool,
+                "status": str,             # Batch-Status, z.B. "in_progress" oder "completed"
+                "saved": int, "failed": int,
+                "error": str (nur bei success=False)
+            }
+        """
+        client = self.client
+        if client is None:
+            return {"success": False, "error": "Kein API Key konfiguriert"}
+
+        try:
+            batch = client.batches.retrieve(batch_id)
+            if batch.status != "completed":
+                return {"success": True, "status": batch.status, "saved": 0, "failed": 0}
+
+            prompt_id = prompt_id or (batch.metadata or {}).get("prompt_id", "")
+            # Sind alle Anfragen fehlgeschlagen, gibt es keine Ausgabedatei
+            lines = []
+            if batch.output_file_id:
+                lines = client.files.content(batch.output_file_id).text.splitlines()
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+        saved = 0
+        failed = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            response = entry.get("response") or {}
+            body = response.get("body") or {}
+            custom_id = entry.get("custom_id", "")
+            if response.get("status_code") != 200 or not custom_id.startswith(CUSTOM_ID_PREFIX):
+                failed += 1
+                continue
+
+            self.repo.artifacts.save(
+                int(custom_id[len(CUSTOM_ID_PREFIX):]),
+                KIND_TRANSFORM,
+                body["choices"][0]["message"]["content"] or "",
+                prompt_id=prompt_id,
+                model=body.get("model", ""),
+                tokens=(body.get("usage") or {}).get("total_tokens")
+            )
+            saved += 1
+
+        # Fehlgeschlagene Anfragen stehen in einer eigenen Datei
+        if batch.error_file_id:
+            try:
+                failed += sum(
+                    1 for line in client.files.content(batch.error_file_id).text.splitlines() if line.strip()
+                )
+            except Exception as e:
+                print(f"Warnung: Fehlerdatei des Batches nicht lesbar: {e}")
+
+        print(f"📥 Batch {batch_id}: {saved} Ergebnisse gespeichert, {failed} fehlgeschlagen")
+        return {"success": True, "status": batch.status, "saved": saved, "failed": failed}
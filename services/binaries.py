@@ -0,0 +1,25 @@
+"""
+Pfade externer Programme (ffmpeg, ffprobe)
+
+In PyInstaller-Builds liegen die Programme im Bundle-Verzeichnis, ein
+systemweites ffmpeg ist dort nicht vorausgesetzt.
+"""
+import shutil
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache(maxsize=None)
+def find_binary(name: str) -> str:
+    """Findet ffmpeg/ffprobe (für PyInstaller-gebaute Apps im Bundle-Verzeichnis)"""
+    # Prüfe ob wir in einer PyInstaller-App laufen
+    if getattr(sys, 'frozen', False):
+        # In PyInstaller-App: Binaries sind im gleichen Verzeichnis wie die Executable
+        bundle_dir = Path(sys._MEIPASS) if hasattr(sys, '_MEIPASS') else Path(sys.executable).parent
+        bundled = shutil.which(name, path=str(bundle_dir))
+        if bundled:
+            return bundled
+
+    # Development-Modus: ffmpeg im PATH (sonst Fehler beim Aufruf)
+    return shutil.which(name) or name
@@ -0,0 +1,167 @@
+"""
+Chunk-Planung an Sprechpausen für lange Transkriptionen
+
+Statt an festen Offsets zu schneiden, wird um jeden nominellen Schnittpunkt
+eine Energie-Hüllkurve berechnet und in der leisesten Stelle geschnitten.
+Gelesen werden nur die Suchfenster, nicht die ganze Datei. Eine kleine
+Überlappung zwischen Chunks wird beim Zusammenführen der Texte entfernt.
+"""
+import math
+import re
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
+
+from services.resampler import decode_pcm
+
+# Fensterlänge der Energie-Hüllkurve
+ENVELOPE_WINDOW_SEC = 0.05
+
+# Glättung: gesucht wird eine Pause, nicht ein einzelnes leises Fenster
+PAUSE_SMOOTH_SEC = 0.4
+
+# Suchbereich vor und nach dem nominellen Schnittpunkt
+SEARCH_SEC = 20.0
+
+# Überlappung zwischen aufeinanderfolgenden Chunks
+OVERLAP_SEC = 2.0
+
+# Maximale Anzahl Wörter, die beim Zusammenführen als Dublette gelten
+MAX_OVERLAP_WORDS = 40
+
+_WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def read_mono_range(path: str, info: Dict[str, Any], start_sec: float,
+                    duration_sec: float) -> np.ndarray:
+    """Liest einen Zeitbereich einer WAV-Datei als Mono-float32"""
+    samplerate = info["samplerate"]
+    first = max(0, int(start_sec * samplerate))
+    last = min(info["frames"], int((start_sec + duration_sec) * samplerate))
+    if last <= first:
+        return np.zeros(0, dtype=np.float32)
+
+    with open(path, "rb") as f:
+        f.seek(info["data_offset"] + first * info["block_align"])
+        raw = f.read((last - first) * info["block_align"])
+
+    raw = raw[:len(raw) - len(raw) % info["block_align"]]
+    samples = decode_pcm(raw, info)
+    if samples.shape[1] > 1:
+        return samples @ np.full(samples.shape[1], 1.0 / samples.shape[1], dtype=np.float32)
+    return samples[:, 0]
+
+
+def energy_envelope(samples: np.ndarray, samplerate: int,
+                    window_sec: float = ENVELOPE_WINDOW_SEC) -> np.ndarray:
+    """Berechnet die RMS-Energie pro Fenster (vektorisiert, ohne Python-Schleife)"""
+    window = max(1, int(window_sec * samplerate))
+    count = len(samples) // window
+    if count == 0:
+        return np.zeros(0, dtype=np.float32)
+    frames = samples[:count * window].reshape(count, window)
+    return np.sqrt(np.einsum("ij,ij->i", frames, frames) / window)
+
+
+def find_quiet_point(path: str, info: Dict[str, Any], around_sec: float,
+                     search_sec: float, lower_sec: float, upper_sec: float) -> float:
+    """
+    Sucht die leiseste Stelle (geglättete Energie) um einen nominellen Schnittpunkt
+
+    Args:
+        around_sec: Nomineller Schnittpunkt
+        search_sec: Suchradius
+        lower_sec, upper_sec: Der Schnitt muss in diesem Bereich liegen
+
+    Returns:
+        Schnittzeitpunkt in Sekunden
+    """
+    start = max(lower_sec, around_sec - search_sec)
+    end = min(upper_sec, around_sec + search_sec)
+    if end - start < PAUSE_SMOOTH_SEC:
+        return around_sec
+
+    samples = read_mono_range(path, info, start, end - start)
+    envelope = energy_envelope(samples, info["samplerate"])
+    if len(envelope) == 0:
+        return around_sec
+
+    # Gleitender Mittelwert über die Pausenlänge
+    smooth = max(1, int(PAUSE_SMOOTH_SEC / ENVELOPE_WINDOW_SEC))
+    if len(envelope) > smooth:
+        envelope = np.convolve(envelope, np.ones(smooth) / smooth, mode="same")
+
+    # Bei gleich leisen Stellen die nächste zum nominellen Punkt bevorzugen
+    times = start + (np.arange(len(envelope)) + 0.5) * ENVELOPE_WINDOW_SEC
+    quietest = envelope.min()
+    candidates = np.flatnonzero(envelope <= quietest * 1.05 + 1e-6)
+    best = candidates[np.argmin(np.abs(times[candidates] - around_sec))]
+    return float(times[best])
+
+
+def plan_chunks(path: str, info: Dict[str, Any], target_sec: float,
+                overlap_sec: float = OVERLAP_SEC) -> List[Tuple[float, Optional[float]]]:
+    """
+    Plant Chunks mit Schnitten in Sprechpausen nahe der Zielgröße
+
+    Returns:
+        Liste von (start, dauer) in Sekunden; ab dem zweiten Chunk beginnt
+        jeder Chunk overlap_sec vor dem Schnitt. Ein einzelner Chunk hat
+        die Dauer None (ganze Datei).
+    """
+    total = info["duration"]
+    if total <= target_sec * 1.1:
+        return [(0.0, None)]
+
+    # Gleich große Chunks statt eines kleinen Rests am Ende
+    count = math.ceil(total / target_sec)
+    cuts = []
+    position = 0.0
+    for index in range(count - 1):
+        # Rest nach jedem (verschobenen) Schnitt neu aufteilen
+        length = (total - position) / (count - index)
+        cut = find_quiet_point(
+            path, info, position + length, min(SEARCH_SEC, length * 0.25),
+            lower_sec=position + length / 2, upper_sec=total
+        )
+        cuts.append(cut)
+        position = cut
+
+    bounds = [0.0] + cuts + [total]
+    ranges = []
+    for index in range(len(bounds) - 1):
+        start = bounds[index] if index == 0 else max(0.0, bounds[index] - overlap_sec)
+        ranges.append((start, bounds[index + 1] - start))
+    return ranges
+
+
+def _normalize(words: List[str]) -> List[str]:
+    """Vergleichsform von Wörtern (ohne Satzzeichen, klein)"""
+    return [" ".join(_WORD_PATTERN.findall(word.lower())) for word in words]
+
+
+def merge_transcripts(texts: List[str], max_overlap_words: int = MAX_OVERLAP_WORDS) -> str:
+    """
+    Fügt Chunk-Transkripte zusammen und entfernt doppelt transkribierte Überlappung
+
+    Gesucht wird die längste Wortfolge am Ende des bisherigen Texts, die
+    (nach bis zu zwei angeschnittenen Wörtern) am Anfang des nächsten
+    Chunks wiederkehrt.
+    """
+    merged: List[str] = []
+    for text in texts:
+        words = (text or "").split()
+        if merged and words:
+            tail = _normalize(merged[-max_overlap_words:])
+            head = _normalize(words[:max_overlap_words + 2])
+            for length in range(min(len(tail), len(head)), 1, -1):
+                match = next(
+                    (skip for skip in range(0, 3)
+                     if skip + length <= len(head) and tail[-length:] == head[skip:skip + length]),
+                    None
+                )
+                if match is not None:
+                    words = words[match + length:]
+                    break
+        merged.extend(words)
+    return " ".join(merged)
@@ -0,0 +1,203 @@
+"""
+Export-Service für Sessions (CSV, JSONL, Parquet)
+
+Liest Sessions blockweise über SessionRepository.iter_sessions() und schreibt
+sie inkrementell, damit auch sehr große Datenbanken mit konstantem
+Speicherbedarf exportiert werden können.
+"""
+import csv
+import importlib.util
+import json
+import os
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterable, List, Callable
+
+from data.repo import SessionRepository, EXPORT_COLUMNS
+
+FORMAT_CSV = "csv"
+FORMAT_JSONL = "jsonl"
+FORMAT_PARQUET = "parquet"
+
+# Spaltentypen für das Parquet-Schema
+_INTEGER_COLUMNS = {"id", "duration_sec", "samplerate", "channels", "transcript_tokens", "file_size"}
+
+
+def parquet_available() -> bool:
+    """
+    Gibt zurück ob Parquet-Export möglich ist (pyarrow installiert)
+
+    Prüft nur, ob das Paket gefunden wird; importiert wird pyarrow erst beim
+    Export (der Import kostet beim App-Start spürbar Zeit).
+    """
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def available_formats() -> List[str]:
+    """Gibt alle verfügbaren Export-Formate zurück"""
+    formats = [FORMAT_CSV, FORMAT_JSONL]
+    if parquet_available():
+        formats.append(FORMAT_PARQUET)
+    return formats
+
+
+def format_from_path(output_path: str) -> str:
+    """Ermittelt das Export-Format anhand der Dateiendung"""
+    suffix = Path(output_path).suffix.lower()
+    if suffix in (".jsonl", ".ndjson"):
+        return FORMAT_JSONL
+    if suffix == ".parquet":
+        return FORMAT_PARQUET
+    return FORMAT_CSV
+
+
+class _CsvWriter:
+    """Schreibt Blöcke als CSV"""
+
+    def __init__(self, output_path: str, columns: List[str]):
+        self.file = open(output_path, 'w', newline='', encoding='utf-8')
+        self.writer = csv.DictWriter(self.file, fieldnames=columns)
+        self.writer.writeheader()
+
+    def write_batch(self, batch: List[Dict[str, Any]]):
+        self.writer.writerows(batch)
+
+    def close(self):
+        self.file.close()
+
+
+class _JsonlWriter:
+    """Schreibt Blöcke als JSON Lines (ein Objekt pro Zeile)"""
+
+    def __init__(self, output_path: str, columns: List[str]):
+        self.file = open(output_path, 'w', encoding='utf-8')
+
+    def write_batch(self, batch: List[Dict[str, Any]]):
+        self.file.writelines(json.dumps(row, ensure_ascii=False) + "\n" for row in batch)
+
+    def close(self):
+        self.file.close()
+
+
+class _ParquetWriter:
+    """Schreibt Blöcke als Row-Groups in eine Parquet-Datei"""
+
+    def __init__(self, output_path: str, columns: List[str]):
+        # Parquet nur wenn pyarrow installiert ist (optionale Abhängigkeit)
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Parquet-Export benötigt pyarrow (pip install pyarrow)")
+
+        self.pa = pa
+        self.schema = pa.schema([
+            (col, pa.int64() if col in _INTEGER_COLUMNS else pa.string())
+            for col in columns
+        ])
+        self.writer = pq.ParquetWriter(output_path, self.schema)
+
+    def write_batch(self, batch: List[Dict[str, Any]]):
+        table = self.pa.Table.from_pylist(batch, schema=self.schema)
+        self.writer.write_table(table)
+
+    def close(self):
+        self.writer.close()
+
+
+_WRITERS = {
+    FORMAT_CSV: _CsvWriter,
+    FORMAT_JSONL: _JsonlWriter,
+    FORMAT_PARQUET: _ParquetWriter,
+}
+
+
+class SessionExporter:
+    """Exportiert Sessions blockweise in CSV, JSONL oder Parquet"""
+
+    def __init__(self, repo: Optional[SessionRepository] = None):
+        self.repo = repo or SessionRepository()
+
+    def export(
+        self,
+        output_path: str,
+        fmt: Optional[str] = None,
+        columns: Optional[Iterable[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 500,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None
+    ) -> dict:
+        """
+        Exportiert Sessions in eine Datei
+
+        Args:
+            output_path: Zieldatei
+            fmt: "csv" | "jsonl" | "parquet" (None = anhand der Dateiendung)
+            columns: Zu exportierende Spalten aus EXPORT_COLUMNS (None = alle)
+            filters: Filter wie bei SessionRepository.list_sessions()
+            batch_size: Anzahl Zeilen pro Block
+            progress_callback: Callback (exportierte_zeilen, gesamt_zeilen)
+            is_cancelled: Callback, der True liefert wenn abgebrochen werden soll
+
+        Returns:
+            {
+                "success": True/False,
+                "rows": int,
+                "cancelled": bool,
+                "path": str,
+                "error": str (nur bei success=False)
+            }
+        """
+        fmt = fmt or format_from_path(output_path)
+        if fmt not in _WRITERS:
+            return {"success": False, "error": f"Unbekanntes Export-Format: {fmt}"}
+
+        columns = list(columns) if columns else list(EXPORT_COLUMNS)
+        filters = filters or {}
+
+        try:
+            total = self.repo.count_sessions(**filters)
+            writer = _WRITERS[fmt](output_path, columns)
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+        rows = 0
+        cancelled = False
+
+        try:
+            for batch in self.repo.iter_sessions(columns, batch_size, **filters):
+                if is_cancelled and is_cancelled():
+                    cancelled = True
+                    break
+
+                writer.write_batch(batch)
+                rows += len(batch)
+
+                if progress_callback:
+                    progress_callback(rows, total)
+
+        except Exception as e:
+            writer.close()
+            self._remove_partial(output_path)
+            return {"success": False, "error": str(e)}
+
+        writer.close()
+
+        # Abgebrochene Exporte hinterlassen keine halbe Datei
+        if cancelled:
+            self._remove_partial(output_path)
+
+        return {
+            "success": True,
+            "rows": rows,
+            "cancelled": cancelled,
+            "path": output_path
+        }
+
+    def _remove_partial(self, output_path: str):
+        """Löscht eine unvollständige Export-Datei"""
+        try:
+            if os.path.exists(output_path):
+                os.unlink(output_path)
+        except OSError as e:
+            print(f"Warnung: Export-Datei konnte nicht gelöscht werden: {output_path} - {e}")
@@ -0,0 +1,208 @@
+"""
+Bulk-Import bestehender Audio-Archive (WAV, MP3, ...)
+
+Durchsucht Verzeichnisse, ermittelt Metadaten und Content-Hash parallel in
+einem Prozess-Pool und legt Sessions blockweise in einer Transaktion an.
+Dateien mit bekanntem Pfad oder Hash werden übersprungen, dadurch kann ein
+abgebrochener Import einfach erneut gestartet werden.
+"""
+import json
+import os
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Callable
+
+from data.repo import SessionRepository
+from data.audio_hashes import hash_file
+from services.binaries import find_binary
+
+# Unterstützte Audio-Formate
+AUDIO_EXTENSIONS = {".wav", ".mp3", ".flac", ".ogg", ".m4a", ".aac"}
+
+
+def scan_audio_files(directories: Iterable[str]) -> Iterator[Path]:
+    """Findet rekursiv alle Audio-Dateien in den Verzeichnissen"""
+    for directory in directories:
+        for root, _dirs, files in os.walk(directory):
+            for name in sorted(files):
+                if Path(name).suffix.lower() in AUDIO_EXTENSIONS:
+                    yield Path(root, name).resolve()
+
+
+def _probe_with_ffprobe(path: str) -> Dict[str, Any]:
+    """Ermittelt Dauer, Sample Rate und Kanäle mit ffprobe (Fallback, z.B. MP3)"""
+    result = subprocess.run([
+        find_binary('ffprobe'), '-v', 'error',
+        '-select_streams', 'a:0',
+        '-show_entries', 'stream=sample_rate,channels:format=duration',
+        '-of', 'json',
+        path
+    ], capture_output=True, text=True)
+
+    if result.returncode != 0:
+        raise RuntimeError(f"ffprobe Fehler: {result.stderr.strip()}")
+
+    info = json.loads(result.stdout or "{}")
+    stream = (info.get("streams") or [{}])[0]
+    return {
+        "duration": float(info.get("format", {}).get("duration") or 0.0),
+        "samplerate": int(stream.get("sample_rate") or 0),
+        "channels": int(stream.get("channels") or 0),
+    }
+
+
+def probe_audio_file(path: str) -> Dict[str, Any]:
+    """
+    Ermittelt Metadaten und Content-Hash einer Audio-Datei (läuft im Prozess-Pool)
+
+    Returns:
+        {
+            "success": True/False,
+            "path": str,
+            "title": str,
+            "recorded_at": str,
+            "duration_sec": int,
+            "samplerate": int,
+            "channels": int,
+            "content_hash": str,
+            "error": str (nur bei success=False)
+        }
+    """
+    try:
+        stat = os.stat(path)
+
+        try:
+            import soundfile as sf
+            info = sf.info(path)
+            meta = {
+                "duration": info.duration,
+                "samplerate": info.samplerate,
+                "channels": info.channels,
+            }
+        except Exception:
+            # Formate die libsndfile nicht lesen kann
+            meta = _probe_with_ffprobe(path)
+
+        return {
+            "success": True,
+            "path": path,
+            "title": Path(path).stem,
+            "recorded_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            "duration_sec": int(meta["duration"]),
+            "samplerate": meta["samplerate"] or 44100,
+            "channels": meta["channels"] or 1,
+            "content_hash": hash_file(path),
+        }
+    except Exception as e:
+        return {"success": False, "path": path, "error": str(e)}
+
+
+class ArchiveImporter:
+    """Importiert Audio-Archive als Sessions"""
+
+    def __init__(self, repo: Optional[SessionRepository] = None,
+                 max_workers: Optional[int] = None, batch_size: int = 200):
+        """
+        Args:
+            repo: SessionRepository (Standard: data/sessions.db)
+            max_workers: Anzahl Prozesse für Metadaten + Hash (None = CPU-Anzahl)
+            batch_size: Anzahl Sessions pro Transaktion
+        """
+        self.repo = repo or SessionRepository()
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+
+    def run(
+        self,
+        directories: Iterable[str],
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None
+    ) -> dict:
+        """
+        Importiert alle Audio-Dateien aus den Verzeichnissen
+
+        Args:
+            directories: Zu durchsuchende Verzeichnisse
+            progress_callback: Callback (verarbeitete_dateien, gesamt_dateien)
+            is_cancelled: Callback, der True liefert wenn abgebrochen werden soll
+
+        Returns:
+            {
+                "success": True,
+                "total": int,        # gefundene Dateien
+                "imported": int,     # neu angelegte Sessions
+                "skipped": int,      # Pfad bereits importiert
+                "duplicates": int,   # gleicher Inhalt bereits vorhanden
+                "failed": int,       # nicht lesbare Dateien
+                "cancelled": bool,
+                "errors": list
+            }
+        """
+        files = [str(path) for path in scan_audio_files(directories)]
+
+        # Bereits importierte Pfade gar nicht erst hashen (fortsetzbar)
+        known_paths = self.repo.get_existing_paths()
+        pending = [path for path in files if path not in known_paths]
+
+        stats = {
+            "success": True,
+            "total": len(files),
+            "imported": 0,
+            "skipped": len(files) - len(pending),
+            "duplicates": 0,
+            "failed": 0,
+            "cancelled": False,
+            "errors": [],
+        }
+
+        if not pending:
+            return stats
+
+        processed = stats["skipped"]
+        seen_hashes = set()
+        batch: List[Dict[str, Any]] = []
+
+        executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        try:
+            for result in executor.map(probe_audio_file, pending, chunksize=4):
+                if is_cancelled and is_cancelled():
+                    stats["cancelled"] = True
+                    break
+
+                processed += 1
+
+                if not result["success"]:
+                    stats["failed"] += 1
+                    stats["errors"].append(f"{result['path']}: {result['error']}")
+                elif result["content_hash"] in seen_hashes:
+                    stats["duplicates"] += 1
+                else:
+                    seen_hashes.add(result["content_hash"])
+                    batch.append(result)
+
+                if len(batch) >= self.batch_size:
+                    self._flush(batch, stats)
+                    batch = []
+
+                if progress_callback:
+                    progress_callback(processed, stats["total"])
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        # Letzten (auch abgebrochenen) Block noch speichern
+        self._flush(batch, stats)
+        return stats
+
+    def _flush(self, batch: List[Dict[str, Any]], stats: dict):
+        """Speichert einen Block neuer Sessions in einer Transaktion"""
+        if not batch:
+            return
+
+        # Dubletten gegen bereits importierte Inhalte
+        existing = self.repo.get_existing_hashes(item["content_hash"] for item in batch)
+        new_sessions = [item for item in batch if item["content_hash"] not in existing]
+        stats["duplicates"] += len(batch) - len(new_sessions)
+
+        stats["imported"] += self.repo.create_many(new_sessions)
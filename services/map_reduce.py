@@ -0,0 +1,110 @@
+"""
+Abschnittsweise Verarbeitung langer Transkripte (Map-Reduce)
+
+Transkripte über dem Kontext-Budget werden in Abschnitte mit begrenzter
+Token-Zahl geteilt. Jeder Abschnitt wird mit einem festen Map-Prompt
+verdichtet (unabhängig vom gewählten Prompt, damit die Ergebnisse für
+jeden finalen Prompt wiederverwendbar sind). Der gewählte Prompt läuft
+anschließend einmal über die zusammengeführten Zwischenergebnisse.
+"""
+import re
+from typing import List
+
+try:
+    import tiktoken
+    _ENCODING = tiktoken.get_encoding("o200k_base")
+except ImportError:
+    _ENCODING = None
+
+# Ab dieser Größe (Tokens) wird abschnittsweise verarbeitet
+CONTEXT_BUDGET_TOKENS = 24000
+
+# Zielgröße eines Abschnitts (Tokens)
+SECTION_TOKENS = 8000
+
+# Gleichzeitige Anfragen in der Map-Stufe
+MAP_CONCURRENCY = 4
+
+# Map-Prompt: verdichtet ohne Informationsverlust für beliebige Folge-Prompts
+MAP_PROMPT = (
+    "Das Folgende ist ein Abschnitt eines längeren Transkripts. Fasse ihn so "
+    "zusammen, dass er als Grundlage für eine spätere Gesamtauswertung dient. "
+    "Behalte alle Fakten, Namen, Zahlen, Entscheidungen, offenen Fragen und "
+    "Aufgaben (mit Verantwortlichen) bei. Keine Einleitung, keine Bewertung."
+)
+
+# Einleitung für die Reduce-Stufe
+REDUCE_HEADER = (
+    "Hinweis: Das Transkript war zu lang für eine Anfrage. Es folgen "
+    "Zusammenfassungen seiner Abschnitte in zeitlicher Reihenfolge."
+)
+
+_PARAGRAPH_PATTERN = re.compile(r"\n\s*\n")
+_SENTENCE_PATTERN = re.compile(r"(?<=[.!?…])\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Token-Anzahl (tiktoken falls installiert, sonst ~4 Zeichen pro Token)"""
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text, disallowed_special=()))
+    return len(text) // 4 + 1
+
+
+def _pieces(text: str, max_tokens: int) -> List[str]:
+    """Zerlegt Text in Absätze, zu lange Absätze in Sätze bzw. Wortgruppen"""
+    pieces = []
+    for paragraph in _PARAGRAPH_PATTERN.split(text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if estimate_tokens(paragraph) <= max_tokens:
+            pieces.append(paragraph)
+            continue
+
+        for sentence in _SENTENCE_PATTERN.split(paragraph):
+            if estimate_tokens(sentence) <= max_tokens:
+                pieces.append(sentence)
+                continue
+            # Transkripte ohne Satzzeichen: nach Wörtern teilen
+            words = sentence.split()
+            step = max(1, len(words) * max_tokens // estimate_tokens(sentence))
+            pieces.extend(" ".join(words[i:i + step]) for i in range(0, len(words), step))
+    return pieces
+
+
+def split_sections(text: str, max_tokens: int = SECTION_TOKENS) -> List[str]:
+    """
+    Teilt Text in Abschnitte von höchstens max_tokens (an Absatz- und Satzgrenzen)
+
+    Die Abschnitte werden gleichmäßig gefüllt, damit der letzte nicht winzig ist.
+    """
+    total = estimate_tokens(text)
+    if total <= max_tokens:
+        return [text.strip()] if text.strip() else []
+
+    count = -(-total // max_tokens)
+    target = total / count
+
+    sections = []
+    current: List[str] = []
+    current_tokens = 0
+    for piece in _pieces(text, max_tokens):
+        tokens = estimate_tokens(piece)
+        if current and (current_tokens + tokens > max_tokens or current_tokens >= target):
+            sections.append(" ".join(current))
+            current, current_tokens = [], 0
+        current.append(piece)
+        current_tokens += tokens
+
+    if current:
+        sections.append(" ".join(current))
+    return sections
+
+
+def join_partials(partials: List[str]) -> str:
+    """Fügt Zwischenergebnisse für die Reduce-Stufe zusammen"""
+    body = "\n\n".join(
+        f"[Abschnitt {index}/{len(partials)}]\n{partial.strip()}"
+        for index, partial in enumerate(partials, start=1)
+    )
+    return f"{REDUCE_HEADER}\n\n{body}"
@@ -0,0 +1,194 @@
+"""
+Modell-Routing für Transformationen
+
+Merkt sich pro API Key, welche Modelle verfügbar sind (Prüfung über den
+Models-Endpunkt, Ergebnis mit TTL gecacht), damit Anfragen direkt an ein
+funktionierendes Modell gehen statt jedes Mal erst am Fallback zu scheitern.
+Ein Circuit Breaker sperrt ein Modell nach mehreren Fehlern in Folge für
+eine Weile; danach bekommt genau ein Aufrufer einen Probeversuch (half-open),
+alle anderen überspringen das Modell, bis der Versuch verbucht ist.
+"""
+import threading
+import time
+from typing import Dict, List, Optional
+
+# Modellkette ohne Vorgabe im Prompt (bevorzugt, Fallback)
+DEFAULT_MODELS = ["gpt-5", "gpt-4o"]
+
+# Auswahl im Prompt-Editor ("" = automatisch, DEFAULT_MODELS)
+MODEL_AUTO = ""
+MODEL_CHOICES = [MODEL_AUTO, "gpt-5", "gpt-5-mini", "gpt-4o", "gpt-4o-mini"]
+
+# Gültigkeit eines Verfügbarkeits-Ergebnisses (Sekunden)
+AVAILABILITY_TTL_SEC = 6 * 3600
+
+# Circuit Breaker: Fehler in Folge bis zur Sperre, Dauer der Sperre (Sekunden)
+FAILURE_THRESHOLD = 3
+OPEN_SEC = 120.0
+
+# Wird ein Probeversuch nie verbucht (Fallback nicht gebraucht, Abbruch),
+# darf nach dieser Zeit der nächste Aufrufer proben (Sekunden)
+TRIAL_TIMEOUT_SEC = 300.0
+
+# HTTP-Status, die bedeuten, dass ein Modell für diesen Key nicht verfügbar ist
+# (NotFoundError, PermissionDeniedError). Über den Status statt die Klassen
+# geprüft, damit der Prompt-Editor ohne das openai-Paket importierbar bleibt.
+UNAVAILABLE_STATUS = (404, 403)
+
+
+def models_for_prompt(prompt: Optional[dict]) -> List[str]:
+    """Modellkette eines Prompts (festes Modell ohne Fallback oder DEFAULT_MODELS)"""
+    model = (prompt or {}).get("model") or MODEL_AUTO
+    return [model] if model != MODEL_AUTO else list(DEFAULT_MODELS)
+
+
+def uses_reasoning(model: str) -> bool:
+    """True für Reasoning-Modelle (reasoning_effort statt temperature)"""
+    return model.startswith(("gpt-5", "o1", "o3", "o4"))
+
+
+def _is_unavailable(error: Exception) -> bool:
+    """True wenn der API-Fehler bedeutet, dass das Modell nicht verfügbar ist"""
+    return getattr(error, "status_code", None) in UNAVAILABLE_STATUS
+
+
+class _ModelState:
+    """Verfügbarkeit und Breaker-Zustand eines Modells"""
+
+    def __init__(self):
+        self.available: Optional[bool] = None   # None = unbekannt
+        self.checked_at = 0.0                   # letzte Prüfung oder Beobachtung
+        self.failures = 0
+        self.open_until = 0.0
+        self.half_open = False                  # Probeversuch vergeben
+        self.trial_until = 0.0                  # ...bis zu diesem Zeitpunkt
+
+
+class ModelRouter:
+    """Wählt die Reihenfolge der Modelle anhand Verfügbarkeit und Circuit Breaker"""
+
+    def __init__(self, client=None, ttl: float = AVAILABILITY_TTL_SEC,
+                 failure_threshold: int = FAILURE_THRESHOLD, open_sec: float = OPEN_SEC):
+        """
+        Args:
+            client: OpenAI-Client für die Verfügbarkeitsprüfung (None = keine Prüfung)
+            ttl: Gültigkeit eines Prüfergebnisses in Sekunden
+            failure_threshold: Fehler in Folge, nach denen ein Modell gesperrt wird
+            open_sec: Dauer der Sperre in Sekunden
+        """
+        self.client = client
+        self.ttl = ttl
+        self.failure_threshold = failure_threshold
+        self.open_sec = open_sec
+        self._states: Dict[str, _ModelState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, model: str) -> _ModelState:
+        state = self._states.get(model)
+        if state is None:
+            state = self._states[model] = _ModelState()
+        return state
+
+    def _probe(self, model: str):
+        """Prüft einmal pro TTL über den Models-Endpunkt, ob das Modell verfügbar ist"""
+        with self._lock:
+            state = self._state(model)
+            now = time.monotonic()
+            if state.checked_at and now - state.checked_at < self.ttl:
+                return
+            # Auch ein ergebnisloser Versuch gilt für die TTL (keine Prüfung pro Anfrage)
+            state.checked_at = now
+
+        try:
+            self.client.models.retrieve(model)
+            available = True
+        except Exception as e:
+            if not _is_unavailable(e):
+                # Prüfung nicht möglich (Netz, kompatibler Endpunkt ohne /models): nicht sperren
+                print(f"Modell-Prüfung für {model} nicht möglich: {e}")
+                return
+            available = False
+
+        self._mark(model, available)
+
+    def _mark(self, model: str, available: bool):
+        with self._lock:
+            state = self._state(model)
+            if state.available != available:
+                print(f"🔀 Modell {model} {'verfügbar' if available else 'nicht verfügbar'}")
+            state.available = available
+            state.checked_at = time.monotonic()
+
+    def route(self, models: List[str]) -> List[str]:
+        """
+        Gibt die nutzbaren Modelle in Versuchsreihenfolge zurück
+
+        Nicht verfügbare und gesperrte Modelle fallen weg. Ist die Sperre
+        abgelaufen, bekommt nur der erste Aufrufer das Modell (Probeversuch),
+        bis record_success() oder record_failure() ihn auflöst. Bleibt keines
+        übrig, wird das letzte Modell trotzdem versucht (damit der Fehler
+        beim Aufrufer ankommt statt einer leeren Liste).
+        """
+        if self.client is not None:
+            for model in models:
+                self._probe(model)
+
+        now = time.monotonic()
+        usable = []
+        with self._lock:
+            for model in models:
+                state = self._state(model)
+                if state.available is False and now - state.checked_at < self.ttl:
+                    continue
+                if state.open_until > now:
+                    continue
+                if state.open_until:
+                    # Sperre abgelaufen, aber noch nicht aufgelöst: half-open
+                    if state.half_open and state.trial_until > now:
+                        continue
+                    state.half_open = True
+                    state.trial_until = now + TRIAL_TIMEOUT_SEC
+                usable.append(model)
+
+        return usable or models[-1:]
+
+    def record_success(self, model: str):
+        """Verbucht eine erfolgreiche Anfrage (schließt den Breaker)"""
+        with self._lock:
+            state = self._state(model)
+            state.failures = 0
+            state.open_until = 0.0
+            state.half_open = False
+            state.available = True
+            state.checked_at = time.monotonic()
+
+    def record_failure(self, model: str, error: Exception):
+        """Verbucht eine fehlgeschlagene Anfrage"""
+        with self._lock:
+            state = self._state(model)
+            state.half_open = False
+        if _is_unavailable(error):
+            self._mark(model, False)
+            return
+
+        with self._lock:
+            state = self._state(model)
+            state.failures += 1
+            # Im half-open-Zustand reicht ein Fehler für eine erneute Sperre
+            if state.failures >= self.failure_threshold:
+                state.open_until = time.monotonic() + self.open_sec
+                print(f"⚡ Modell {model} nach {state.failures} Fehlern für {self.open_sec:.0f}s gesperrt")
+
+    def status(self) -> Dict[str, dict]:
+        """Aktueller Zustand aller bekannten Modelle (für Diagnose)"""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                model: {
+                    "available": state.available,
+                    "failures": state.failures,
+                    "open": state.open_until > now,
+                    "half_open": state.half_open,
+                }
+                for model, state in self._states.items()
+            }
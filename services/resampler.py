@@ -0,0 +1,165 @@
+"""
+Blockweises Downmix und Resampling mit NumPy (Polyphasen-FIR)
+
+Ersetzt pydub's AudioSegment (lädt die ganze Datei und kopiert sie bei
+jedem Schritt). Hier werden WAV-Daten in festen Blöcken gelesen, auf Mono
+gemischt und mit konstantem Speicherbedarf auf die Zielrate gebracht.
+"""
+from math import gcd
+from typing import Iterator, Dict, Any
+
+import numpy as np
+
+from services.wav_info import WAVE_FORMAT_PCM, WAVE_FORMAT_IEEE_FLOAT
+
+# Filter-Halblänge in Nulldurchgängen der niedrigeren Rate
+FILTER_ZERO_CROSSINGS = 10
+KAISER_BETA = 5.0
+
+
+def is_supported(info: Dict[str, Any]) -> bool:
+    """Prüft ob iter_wav_blocks() das Sample-Format dekodieren kann"""
+    if info["format"] == WAVE_FORMAT_PCM:
+        return info["bits_per_sample"] in (8, 16, 24, 32)
+    if info["format"] == WAVE_FORMAT_IEEE_FLOAT:
+        return info["bits_per_sample"] in (32, 64)
+    return False
+
+
+def decode_pcm(raw: bytes, info: Dict[str, Any]) -> np.ndarray:
+    """Dekodiert rohe WAV-Sample-Daten zu float32 (frames, channels) im Bereich [-1, 1]"""
+    bits = info["bits_per_sample"]
+    channels = info["channels"]
+
+    if info["format"] == WAVE_FORMAT_IEEE_FLOAT:
+        samples = np.frombuffer(raw, dtype="<f4" if bits == 32 else "<f8").astype(np.float32)
+    elif bits == 8:
+        # 8-bit PCM ist vorzeichenlos
+        samples = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif bits == 16:
+        samples = np.frombuffer(raw, dtype="<i2").astype(np.float32) / 32768.0
+    elif bits == 24:
+        packed = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        values = packed[:, 0] | (packed[:, 1] << 8) | (packed[:, 2] << 16)
+        values = np.where(values & 0x800000, values - 0x1000000, values)
+        samples = values.astype(np.float32) / 8388608.0
+    else:
+        samples = np.frombuffer(raw, dtype="<i4").astype(np.float32) / 2147483648.0
+
+    return samples.reshape(-1, channels)
+
+
+def iter_wav_blocks(path: str, info: Dict[str, Any], block_frames: int = 65536) -> Iterator[np.ndarray]:
+    """Liest die Sample-Daten blockweise als Mono-float32 (Downmix über alle Kanäle)"""
+    block_bytes = block_frames * info["block_align"]
+    remaining = info["data_size"]
+
+    with open(path, "rb") as f:
+        f.seek(info["data_offset"])
+        while remaining > 0:
+            raw = f.read(min(block_bytes, remaining))
+            if not raw:
+                break
+            remaining -= len(raw)
+            # Unvollständigen letzten Frame verwerfen
+            raw = raw[:len(raw) - len(raw) % info["block_align"]]
+            samples = decode_pcm(raw, info)
+            if samples.shape[1] > 1:
+                # Matrixprodukt ist deutlich schneller als mean(axis=1)
+                yield samples @ np.full(samples.shape[1], 1.0 / samples.shape[1], dtype=np.float32)
+            else:
+                yield samples[:, 0]
+
+
+def to_int16(samples: np.ndarray) -> bytes:
+    """Konvertiert float32 [-1, 1] zu 16-bit PCM (little endian)"""
+    return (np.clip(samples, -1.0, 1.0) * 32767.0).astype("<i2").tobytes()
+
+
+class StreamingResampler:
+    """
+    Rationales Resampling (L/M) mit Polyphasen-FIR und Zustand zwischen Blöcken
+
+    Ausgabe n entspricht Eingabeposition n * M / L. Der Filter ist ein
+    Kaiser-gefenstertes sinc mit Grenzfrequenz der niedrigeren Rate, die
+    Gruppenlaufzeit wird kompensiert (Ausgabe beginnt bei t=0).
+    """
+
+    def __init__(self, in_rate: int, out_rate: int):
+        divisor = gcd(in_rate, out_rate)
+        self.up = out_rate // divisor
+        self.down = in_rate // divisor
+        self.passthrough = self.up == self.down
+
+        if not self.passthrough:
+            max_rate = max(self.up, self.down)
+            self.half_len = FILTER_ZERO_CROSSINGS * max_rate
+            n = np.arange(-self.half_len, self.half_len + 1)
+            h = np.sinc(n / max_rate) / max_rate
+            h *= np.kaiser(len(h), KAISER_BETA) * self.up
+
+            # Polyphasen-Matrix: Zeile p enthält h[p + i*L], umgekehrt für das Skalarprodukt
+            self.taps = -(-len(h) // self.up)
+            padded = np.zeros(self.taps * self.up)
+            padded[:len(h)] = h
+            self.phases = padded.reshape(self.taps, self.up).T[:, ::-1].astype(np.float32).copy()
+
+        # Eingabepuffer mit absoluter Startposition (negative Indizes = Stille)
+        self._buffer = np.zeros(self.taps - 1 if not self.passthrough else 0, dtype=np.float32)
+        self._buffer_start = -len(self._buffer)
+        self._consumed = 0      # Anzahl bisher gelieferter Eingabe-Samples
+        self._next_output = 0   # Index der nächsten Ausgabe
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Verarbeitet einen Block und gibt alle bereits berechenbaren Ausgaben zurück"""
+        samples = np.asarray(samples, dtype=np.float32)
+        self._consumed += len(samples)
+        if self.passthrough:
+            return samples
+
+        self._buffer = np.concatenate([self._buffer, samples])
+        return self._emit(self._buffer_start + len(self._buffer))
+
+    def flush(self) -> np.ndarray:
+        """Liefert die restlichen Ausgaben am Ende des Streams"""
+        if self.passthrough:
+            return np.zeros(0, dtype=np.float32)
+
+        # Stille anhängen, damit der Filter ausklingen kann
+        tail = np.zeros(self.taps + self.half_len // self.up + 1, dtype=np.float32)
+        self._buffer = np.concatenate([self._buffer, tail])
+        total = -(-self._consumed * self.up // self.down)
+        return self._emit(self._buffer_start + len(self._buffer), limit=total)
+
+    def _emit(self, available_end: int, limit: int = None) -> np.ndarray:
+        """Berechnet Ausgaben, deren Filterfenster vollständig im Puffer liegt"""
+        # Letzte berechenbare Ausgabe: j0 = (n*M + half_len) // L < available_end
+        last = ((available_end * self.up - 1 - self.half_len) // self.down) + 1
+        if limit is not None:
+            last = min(last, limit)
+        if last <= self._next_output:
+            return np.zeros(0, dtype=np.float32)
+
+        count = last - self._next_output
+        result = np.empty(count, dtype=np.float32)
+        windows = np.lib.stride_tricks.sliding_window_view(self._buffer, self.taps)
+
+        # Ausgaben n, n+L, n+2L, ... haben dieselbe Phase und liegen M Eingaben
+        # auseinander: pro Phase ein Matrix-Vektor-Produkt auf einer Strided-View
+        for offset in range(min(self.up, count)):
+            position = (self._next_output + offset) * self.down + self.half_len
+            start = position // self.up - (self.taps - 1) - self._buffer_start
+            outputs = len(range(offset, count, self.up))
+            view = windows[start:start + (outputs - 1) * self.down + 1:self.down]
+            result[offset::self.up] = view @ self.phases[position % self.up]
+
+        self._next_output = last
+
+        # Nicht mehr benötigte Eingabe verwerfen
+        next_newest = (self._next_output * self.down + self.half_len) // self.up
+        drop = max(0, next_newest - (self.taps - 1) - self._buffer_start)
+        if drop:
+            self._buffer = self._buffer[drop:]
+            self._buffer_start += drop
+
+        return result
@@ -0,0 +1,174 @@
+"""
+Durchsatz-Steuerung für Batch-Transkription
+
+RateLimiter begrenzt Anfragen und Tokens pro Minute (Token-Buckets, von
+allen Upload-Threads geteilt). ThroughputMeter misst den Durchsatz eines
+Batches und schätzt die Restdauer.
+"""
+import threading
+import time
+from typing import Optional, Dict, Any
+
+# Geschätzte Tokens pro Sekunde Audio (wird nach der Antwort korrigiert)
+AUDIO_TOKENS_PER_SEC = 10
+
+
+class _Bucket:
+    """Token-Bucket: Kapazität = Limit pro Minute, gleichmäßig nachgefüllt"""
+
+    def __init__(self, per_minute: int):
+        self.per_minute = per_minute
+        self.level = float(per_minute)
+        self.updated = time.monotonic()
+
+    def refill(self, now: float):
+        self.level = min(self.per_minute, self.level + (now - self.updated) * self.per_minute / 60.0)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Sekunden bis amount verfügbar ist (0 wenn sofort)"""
+        # Anfragen größer als das Limit nicht endlos blockieren
+        amount = min(amount, self.per_minute)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) * 60.0 / self.per_minute
+
+
+class RateLimiter:
+    """
+    Begrenzt Anfragen/Minute und Tokens/Minute über alle Threads
+
+    Ein Limit von 0 bedeutet unbegrenzt. Da die tatsächlichen Tokens erst
+    nach der Antwort bekannt sind, wird vorab geschätzt und mit adjust()
+    nachgebucht.
+    """
+
+    def __init__(self, requests_per_minute: int = 0, tokens_per_minute: int = 0):
+        self._lock = threading.Lock()
+        self.configure(requests_per_minute, tokens_per_minute)
+
+    def configure(self, requests_per_minute: int, tokens_per_minute: int):
+        """Setzt neue Limits (Buckets starten voll)"""
+        with self._lock:
+            self.requests_per_minute = requests_per_minute
+            self.tokens_per_minute = tokens_per_minute
+            self._requests = _Bucket(requests_per_minute) if requests_per_minute > 0 else None
+            self._tokens = _Bucket(tokens_per_minute) if tokens_per_minute > 0 else None
+
+    @property
+    def enabled(self) -> bool:
+        return self._requests is not None or self._tokens is not None
+
+    def acquire(self, tokens: int = 0):
+        """Blockiert bis eine Anfrage mit geschätzt `tokens` Tokens erlaubt ist"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = 0.0
+                for bucket, amount in ((self._requests, 1), (self._tokens, tokens)):
+                    if bucket is not None:
+                        bucket.refill(now)
+                        wait = max(wait, bucket.wait_time(amount))
+
+                if wait == 0.0:
+                    if self._requests is not None:
+                        self._requests.level -= 1
+                    if self._tokens is not None:
+                        self._tokens.level -= tokens
+                    return
+
+            time.sleep(min(wait, 5.0))
+
+    def adjust(self, estimated: int, actual: int):
+        """Bucht die Differenz zwischen geschätzten und tatsächlichen Tokens nach"""
+        with self._lock:
+            if self._tokens is not None:
+                # Darf negativ werden: nachfolgende Anfragen warten entsprechend
+                self._tokens.level -= (actual - estimated)
+
+
+_shared_limiter = RateLimiter()
+
+
+def get_rate_limiter(requests_per_minute: int, tokens_per_minute: int) -> RateLimiter:
+    """Gibt den prozessweiten Limiter zurück (Limits werden bei Änderung übernommen)"""
+    if (_shared_limiter.requests_per_minute, _shared_limiter.tokens_per_minute) != \
+            (requests_per_minute, tokens_per_minute):
+        _shared_limiter.configure(requests_per_minute, tokens_per_minute)
+    return _shared_limiter
+
+
+class ThroughputMeter:
+    """Misst Durchsatz (Audio-Sekunden pro Sekunde) und schätzt die Restdauer"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Startet eine neue Messung (z.B. wenn die Queue leer war)"""
+        self.started = None
+        self.jobs_done = 0
+        self.jobs_failed = 0
+        self.audio_done = 0.0
+        self.tokens = 0
+
+    def start(self):
+        """Markiert den Beginn eines Batches (falls noch nicht gestartet)"""
+        if self.started is None:
+            self.started = time.monotonic()
+
+    def record(self, audio_sec: float, tokens: int = 0, success: bool = True):
+        """Verbucht einen abgeschlossenen Job"""
+        if success:
+            self.jobs_done += 1
+            self.audio_done += audio_sec or 0.0
+            self.tokens += tokens or 0
+        else:
+            self.jobs_failed += 1
+
+    def snapshot(self, jobs_remaining: int, audio_remaining: float) -> Dict[str, Any]:
+        """
+        Aktueller Stand des Batches
+
+        Returns:
+            {
+                "done": int, "failed": int, "remaining": int,
+                "elapsed": float,          # Sekunden seit Start
+                "speed": float,            # Audio-Sekunden pro Sekunde (x Echtzeit)
+                "jobs_per_min": float,
+                "tokens_per_min": float,
+                "eta": float oder None     # Sekunden bis fertig
+            }
+        """
+        elapsed = time.monotonic() - self.started if self.started is not None else 0.0
+        speed = self.audio_done / elapsed if elapsed > 0 else 0.0
+        jobs_per_min = self.jobs_done * 60.0 / elapsed if elapsed > 0 else 0.0
+
+        eta: Optional[float] = None
+        if jobs_remaining == 0:
+            eta = 0.0
+        elif speed > 0 and audio_remaining > 0:
+            eta = audio_remaining / speed
+        elif jobs_per_min > 0:
+            eta = jobs_remaining * 60.0 / jobs_per_min
+
+        return {
+            "done": self.jobs_done,
+            "failed": self.jobs_failed,
+            "remaining": jobs_remaining,
+            "elapsed": elapsed,
+            "speed": speed,
+            "jobs_per_min": jobs_per_min,
+            "tokens_per_min": self.tokens * 60.0 / elapsed if elapsed > 0 else 0.0,
+            "eta": eta,
+        }
+
+
+def format_eta(seconds: Optional[float]) -> str:
+    """Formatiert eine Restdauer als H:MM:SS (oder '--:--' wenn unbekannt)"""
+    if seconds is None:
+        return "--:--"
+    seconds = int(seconds)
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}" if hours else f"{minutes:02d}:{secs:02d}"
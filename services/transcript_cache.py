@@ -0,0 +1,237 @@
+"""
+Transkript-Cache mit SQLite-Index, Kompression und LRU-Verdrängung
+
+Einträge sind über (Audio-Hash, Sprache, Modell) adressiert, damit ein
+Sprach- oder Modellwechsel kein veraltetes Transkript liefert. Die Nutzdaten
+liegen zlib-komprimiert als einzelne Dateien im Cache-Verzeichnis, der Index
+(index.db) enthält Größe und letzten Zugriff für die Verdrängung.
+"""
+import json
+import os
+import sqlite3
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+# Standard-Obergrenze für den Cache (Bytes komprimiert)
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+# Modell der Legacy-Einträge ({hash}.json ohne Metadaten)
+LEGACY_MODEL = "gpt-4o-transcribe"
+
+
+class TranscriptCache:
+    """Größenbegrenzter Cache für Transkriptions-Ergebnisse"""
+
+    def __init__(self, cache_dir: str = ".transcripts_cache",
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir: Verzeichnis für Index und Nutzdaten
+            max_bytes: Maximale Gesamtgröße der Nutzdaten (älteste Zugriffe fliegen zuerst)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / "index.db"
+        self.max_bytes = max_bytes
+        self._init_db()
+        self._migrate_legacy_files()
+
+    def _init_db(self):
+        """Erstellt Index- und Statistik-Tabelle falls nicht vorhanden"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    audio_hash TEXT NOT NULL,
+                    language TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    filename TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at TEXT NOT NULL,
+                    last_access TEXT NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (audio_hash, language, model)
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_entries_last_access
+                ON entries (last_access)
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS stats (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            conn.executemany(
+                "INSERT OR IGNORE INTO stats (name, value) VALUES (?, 0)",
+                [("hits",), ("misses",), ("evictions",)]
+            )
+            conn.commit()
+
+    @staticmethod
+    def _filename(audio_hash: str, language: str, model: str) -> str:
+        """Dateiname der Nutzdaten für einen Schlüssel"""
+        safe_model = "".join(c if c.isalnum() or c in "-." else "_" for c in model)
+        return f"{audio_hash}_{language or 'auto'}_{safe_model}.json.z"
+
+    def get(self, audio_hash: str, language: str, model: str) -> Optional[Dict[str, Any]]:
+        """
+        Liest ein Transkript aus dem Cache
+
+        Returns:
+            Ergebnis-Dict wie von transcribe() (ohne success) oder None
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute("""
+                SELECT filename FROM entries
+                WHERE audio_hash = ? AND language = ? AND model = ?
+            """, (audio_hash, language, model)).fetchone()
+
+            data = None
+            if row:
+                try:
+                    with open(self.cache_dir / row[0], "rb") as f:
+                        data = json.loads(zlib.decompress(f.read()).decode("utf-8"))
+                except (OSError, zlib.error, ValueError) as e:
+                    # Defekte oder fehlende Datei: Eintrag verwerfen
+                    print(f"Warnung: Cache-Eintrag unlesbar, wird entfernt: {row[0]} - {e}")
+                    conn.execute("""
+                        DELETE FROM entries
+                        WHERE audio_hash = ? AND language = ? AND model = ?
+                    """, (audio_hash, language, model))
+
+            if data is not None:
+                conn.execute("""
+                    UPDATE entries SET last_access = ?, hits = hits + 1
+                    WHERE audio_hash = ? AND language = ? AND model = ?
+                """, (datetime.now().isoformat(), audio_hash, language, model))
+                conn.execute("UPDATE stats SET value = value + 1 WHERE name = 'hits'")
+            else:
+                conn.execute("UPDATE stats SET value = value + 1 WHERE name = 'misses'")
+            conn.commit()
+
+        return data
+
+    def put(self, audio_hash: str, language: str, model: str, data: Dict[str, Any]):
+        """Speichert ein Transkript (komprimiert) und verdrängt ggf. alte Einträge"""
+        # success-Flag entfernen vor dem Speichern
+        cache_data = {k: v for k, v in data.items() if k != "success"}
+        payload = zlib.compress(
+            json.dumps(cache_data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), 6
+        )
+
+        filename = self._filename(audio_hash, language, model)
+        target = self.cache_dir / filename
+        temp = target.with_suffix(".tmp")
+        with open(temp, "wb") as f:
+            f.write(payload)
+        os.replace(temp, target)
+
+        now = datetime.now().isoformat()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO entries
+                    (audio_hash, language, model, filename, size, created_at, last_access, hits)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 0)
+            """, (audio_hash, language, model, filename, len(payload), now, now))
+            conn.commit()
+
+        self.evict()
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """
+        Entfernt am längsten nicht genutzte Einträge bis die Größe passt
+
+        Returns:
+            Anzahl entfernter Einträge
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        removed = []
+
+        with sqlite3.connect(self.db_path) as conn:
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total <= limit:
+                return 0
+
+            cursor = conn.execute("""
+                SELECT audio_hash, language, model, filename, size FROM entries
+                ORDER BY last_access ASC
+            """)
+            for audio_hash, language, model, filename, size in cursor:
+                if total <= limit:
+                    break
+                removed.append((audio_hash, language, model, filename))
+                total -= size
+
+            conn.executemany("""
+                DELETE FROM entries WHERE audio_hash = ? AND language = ? AND model = ?
+            """, [entry[:3] for entry in removed])
+            conn.execute(
+                "UPDATE stats SET value = value + ? WHERE name = 'evictions'", (len(removed),)
+            )
+            conn.commit()
+
+        for entry in removed:
+            try:
+                (self.cache_dir / entry[3]).unlink()
+            except OSError:
+                pass
+
+        return len(removed)
+
+    def clear(self):
+        """Leert den Cache komplett (Statistik bleibt erhalten)"""
+        self.evict(max_bytes=0)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Gibt Cache-Statistiken zurück
+
+        Returns:
+            {
+                "entries": int,
+                "size_bytes": int,
+                "max_bytes": int,
+                "hits": int,
+                "misses": int,
+                "evictions": int,
+                "hit_rate": float  # 0.0 - 1.0
+            }
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            entries, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+            counters = dict(conn.execute("SELECT name, value FROM stats"))
+
+        lookups = counters.get("hits", 0) + counters.get("misses", 0)
+        return {
+            "entries": entries,
+            "size_bytes": size,
+            "max_bytes": self.max_bytes,
+            "hits": counters.get("hits", 0),
+            "misses": counters.get("misses", 0),
+            "evictions": counters.get("evictions", 0),
+            "hit_rate": counters.get("hits", 0) / lookups if lookups else 0.0,
+        }
+
+    def _migrate_legacy_files(self):
+        """Übernimmt alte {hash}.json-Dateien in den Index (Sprache aus dem Inhalt)"""
+        legacy_files = list(self.cache_dir.glob("*.json"))
+        if not legacy_files:
+            return
+
+        migrated = 0
+        for path in legacy_files:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self.put(path.stem, data.get("language") or "auto", LEGACY_MODEL, data)
+                path.unlink()
+                migrated += 1
+            except (OSError, ValueError) as e:
+                print(f"Warnung: Cache-Datei konnte nicht migriert werden: {path} - {e}")
+
+        print(f"✓ {migrated} Transkripte in neuen Cache migriert")
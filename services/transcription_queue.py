@@ -0,0 +1,254 @@
+"""
+Persistente Transkriptions-Warteschlange mit Worker-Pool
+
+Die Jobs liegen in der transcription_jobs-Tabelle (data/jobs.py). Die Queue
+holt fällige Jobs ab, solange freie Worker-Plätze vorhanden sind, und hält
+transcription_status der Sessions synchron:
+
+    Job queued    -> Session "queued"
+    Job running   -> Session "running"
+    Job done      -> Session "completed"
+    Job error     -> Session "error"
+    Job cancelled -> Session None
+"""
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from data.jobs import (
+    JobRepository, PRIORITY_LOW, PRIORITY_NORMAL, STATE_QUEUED, STATE_RUNNING,
+    STATE_CANCELLED, HEARTBEAT_SEC
+)
+from services.workers import TranscriptionWorker
+from services.throughput import ThroughputMeter
+
+# Session-Status pro Job-Zustand
+SESSION_STATUS = {
+    STATE_QUEUED: "queued",
+    STATE_RUNNING: "running",
+}
+
+
+class TranscriptionQueue(QObject):
+    """Arbeitet die Job-Tabelle mit bis zu max_workers parallelen Workern ab"""
+
+    status_changed = Signal(int, object)    # (session_id, status oder None)
+    progress = Signal(int, int, int)        # (session_id, fertige_chunks, total_chunks)
+    job_finished = Signal(int, dict)        # (session_id, Result-Dict)
+    job_failed = Signal(int, str, bool)     # (session_id, Fehler, wird_wiederholt)
+    stats_changed = Signal(dict)            # ThroughputMeter.snapshot()
+
+    def __init__(self, repo, settings_manager, parent=None):
+        """
+        Args:
+            repo: SessionRepository (Transkripte und Status)
+            settings_manager: Für API Key, Sprache und Pool-Größe
+        """
+        super().__init__(parent)
+        self.repo = repo
+        self.jobs: JobRepository = repo.jobs
+        self.settings_manager = settings_manager
+        self.workers: Dict[int, TranscriptionWorker] = {}  # job_id -> Worker
+        self.meter = ThroughputMeter()
+
+        # Timer für zurückgestellte Jobs (Retry mit Wartezeit)
+        self.retry_timer = QTimer(self)
+        self.retry_timer.setSingleShot(True)
+        self.retry_timer.timeout.connect(self.dispatch)
+
+        # Heartbeat: Leases laufender Jobs verlängern (sonst übernimmt sie ein anderer Prozess)
+        self.heartbeat_timer = QTimer(self)
+        self.heartbeat_timer.setInterval(HEARTBEAT_SEC * 1000)
+        self.heartbeat_timer.timeout.connect(self.jobs.renew_leases)
+
+    @property
+    def max_workers(self) -> int:
+        return max(1, self.settings_manager.get_transcription_workers())
+
+    def resume(self):
+        """Setzt beim Start unterbrochene Jobs zurück und arbeitet die Queue weiter ab"""
+        interrupted = self.jobs.requeue_interrupted()
+        if interrupted:
+            print(f"🔁 {interrupted} unterbrochene Transkription(en) wieder eingereiht")
+
+        # Session-Status an die Job-Tabelle angleichen
+        active = self.jobs.list_active()
+        for state in (STATE_QUEUED, STATE_RUNNING):
+            session_ids = [job["session_id"] for job in active if job["state"] == state]
+            self.repo.set_transcription_status_many(session_ids, SESSION_STATUS[state])
+        if active:
+            self.meter.start()
+
+        self.dispatch()
+
+    def enqueue(self, session_id: int, audio_path: str, priority: int = PRIORITY_NORMAL) -> bool:
+        """Reiht eine Session ein (False wenn bereits eingereiht oder laufend)"""
+        return bool(self.enqueue_many([(session_id, audio_path)], priority=priority))
+
+    def enqueue_many(self, jobs: Iterable[tuple], priority: int = PRIORITY_LOW) -> List[int]:
+        """
+        Reiht mehrere (session_id, audio_path) ein
+
+        Returns:
+            Tatsächlich eingereihte Session-IDs
+        """
+        language = self.settings_manager.get_transcription_language()
+        added = self.jobs.enqueue_many(
+            [{"session_id": session_id, "audio_path": path, "language": language}
+             for session_id, path in jobs],
+            priority=priority
+        )
+        if added:
+            if not self.workers:
+                # Neuer Batch: Durchsatz ab jetzt messen
+                self.meter.reset()
+            self.meter.start()
+            self.repo.set_transcription_status_many(added, SESSION_STATUS[STATE_QUEUED])
+            for session_id in added:
+                self.status_changed.emit(session_id, SESSION_STATUS[STATE_QUEUED])
+            print(f"Transkription: {len(added)} Session(s) eingereiht")
+            self.dispatch()
+        return added
+
+    def cancel(self, session_ids: Iterable[int]) -> List[int]:
+        """
+        Bricht Jobs ab; Ergebnisse bereits laufender Worker werden verworfen
+
+        Returns:
+            Session-IDs mit abgebrochenem Job
+        """
+        cancelled = self.jobs.cancel_for_sessions(session_ids)
+        if cancelled:
+            self.repo.set_transcription_status_many(cancelled, None)
+            for session_id in cancelled:
+                self.status_changed.emit(session_id, None)
+            self._emit_stats()
+        return cancelled
+
+    def active_session_ids(self) -> set:
+        """Sessions mit wartendem oder laufendem Job"""
+        return {job["session_id"] for job in self.jobs.list_active()}
+
+    def stats(self) -> dict:
+        """Durchsatz und Restdauer des laufenden Batches"""
+        jobs_remaining, audio_remaining = self.jobs.remaining()
+        return self.meter.snapshot(jobs_remaining, audio_remaining)
+
+    def is_busy(self) -> bool:
+        """True solange Worker laufen"""
+        return bool(self.workers)
+
+    def dispatch(self):
+        """Startet fällige Jobs bis der Pool voll ist"""
+        api_key = self.settings_manager.get_openai_api_key()
+        if not api_key:
+            return
+
+        while len(self.workers) < self.max_workers:
+            job = self.jobs.claim_next()
+            if job is None:
+                break
+
+            if not Path(job["audio_path"]).exists():
+                self.jobs.mark_failed(job["id"], "Audio-Datei nicht gefunden", retryable=False)
+                self._set_session_status(job["session_id"], "error")
+                continue
+
+            self._start_worker(job, api_key)
+
+        self._schedule_retry()
+        self._emit_stats()
+
+    def _start_worker(self, job: dict, api_key: str):
+        """Startet einen Worker für einen abgeholten Job"""
+        job_id = job["id"]
+        session_id = job["session_id"]
+
+        worker = TranscriptionWorker(job["audio_path"], api_key, job["language"])
+        worker.chunk_progress.connect(
+            lambda current, total: self.progress.emit(session_id, current, total)
+        )
+        duration = job.get("duration_sec") or 0
+        worker.finished.connect(
+            lambda result: self._on_finished(job_id, session_id, result, duration)
+        )
+        worker.error.connect(lambda message: self._on_error(job_id, session_id, message))
+
+        self.workers[job_id] = worker
+        self._set_session_status(session_id, SESSION_STATUS[STATE_RUNNING])
+        worker.start()
+        if not self.heartbeat_timer.isActive():
+            self.heartbeat_timer.start()
+
+        print(f"Transkription gestartet für Session {session_id} "
+              f"(Versuch {job['attempts']}, {len(self.workers)}/{self.max_workers} Worker)")
+
+    def _on_finished(self, job_id: int, session_id: int, result: dict, duration: float = 0):
+        """Worker erfolgreich beendet"""
+        self._release(job_id)
+
+        if self.jobs.get_state(job_id) == STATE_CANCELLED:
+            print(f"Transkription für Session {session_id} verworfen (abgebrochen)")
+        else:
+            self.repo.update_transcript(session_id, result['text'], result['tokens_used'], "completed")
+            self.jobs.mark_done(job_id)
+            self.meter.record(duration, result['tokens_used'])
+            self.status_changed.emit(session_id, "completed")
+            self.job_finished.emit(session_id, result)
+            print(f"Transkription abgeschlossen für Session {session_id} ({result['tokens_used']} tokens)")
+
+        self.dispatch()
+
+    def _on_error(self, job_id: int, session_id: int, message: str):
+        """Worker mit Fehler beendet: erneut einreihen oder als Fehler markieren"""
+        self._release(job_id)
+
+        # Fehlende Datei wird durch Wiederholen nicht besser
+        retryable = message != "Audio-Datei nicht gefunden"
+        state = self.jobs.mark_failed(job_id, message, retryable=retryable)
+
+        # running: Lease war abgelaufen, ein anderer Prozess hat den Job übernommen
+        if state not in (STATE_CANCELLED, STATE_RUNNING):
+            retry = state == STATE_QUEUED
+            self._set_session_status(session_id, SESSION_STATUS[STATE_QUEUED] if retry else "error")
+            self.job_failed.emit(session_id, message, retry)
+            print(f"Transkription fehlgeschlagen für Session {session_id}: {message}"
+                  + (" (wird wiederholt)" if retry else ""))
+            if not retry:
+                self.meter.record(0, success=False)
+
+        self.dispatch()
+
+    def _release(self, job_id: int):
+        """Gibt den Worker-Platz eines Jobs frei"""
+        worker = self.workers.pop(job_id, None)
+        if worker is not None:
+            # finished/error sind die letzte Aktion in run(): kurz auf Thread-Ende warten,
+            # sonst wird der QThread zerstört während er noch läuft
+            worker.wait()
+        if not self.workers:
+            self.heartbeat_timer.stop()
+
+    def _set_session_status(self, session_id: int, status):
+        """Setzt den Session-Status in DB und meldet ihn an die UI"""
+        self.repo.set_transcription_status(session_id, status)
+        self.status_changed.emit(session_id, status)
+
+    def _emit_stats(self):
+        """Meldet den aktuellen Batch-Stand (nur während ein Batch läuft)"""
+        if self.meter.started is not None:
+            self.stats_changed.emit(self.stats())
+
+    def _schedule_retry(self):
+        """Weckt die Queue, wenn der nächste zurückgestellte Job fällig wird"""
+        if len(self.workers) >= self.max_workers:
+            return
+        # Auch Leases anderer Prozesse: deren Jobs nach einem Absturz übernehmen
+        next_at = self.jobs.next_available_at(include_leases=True)
+        if next_at is None:
+            self.retry_timer.stop()
+            return
+        delay_ms = max(0, int((next_at - datetime.now()).total_seconds() * 1000)) + 100
+        self.retry_timer.start(delay_ms)
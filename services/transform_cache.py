@@ -0,0 +1,145 @@
+"""
+Cache für Transformations-Ergebnisse (SQLite, zlib-komprimiert)
+
+Einträge sind über einen Schlüssel-Hash adressiert, der aus den
+Eingaben gebildet wird (z.B. Transkript-Hash + Prompt-Hash + Modell). Texte sind
+klein genug, um direkt in der Datenbank zu liegen. Verdrängt wird nach
+letztem Zugriff, sobald die Gesamtgröße das Limit überschreitet.
+"""
+import hashlib
+import json
+import sqlite3
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+# Standard-Obergrenze für den Cache (Bytes komprimiert)
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+# Eintragsarten
+KIND_SECTION = "section"    # Zwischenergebnis eines Abschnitts (Map-Stufe)
+KIND_RESULT = "result"      # Fertiges Transformations-Ergebnis
+
+
+def text_hash(text: str) -> str:
+    """SHA256 eines Texts (UTF-8)"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def cache_key(*parts) -> str:
+    """Bildet einen Schlüssel aus beliebigen JSON-serialisierbaren Teilen"""
+    return text_hash(json.dumps(parts, ensure_ascii=False, separators=(",", ":")))
+
+
+class TransformCache:
+    """Größenbegrenzter Cache für Transformations-Ergebnisse"""
+
+    def __init__(self, cache_dir: str = ".transform_cache",
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir: Verzeichnis für die Cache-Datenbank
+            max_bytes: Maximale Gesamtgröße der Einträge (älteste Zugriffe fliegen zuerst)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / "cache.db"
+        self.max_bytes = max_bytes
+        self._init_db()
+
+    def _init_db(self):
+        """Erstellt die Eintrags-Tabelle falls nicht vorhanden"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    model TEXT NOT NULL DEFAULT '',
+                    tokens INTEGER NOT NULL DEFAULT 0,
+                    content BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at TEXT NOT NULL,
+                    last_access TEXT NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_entries_last_access
+                ON entries (last_access)
+            """)
+            conn.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Liest einen Eintrag
+
+        Returns:
+            {"text": str, "model": str, "tokens": int, "created_at": str} oder None
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute("""
+                SELECT content, model, tokens, created_at FROM entries WHERE key = ?
+            """, (key,)).fetchone()
+            if row is None:
+                return None
+
+            try:
+                text = zlib.decompress(row[0]).decode("utf-8")
+            except (zlib.error, UnicodeDecodeError) as e:
+                print(f"Warnung: Transform-Cache-Eintrag unlesbar, wird entfernt: {e}")
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                conn.commit()
+                return None
+
+            conn.execute("""
+                UPDATE entries SET last_access = ?, hits = hits + 1 WHERE key = ?
+            """, (datetime.now().isoformat(), key))
+            conn.commit()
+
+        return {"text": text, "model": row[1], "tokens": row[2], "created_at": row[3]}
+
+    def put(self, key: str, kind: str, text: str, model: str = '', tokens: int = 0):
+        """Speichert einen Eintrag (komprimiert) und verdrängt ggf. alte Einträge"""
+        content = zlib.compress(text.encode("utf-8"), 6)
+        now = datetime.now().isoformat()
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO entries
+                    (key, kind, model, tokens, content, size, created_at, last_access, hits)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)
+            """, (key, kind, model or '', tokens or 0, content, len(content), now, now))
+            conn.commit()
+
+        self.evict()
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """
+        Entfernt am längsten nicht genutzte Einträge bis die Größe passt
+
+        Returns:
+            Anzahl entfernter Einträge
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+
+        with sqlite3.connect(self.db_path) as conn:
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total <= limit:
+                return 0
+
+            removed = []
+            for key, size in conn.execute("SELECT key, size FROM entries ORDER BY last_access ASC"):
+                if total <= limit:
+                    break
+                removed.append((key,))
+                total -= size
+
+            conn.executemany("DELETE FROM entries WHERE key = ?", removed)
+            conn.commit()
+
+        return len(removed)
+
+    def clear(self):
+        """Leert den Cache komplett"""
+        self.evict(max_bytes=0)
@@ -0,0 +1,91 @@
+"""
+Liest Metadaten direkt aus dem RIFF/WAVE-Header
+
+Ersetzt ffprobe-Aufrufe für WAV-Dateien: Dauer, Format und Lage der
+Sample-Daten ergeben sich aus den fmt- und data-Chunks, ohne einen
+externen Prozess zu starten oder die Sample-Daten zu lesen.
+"""
+import os
+import struct
+from typing import Optional, Dict, Any
+
+# WAVE-Formatcodes
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+def read_wav_info(path: str) -> Optional[Dict[str, Any]]:
+    """
+    Liest den Header einer WAV-Datei
+
+    Returns:
+        {
+            "format": int,          # WAVE_FORMAT_PCM / WAVE_FORMAT_IEEE_FLOAT
+            "channels": int,
+            "samplerate": int,
+            "bits_per_sample": int,
+            "block_align": int,     # Bytes pro Frame (alle Kanäle)
+            "data_offset": int,     # Position der Sample-Daten in der Datei
+            "data_size": int,       # Länge der Sample-Daten in Bytes
+            "frames": int,
+            "duration": float       # Sekunden
+        }
+        oder None wenn keine (lesbare) WAV-Datei
+    """
+    try:
+        file_size = os.path.getsize(path)
+        with open(path, "rb") as f:
+            riff, _size, wave = struct.unpack("<4sI4s", f.read(12))
+            if riff not in (b"RIFF", b"RF64") or wave != b"WAVE":
+                return None
+
+            fmt = None
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    return None
+                chunk_id, chunk_size = struct.unpack("<4sI", header)
+
+                if chunk_id == b"fmt ":
+                    data = f.read(chunk_size)
+                    audio_format, channels, samplerate, _byte_rate, block_align, bits = \
+                        struct.unpack("<HHIIHH", data[:16])
+                    if audio_format == WAVE_FORMAT_EXTENSIBLE and len(data) >= 26:
+                        # Eigentlicher Formatcode steht im SubFormat-GUID
+                        audio_format = struct.unpack("<H", data[24:26])[0]
+                    fmt = {
+                        "format": audio_format,
+                        "channels": channels,
+                        "samplerate": samplerate,
+                        "bits_per_sample": bits,
+                        "block_align": block_align,
+                    }
+                elif chunk_id == b"data":
+                    if fmt is None or not fmt["block_align"] or not fmt["samplerate"]:
+                        return None
+                    data_offset = f.tell()
+                    # Streaming-Header (Größe unbekannt) oder abgeschnittene Datei
+                    data_size = min(chunk_size, file_size - data_offset)
+                    frames = data_size // fmt["block_align"]
+                    return {
+                        **fmt,
+                        "data_offset": data_offset,
+                        "data_size": frames * fmt["block_align"],
+                        "frames": frames,
+                        "duration": frames / fmt["samplerate"],
+                    }
+                else:
+                    f.seek(chunk_size, os.SEEK_CUR)
+
+                # Chunks sind auf gerade Längen ausgerichtet
+                if chunk_size % 2:
+                    f.seek(1, os.SEEK_CUR)
+    except (OSError, struct.error):
+        return None
+
+
+def wav_duration(path: str) -> Optional[float]:
+    """Gibt die Dauer einer WAV-Datei in Sekunden zurück (None wenn nicht lesbar)"""
+    info = read_wav_info(path)
+    return info["duration"] if info else None
@@ -1,8 +1,17 @@
 """
 Qt Worker-Threads für asynchrone OpenAI API-Calls
+
+AudioSessionService (und damit das openai-Paket) wird erst in run()
+importiert: Der Import dauert auf dem Raspberry Pi mehrere Sekunden und
+läuft so beim ersten KI-Aufruf im Worker-Thread statt beim App-Start.
 """
+import threading
+
 from PySide6.QtCore import QThread, Signal
-from services.audio_session_service import AudioSessionService
+from settings import SettingsManager
+from services.export_service import SessionExporter
+from services.import_service import ArchiveImporter
+from services.batch_transform import BatchTransformer
 
 
 class TranscriptionWorker(QThread):
@@ -31,20 +40,22 @@ class TranscriptionWorker(QThread):
         """Führt Transkription aus"""
         self.progress.emit("Starte Transkription...")
 
-        service = AudioSessionService(api_key=self.api_key)
+        from services.audio_session_service import get_service
+        service = get_service(self.api_key)
 
-        # Progress-Callback für Chunk-Updates
-        def on_chunk_progress(current: int, total: int):
-            self.chunk_progress.emit(current, total)
+        # Progress-Callback für Chunk-Updates (Anzahl fertiger Chunks)
+        def on_chunk_progress(completed: int, total: int):
+            self.chunk_progress.emit(completed, total)
             if total > 1:
-                self.progress.emit(f"Transkribiere Teil {current}/{total}...")
+                self.progress.emit(f"Transkribiert: Teil {completed}/{total}")
             else:
                 self.progress.emit("Transkribiere...")
 
         result = service.transcribe(
             self.audio_file_path,
             self.language,
-            progress_callback=on_chunk_progress
+            progress_callback=on_chunk_progress,
+            max_concurrency=SettingsManager.instance().get_transcription_concurrency()
         )
 
         if result.get("success"):
@@ -55,11 +66,13 @@ class TranscriptionWorker(QThread):
 
 
 class TransformationWorker(QThread):
-    """Worker-Thread für Text-Transformation"""
+    """Worker-Thread für Text-Transformation (Antwort wird gestreamt)"""
 
     finished = Signal(dict)  # Result-Dict
     error = Signal(str)      # Error-Message
     progress = Signal(str)   # Progress-Message
+    delta = Signal(str)      # Neuer Text-Abschnitt
+    cancelled = Signal(dict) # Result-Dict mit bisherigem Teiltext
 
     def __init__(
         self,
@@ -67,7 +80,8 @@ class TransformationWorker(QThread):
         prompt_id: str,
         api_key: str,
         reasoning: str = "medium",
-        verbosity: str = "low"
+        verbosity: str = "low",
+        use_cache: bool = True
     ):
         """
         Initialisiert den Worker
@@ -78,6 +92,7 @@ class TransformationWorker(QThread):
             api_key: OpenAI API Key
             reasoning: Reasoning-Level
             verbosity: Verbosity-Level
+            use_cache: Gecachtes Ergebnis verwenden (False = neu generieren)
         """
         super().__init__()
         self.text = text
@@ -85,21 +100,209 @@ class TransformationWorker(QThread):
         self.api_key = api_key
         self.reasoning = reasoning
         self.verbosity = verbosity
+        self.use_cache = use_cache
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """Bricht den Stream beim nächsten Abschnitt ab"""
+        self._cancel_event.set()
 
     def run(self):
         """Führt Transformation aus"""
         self.progress.emit("Transformation wird durchgeführt...")
 
-        service = AudioSessionService(api_key=self.api_key)
-        result = service.transform(
+        from services.audio_session_service import get_service
+        service = get_service(self.api_key)
+        result = {}
+        for event in service.transform_stream(
             text=self.text,
             prompt_id=self.prompt_id,
             reasoning_effort=self.reasoning,
-            verbosity=self.verbosity
+            verbosity=self.verbosity,
+            cancel_event=self._cancel_event,
+            use_cache=self.use_cache
+        ):
+            if event["type"] == "delta":
+                self.delta.emit(event["text"])
+            elif event["type"] == "progress":
+                self.progress.emit(f"Abschnitt {event['done']}/{event['total']} zusammengefasst...")
+            else:
+                result = event["result"]
+
+        if result.get("success"):
+            self.progress.emit("Ergebnis aus dem Cache" if result.get("cached") else "Transformation abgeschlossen")
+            self.finished.emit(result)
+        elif result.get("cancelled"):
+            self.cancelled.emit(result)
+        else:
+            self.error.emit(result.get("error", "Unbekannter Fehler"))
+
+
+class BatchTransformWorker(QThread):
+    """Worker-Thread für die Batch-Transformation (ein Prompt über viele Sessions)"""
+
+    finished = Signal(dict)       # Statistik-Dict
+    error = Signal(str)           # Error-Message
+    progress = Signal(dict)       # ThroughputMeter-Snapshot
+
+    def __init__(self, sessions: list, prompt_id: str, api_key: str, max_workers: int = 2):
+        """
+        Initialisiert den Worker
+
+        Args:
+            sessions: Session-Dicts mit Transkript
+            prompt_id: ID des Prompts
+            api_key: OpenAI API Key
+            max_workers: Gleichzeitige Transformationen
+        """
+        super().__init__()
+        self.sessions = sessions
+        self.prompt_id = prompt_id
+        self.api_key = api_key
+        self.max_workers = max_workers
+        self._cancelled = False
+
+    def cancel(self):
+        """Bricht nach den laufenden Transformationen ab (fertige bleiben gespeichert)"""
+        self._cancelled = True
+
+    def run(self):
+        """Führt die Batch-Transformation aus"""
+        try:
+            from services.audio_session_service import get_service
+            transformer = BatchTransformer(get_service(self.api_key))
+            result = transformer.run(
+                self.sessions,
+                self.prompt_id,
+                max_workers=self.max_workers,
+                progress_callback=self.progress.emit,
+                is_cancelled=lambda: self._cancelled
+            )
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+
+        self.finished.emit(result)
+
+
+class ExportWorker(QThread):
+    """Worker-Thread für den Session-Export (CSV/JSONL/Parquet)"""
+
+    finished = Signal(dict)       # Result-Dict
+    error = Signal(str)           # Error-Message
+    progress = Signal(int, int)   # (exportierte_zeilen, gesamt_zeilen)
+
+    def __init__(
+        self,
+        output_path: str,
+        fmt: str = None,
+        columns: list = None,
+        filters: dict = None
+    ):
+        """
+        Initialisiert den Worker
+
+        Args:
+            output_path: Zieldatei
+            fmt: Export-Format (None = anhand der Dateiendung)
+            columns: Zu exportierende Spalten (None = alle)
+            filters: Filter wie bei SessionRepository.list_sessions()
+        """
+        super().__init__()
+        self.output_path = output_path
+        self.fmt = fmt
+        self.columns = columns
+        self.filters = filters
+        self._cancelled = False
+
+    def cancel(self):
+        """Bricht den Export nach dem aktuellen Block ab"""
+        self._cancelled = True
+
+    def run(self):
+        """Führt Export aus"""
+        exporter = SessionExporter()
+        result = exporter.export(
+            self.output_path,
+            fmt=self.fmt,
+            columns=self.columns,
+            filters=self.filters,
+            progress_callback=self.progress.emit,
+            is_cancelled=lambda: self._cancelled
         )
 
         if result.get("success"):
-            self.progress.emit("Transformation abgeschlossen")
             self.finished.emit(result)
         else:
             self.error.emit(result.get("error", "Unbekannter Fehler"))
+
+
+class ImportWorker(QThread):
+    """Worker-Thread für den Bulk-Import von Audio-Archiven"""
+
+    finished = Signal(dict)       # Statistik-Dict
+    error = Signal(str)           # Error-Message
+    progress = Signal(int, int)   # (verarbeitete_dateien, gesamt_dateien)
+
+    def __init__(self, directories: list):
+        """
+        Initialisiert den Worker
+
+        Args:
+            directories: Zu importierende Verzeichnisse
+        """
+        super().__init__()
+        self.directories = directories
+        self._cancelled = False
+
+    def cancel(self):
+        """Bricht den Import ab (bereits gespeicherte Blöcke bleiben erhalten)"""
+        self._cancelled = True
+
+    def run(self):
+        """Führt Import aus"""
+        try:
+            importer = ArchiveImporter()
+            result = importer.run(
+                self.directories,
+                progress_callback=self.progress.emit,
+                is_cancelled=lambda: self._cancelled
+            )
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+
+        self.finished.emit(result)
+
+
+class FileDeleteWorker(QThread):
+    """Worker-Thread zum Löschen von Audio-Dateien (nach Bulk-Delete)"""
+
+    finished = Signal(dict)       # {"deleted": int, "failed": list}
+    progress = Signal(int, int)   # (geloeschte_dateien, gesamt_dateien)
+
+    def __init__(self, paths: list):
+        """
+        Initialisiert den Worker
+
+        Args:
+            paths: Pfade der zu löschenden Audio-Dateien
+        """
+        super().__init__()
+        self.paths = paths
+
+    def run(self):
+        """Löscht alle Dateien, Fehler werden gesammelt statt abzubrechen"""
+        from data.repo import SessionRepository
+
+        deleted = 0
+        failed = []
+        for index, path in enumerate(self.paths, start=1):
+            result = SessionRepository.delete_file(path)
+            if result.get("file_deleted"):
+                deleted += 1
+            elif result.get("reason") != "Datei existiert nicht":
+                failed.append(f"{path}: {result.get('reason')}")
+            self.progress.emit(index, len(self.paths))
+
+        self.finished.emit({"deleted": deleted, "failed": failed})
@@ -1,58 +1,192 @@
 """
 Settings-Manager für persistente App-Einstellungen
 """
-from PySide6.QtCore import QSettings
+from PySide6.QtCore import QObject, QSettings, QTimer, QThread, QCoreApplication, Signal
 import json
+import threading
 import uuid
 
+# Verzögerung, mit der geänderte Werte gebündelt gespeichert werden (ms)
+FLUSH_DELAY_MS = 500
 
-class SettingsManager:
-    """Zentrale Settings-Verwaltung mit QSettings"""
+
+class SettingsManager(QObject):
+    """
+    Zentrale Settings-Verwaltung mit QSettings
+
+    Werte werden beim ersten Zugriff in einen In-Memory-Snapshot gelesen,
+    danach berühren Lesezugriffe QSettings nicht mehr (auch Prompts liegen
+    geparst und nach ID indiziert vor). Änderungen gelten sofort, lösen
+    changed() aus und werden verzögert gebündelt gespeichert (Write-Behind).
+
+    Prozessweit eine Instanz verwenden: SettingsManager.instance()
+    """
+
+    changed = Signal(str, object)   # (Schlüssel, neuer Wert)
+    prompts_changed = Signal()      # Prompt-Liste geändert (auch bei Sprachwechsel)
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "SettingsManager":
+        """Gibt die prozessweite Instanz zurück (thread-safe)"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
 
     def __init__(self):
+        super().__init__()
         # QSettings speichert automatisch plattformabhängig
         # macOS: ~/Library/Preferences/com.AudioSessions.AudioRecorderApp.plist
         # Windows: Registry
         # Linux: ~/.config/AudioSessions/AudioRecorderApp.conf
         self.settings = QSettings("AudioSessions", "AudioRecorderApp")
+        self._lock = threading.RLock()
+        self._values = {}           # Snapshot: Schlüssel -> Wert
+        self._dirty = {}            # Noch nicht gespeicherte Änderungen
+        self._custom_prompts = None
+        self._all_prompts = None
+        self._prompt_index = {}     # Prompt-ID -> Prompt
+        self._flush_timer = None
         self._initialize_default_prompts()
 
+    # ========== Snapshot & Persistenz ==========
+
+    def _value(self, key: str, default, value_type=None):
+        """Liest einen Wert aus dem Snapshot (beim ersten Zugriff aus QSettings)"""
+        with self._lock:
+            if key not in self._values:
+                if value_type is None:
+                    self._values[key] = self.settings.value(key, default)
+                else:
+                    self._values[key] = self.settings.value(key, default, type=value_type)
+            return self._values[key]
+
+    def _set_value(self, key: str, value):
+        """Setzt einen Wert im Snapshot und plant das Speichern"""
+        with self._lock:
+            if key in self._values and self._values[key] == value:
+                return
+            self._values[key] = value
+            self._dirty[key] = value
+
+        self._schedule_flush()
+        self.changed.emit(key, value)
+
+    def _schedule_flush(self):
+        """Speichert verzögert (Event-Loop) oder sofort (ohne App bzw. aus Worker-Threads)"""
+        app = QCoreApplication.instance()
+        if app is None or QThread.currentThread() != self.thread():
+            self.flush()
+            return
+
+        if self._flush_timer is None:
+            self._flush_timer = QTimer(self)
+            self._flush_timer.setSingleShot(True)
+            self._flush_timer.timeout.connect(self.flush)
+            app.aboutToQuit.connect(self.flush)
+        self._flush_timer.start(FLUSH_DELAY_MS)
+
+    def flush(self):
+        """Schreibt alle ausstehenden Änderungen nach QSettings"""
+        with self._lock:
+            dirty, self._dirty = self._dirty, {}
+            for key, value in dirty.items():
+                self.settings.setValue(key, value)
+        if dirty:
+            self.settings.sync()
+
     def get_language(self) -> str:
         """Gibt die aktuelle Sprache zurück"""
-        return self.settings.value("language", "Deutsch")
+        return self._value("language", "Deutsch")
 
     def set_language(self, language: str):
-        """Setzt die Sprache"""
-        self.settings.setValue("language", language)
+        """Setzt die Sprache (Standard-Prompts sind sprachabhängig)"""
+        if language == self.get_language():
+            return
+        self._set_value("language", language)
+        with self._lock:
+            self._all_prompts = None
+        self.prompts_changed.emit()
 
     def get_auto_transcription(self) -> bool:
         """Gibt Auto-Transkription Status zurück"""
-        return self.settings.value("auto_transcription", False, type=bool)
+        return self._value("auto_transcription", False, bool)
 
     def set_auto_transcription(self, enabled: bool):
         """Setzt Auto-Transkription"""
-        self.settings.setValue("auto_transcription", enabled)
+        self._set_value("auto_transcription", enabled)
 
     def get_openai_api_key(self) -> str:
         """Gibt den OpenAI API Key zurück"""
-        return self.settings.value("openai_api_key", "")
+        return self._value("openai_api_key", "")
 
     def set_openai_api_key(self, key: str):
         """Setzt den OpenAI API Key"""
-        self.settings.setValue("openai_api_key", key)
+        self._set_value("openai_api_key", key)
 
     def get_transcription_language(self) -> str:
         """Gibt die Transkriptions-Sprache als ISO-639-1 Code zurück"""
         language = self.get_language()
         return "de" if language == "Deutsch" else "en"
 
+    def get_transcription_concurrency(self) -> int:
+        """Gibt die Anzahl gleichzeitiger Chunk-Uploads bei der Transkription zurück"""
+        return self._value("transcription_concurrency", 4, int)
+
+    def set_transcription_concurrency(self, count: int):
+        """Setzt die Anzahl gleichzeitiger Chunk-Uploads"""
+        self._set_value("transcription_concurrency", count)
+
+    def get_transcription_workers(self) -> int:
+        """Gibt die Anzahl gleichzeitig transkribierter Sessions zurück"""
+        return self._value("transcription_workers", 2, int)
+
+    def set_transcription_workers(self, count: int):
+        """Setzt die Anzahl gleichzeitig transkribierter Sessions"""
+        self._set_value("transcription_workers", count)
+
+    def get_rate_limit_rpm(self) -> int:
+        """Gibt das Limit für API-Anfragen pro Minute zurück (0 = unbegrenzt)"""
+        return self._value("rate_limit_rpm", 0, int)
+
+    def set_rate_limit_rpm(self, count: int):
+        """Setzt das Limit für API-Anfragen pro Minute"""
+        self._set_value("rate_limit_rpm", count)
+
+    def get_rate_limit_tpm(self) -> int:
+        """Gibt das Limit für Tokens pro Minute zurück (0 = unbegrenzt)"""
+        return self._value("rate_limit_tpm", 0, int)
+
+    def set_rate_limit_tpm(self, count: int):
+        """Setzt das Limit für Tokens pro Minute"""
+        self._set_value("rate_limit_tpm", count)
+
+    def get_api_timeout(self) -> float:
+        """Gibt den Timeout für OpenAI-Anfragen in Sekunden zurück"""
+        return self._value("api_timeout", 120.0, float)
+
+    def set_api_timeout(self, seconds: float):
+        """Setzt den Timeout für OpenAI-Anfragen"""
+        self._set_value("api_timeout", seconds)
+
+    def get_api_max_retries(self) -> int:
+        """Gibt die Anzahl Wiederholungen bei Rate Limit/Timeout zurück"""
+        return self._value("api_max_retries", 3, int)
+
+    def set_api_max_retries(self, count: int):
+        """Setzt die Anzahl Wiederholungen bei Rate Limit/Timeout"""
+        self._set_value("api_max_retries", count)
+
     def get_sample_rate(self) -> int:
         """Gibt die Audio Sample Rate zurück"""
-        return self.settings.value("sample_rate", 48000, type=int)
+        return self._value("sample_rate", 48000, int)
 
     def set_sample_rate(self, rate: int):
         """Setzt die Audio Sample Rate"""
-        self.settings.setValue("sample_rate", rate)
+        self._set_value("sample_rate", rate)
 
     # ========== Prompt Management ==========
 
@@ -111,27 +245,41 @@ class SettingsManager:
                 }
             ]
 
+    def _load_prompts(self) -> list:
+        """Baut die Prompt-Liste und den ID-Index (nur nach Änderungen)"""
+        with self._lock:
+            if self._custom_prompts is None:
+                try:
+                    self._custom_prompts = json.loads(self._value("custom_prompts", "[]"))
+                except (json.JSONDecodeError, TypeError):
+                    self._custom_prompts = []
+
+            if self._all_prompts is None:
+                self._all_prompts = self._get_default_prompts() + self._custom_prompts
+                self._prompt_index = {prompt["id"]: prompt for prompt in self._all_prompts}
+            return self._all_prompts
+
     def get_custom_prompts(self) -> list:
-        """Gibt Liste von Custom Prompts zurück"""
-        prompts_json = self.settings.value("custom_prompts", "[]")
-        try:
-            return json.loads(prompts_json)
-        except json.JSONDecodeError:
-            return []
+        """Gibt Liste von Custom Prompts zurück (Kopien, Änderungen über set_custom_prompts)"""
+        with self._lock:
+            self._load_prompts()
+            return [dict(prompt) for prompt in self._custom_prompts]
 
     def set_custom_prompts(self, prompts: list):
         """Speichert Custom Prompts"""
-        prompts_json = json.dumps(prompts, ensure_ascii=False)
-        self.settings.setValue("custom_prompts", prompts_json)
+        with self._lock:
+            self._custom_prompts = [dict(prompt) for prompt in prompts]
+            self._all_prompts = None
+        self._set_value("custom_prompts", json.dumps(prompts, ensure_ascii=False))
+        self.prompts_changed.emit()
 
     def get_all_prompts(self) -> list:
         """Gibt alle Prompts (Default + Custom) zurück"""
-        default_prompts = self._get_default_prompts()
-        custom_prompts = self.get_custom_prompts()
-        return default_prompts + custom_prompts
+        with self._lock:
+            return [dict(prompt) for prompt in self._load_prompts()]
 
-    def add_prompt(self, name: str, prompt_text: str) -> str:
-        """Fügt einen neuen Prompt hinzu, gibt ID zurück"""
+    def add_prompt(self, name: str, prompt_text: str, model: str = "") -> str:
+        """Fügt einen neuen Prompt hinzu, gibt ID zurück (model "" = automatisch)"""
         prompts = self.get_custom_prompts()
 
         # Generiere eindeutige ID
@@ -142,6 +290,7 @@ class SettingsManager:
             "id": prompt_id,
             "name": name,
             "prompt_text": prompt_text,
+            "model": model,
             "is_default": False
         }
 
@@ -150,7 +299,7 @@ class SettingsManager:
 
         return prompt_id
 
-    def update_prompt(self, prompt_id: str, name: str, prompt_text: str):
+    def update_prompt(self, prompt_id: str, name: str, prompt_text: str, model: str = ""):
         """Aktualisiert einen Prompt"""
         prompts = self.get_custom_prompts()
 
@@ -158,6 +307,7 @@ class SettingsManager:
             if prompt["id"] == prompt_id:
                 prompt["name"] = name
                 prompt["prompt_text"] = prompt_text
+                prompt["model"] = model
                 break
 
         self.set_custom_prompts(prompts)
@@ -173,11 +323,10 @@ class SettingsManager:
 
     def get_prompt_by_id(self, prompt_id: str) -> dict:
         """Gibt einen einzelnen Prompt anhand der ID zurück"""
-        all_prompts = self.get_all_prompts()
-        for prompt in all_prompts:
-            if prompt["id"] == prompt_id:
-                return prompt
-        return None
+        with self._lock:
+            self._load_prompts()
+            prompt = self._prompt_index.get(prompt_id)
+            return dict(prompt) if prompt is not None else None
 
     # ========== Layout & Display Settings ==========
 
@@ -188,7 +337,7 @@ class SettingsManager:
         Returns:
             str: "auto", "compact", oder "desktop"
         """
-        return self.settings.value("layout_mode", "auto")
+        return self._value("layout_mode", "auto")
 
     def set_layout_mode(self, mode: str):
         """
@@ -197,12 +346,12 @@ class SettingsManager:
         Args:
             mode: "auto", "compact", oder "desktop"
         """
-        self.settings.setValue("layout_mode", mode)
+        self._set_value("layout_mode", mode)
 
     def get_touch_mode(self) -> bool:
         """Gibt zurück ob Touch-Modus aktiviert ist"""
-        return self.settings.value("touch_mode", False, type=bool)
+        return self._value("touch_mode", False, bool)
 
     def set_touch_mode(self, enabled: bool):
         """Setzt den Touch-Modus"""
-        self.settings.setValue("touch_mode", enabled)
+        self._set_value("touch_mode", enabled)
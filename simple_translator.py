@@ -1,10 +1,110 @@
 """
 Einfacher Translation-Manager der .ts XML-Dateien direkt liest
 Ersetzt QTranslator da lrelease nicht verfügbar ist
+
+Die .ts Dateien werden einmal in einen Katalog (marshal, flache Dicts)
+kompiliert, der beim Start statt des XML geladen wird. Ein veralteter oder
+fehlender Katalog wird beim Laden automatisch neu erzeugt; für Builds:
+
+    python simple_translator.py translations/*.ts
 """
+import marshal
+import sys
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+
+# Dateiendung und Format-Version des kompilierten Katalogs
+CATALOG_SUFFIX = ".catalog"
+CATALOG_VERSION = 2
+
+
+def parse_ts(ts_path: Path) -> Dict[str, Dict[str, str]]:
+    """Liest eine .ts Datei, gibt {context: {source: translation}} zurück"""
+    translations: Dict[str, Dict[str, str]] = {}
+    root = ET.parse(ts_path).getroot()
+
+    # Parse all contexts
+    for context in root.findall('.//context'):
+        context_name_elem = context.find('name')
+        if context_name_elem is None:
+            continue
+
+        messages = translations.setdefault(context_name_elem.text, {})
+
+        # Parse all messages in this context
+        for message in context.findall('message'):
+            source_elem = message.find('source')
+            trans_elem = message.find('translation')
+
+            if source_elem is not None and trans_elem is not None:
+                source_text = source_elem.text or ""
+                messages[source_text] = trans_elem.text or source_text
+
+    return translations
+
+
+def _source_stamp(ts_path: Path) -> Tuple[int, int]:
+    """
+    (mtime_ns, Größe) der .ts Datei, erkennt veraltete Kataloge
+
+    Nur ein stat(): Die Datei beim Start zu lesen und zu hashen würde die
+    Zeit wieder kosten, die der Katalog sparen soll.
+    """
+    stat = ts_path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def build_catalog(ts_path: Path) -> dict:
+    """
+    Erzeugt den Katalog einer .ts Datei
+
+    Der Katalog enthält die Übersetzungen pro Context und einen globalen
+    Index source -> translation (erster Treffer über alle Contexts), damit
+    Texte aus fremden Contexts ohne lineare Suche gefunden werden.
+    """
+    translations = parse_ts(ts_path)
+
+    global_index: Dict[str, str] = {}
+    for messages in translations.values():
+        for source_text, trans_text in messages.items():
+            global_index.setdefault(source_text, trans_text)
+
+    return {
+        "version": CATALOG_VERSION,
+        "source": _source_stamp(ts_path),
+        "contexts": translations,
+        "global": global_index,
+    }
+
+
+def compile_catalog(ts_file: str, catalog_file: Optional[str] = None) -> Path:
+    """Kompiliert eine .ts Datei in einen Katalog (Standard: gleicher Name, .catalog)"""
+    ts_path = Path(ts_file)
+    catalog_path = Path(catalog_file) if catalog_file else ts_path.with_suffix(CATALOG_SUFFIX)
+    with open(catalog_path, "wb") as f:
+        marshal.dump(build_catalog(ts_path), f)
+    return catalog_path
+
+
+def _read_catalog(catalog_path: Path, ts_path: Path) -> Optional[dict]:
+    """Liest einen Katalog, None wenn er fehlt, veraltet oder unlesbar ist"""
+    if not catalog_path.exists():
+        return None
+    try:
+        with open(catalog_path, "rb") as f:
+            catalog = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if not isinstance(catalog, dict) or catalog.get("version") != CATALOG_VERSION:
+        return None
+    # Gebaute App: Katalog ist beim Build kompiliert (mtimes ändern sich beim Entpacken)
+    if getattr(sys, 'frozen', False):
+        return catalog
+    if ts_path.exists() and catalog.get("source") != _source_stamp(ts_path):
+        return None
+    return catalog
 
 
 class SimpleTranslator:
@@ -16,6 +116,8 @@ class SimpleTranslator:
     def __init__(self):
         self.translations: Dict[str, Dict[str, str]] = {}
         self.current_language = "de_DE"
+        self._global: Dict[str, str] = {}
+        self._memo: Dict[Tuple[str, str], str] = {}
 
     @classmethod
     def instance(cls) -> 'SimpleTranslator':
@@ -30,70 +132,60 @@ class SimpleTranslator:
         cls._instance = translator
 
     def load(self, ts_file: str) -> bool:
-        """Lädt eine .ts Datei"""
+        """Lädt eine .ts Datei (über den kompilierten Katalog, falls aktuell)"""
         ts_path = Path(ts_file)
-
-        if not ts_path.exists():
-            print(f"Warnung: Translation-Datei nicht gefunden: {ts_file}")
-            return False
-
-        try:
-            tree = ET.parse(ts_path)
-            root = tree.getroot()
-
-            self.translations.clear()
-
-            # Parse all contexts
-            for context in root.findall('.//context'):
-                context_name_elem = context.find('name')
-                if context_name_elem is None:
-                    continue
-
-                context_name = context_name_elem.text
-
-                if context_name not in self.translations:
-                    self.translations[context_name] = {}
-
-                # Parse all messages in this context
-                for message in context.findall('message'):
-                    source_elem = message.find('source')
-                    trans_elem = message.find('translation')
-
-                    if source_elem is not None and trans_elem is not None:
-                        source_text = source_elem.text or ""
-                        trans_text = trans_elem.text or source_text
-
-                        self.translations[context_name][source_text] = trans_text
-
-            # Extract language from filename
-            if 'en_US' in ts_file:
-                self.current_language = "en_US"
-            elif 'de_DE' in ts_file:
-                self.current_language = "de_DE"
-
-            print(f"✓ Sprache geladen: {self.current_language} ({len(self.translations)} Contexts)")
-            return True
-
-        except Exception as e:
-            print(f"Fehler beim Laden von {ts_file}: {e}")
-            import traceback
-            traceback.print_exc()
-            return False
+        catalog_path = ts_path.with_suffix(CATALOG_SUFFIX)
+
+        catalog = _read_catalog(catalog_path, ts_path)
+        if catalog is None:
+            if not ts_path.exists():
+                print(f"Warnung: Translation-Datei nicht gefunden: {ts_file}")
+                return False
+
+            try:
+                catalog = build_catalog(ts_path)
+            except Exception as e:
+                print(f"Fehler beim Laden von {ts_file}: {e}")
+                import traceback
+                traceback.print_exc()
+                return False
+
+            try:
+                with open(catalog_path, "wb") as f:
+                    marshal.dump(catalog, f)
+            except OSError as e:
+                # Schreibgeschütztes Verzeichnis (z.B. App-Bundle): nächster Start parst erneut
+                print(f"Hinweis: Übersetzungs-Katalog nicht schreibbar: {e}")
+
+        self.translations = catalog["contexts"]
+        self._global = catalog["global"]
+        self._memo = {}
+
+        # Extract language from filename
+        if 'en_US' in ts_file:
+            self.current_language = "en_US"
+        elif 'de_DE' in ts_file:
+            self.current_language = "de_DE"
+
+        print(f"✓ Sprache geladen: {self.current_language} ({len(self.translations)} Contexts)")
+        return True
 
     def translate(self, context: str, source_text: str) -> str:
         """Übersetzt einen Text"""
-        # Suche in dem spezifischen Context
-        if context in self.translations:
-            if source_text in self.translations[context]:
-                return self.translations[context][source_text]
+        key = (context, source_text)
+        result = self._memo.get(key)
+        if result is not None:
+            return result
 
-        # Fallback: Suche in allen Contexts
-        for ctx_translations in self.translations.values():
-            if source_text in ctx_translations:
-                return ctx_translations[source_text]
+        # Suche in dem spezifischen Context, dann im globalen Index,
+        # sonst Originaltext zurückgeben
+        messages = self.translations.get(context)
+        result = messages.get(source_text) if messages is not None else None
+        if result is None:
+            result = self._global.get(source_text, source_text)
 
-        # Fallback: Originaltext zurückgeben
-        return source_text
+        self._memo[key] = result
+        return result
 
     def get_current_language(self) -> str:
         """Gibt die aktuelle Sprache zurück"""
@@ -105,3 +197,10 @@ def tr(source_text: str, context: str = "Unknown") -> str:
     """Globale Übersetzungsfunktion"""
     translator = SimpleTranslator.instance()
     return translator.translate(context, source_text)
+
+
+if __name__ == "__main__":
+    # Build-Schritt: Kataloge für alle übergebenen (oder alle vorhandenen) .ts Dateien
+    ts_files = sys.argv[1:] or [str(path) for path in sorted(Path("translations").glob("*.ts"))]
+    for ts_file in ts_files:
+        print(f"Kompiliere {ts_file} -> {compile_catalog(ts_file)}")
@@ -0,0 +1,162 @@
+"""
+Transkribiert alle Sessions ohne Transkript oder mit Fehler (Kommandozeile)
+
+Nutzt dieselbe Job-Tabelle wie die App: Abgebrochene Läufe werden beim
+nächsten Aufruf fortgesetzt, Sessions werden nicht doppelt eingereiht.
+Jobs, die die App gerade transkribiert, bleiben bei ihr (Lease, siehe
+data/jobs.py).
+
+Verwendung:
+    python transcribe_backlog.py [--workers 2] [--rpm 50] [--tpm 200000]
+    python transcribe_backlog.py --base-url http://localhost:8000/v1 --api-key test
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from data.repo import SessionRepository
+from data.jobs import PRIORITY_LOW, STATE_QUEUED, STATE_RUNNING, HEARTBEAT_SEC
+from services.audio_session_service import AudioSessionService
+from services.throughput import RateLimiter, ThroughputMeter, format_eta
+from settings import SettingsManager
+
+
+def main():
+    """Hauptfunktion"""
+    settings = SettingsManager.instance()
+
+    parser = argparse.ArgumentParser(description="Alle nicht transkribierten Sessions transkribieren")
+    parser.add_argument("--db", default="data/sessions.db", help="Pfad zur Session-Datenbank")
+    parser.add_argument("--api-key", default=None,
+                        help="OpenAI API Key (Standard: OPENAI_API_KEY oder App-Einstellungen)")
+    parser.add_argument("--base-url", default=None,
+                        help="Alternativer API-Endpunkt, z.B. ein lokaler Test-Server")
+    parser.add_argument("--language", default=None,
+                        help="Sprache als ISO-639-1 Code (Standard: App-Einstellung)")
+    parser.add_argument("--workers", type=int, default=settings.get_transcription_workers(),
+                        help="Gleichzeitig transkribierte Sessions")
+    parser.add_argument("--uploads", type=int, default=settings.get_transcription_concurrency(),
+                        help="Parallele Chunk-Uploads pro Session")
+    parser.add_argument("--rpm", type=int, default=settings.get_rate_limit_rpm(),
+                        help="Maximale API-Anfragen pro Minute (0 = unbegrenzt)")
+    parser.add_argument("--tpm", type=int, default=settings.get_rate_limit_tpm(),
+                        help="Maximale Tokens pro Minute (0 = unbegrenzt)")
+    parser.add_argument("--limit", type=int, default=None, help="Höchstens so viele Sessions einreihen")
+    parser.add_argument("--dry-run", action="store_true", help="Nur anzeigen, was eingereiht würde")
+    args = parser.parse_args()
+
+    api_key = args.api_key or os.environ.get("OPENAI_API_KEY") or settings.get_openai_api_key()
+    if not api_key and not args.dry_run:
+        print("✗ Kein API Key (--api-key, OPENAI_API_KEY oder App-Einstellungen)")
+        return 1
+
+    language = args.language or settings.get_transcription_language()
+    repo = SessionRepository(args.db)
+    jobs = repo.jobs
+
+    # Unterbrochene Läufe fortsetzen, dann Rückstand einreihen
+    interrupted = jobs.requeue_interrupted()
+    if interrupted:
+        print(f"🔁 {interrupted} unterbrochene Transkription(en) wieder eingereiht")
+
+    sessions = [
+        session for session in repo.list_sessions(statuses=[None, "error"])
+        if session['path'] and os.path.exists(session['path'])
+    ][:args.limit]
+    hours = sum(session['duration_sec'] or 0 for session in sessions) / 3600
+    print(f"📋 {len(sessions)} Sessions ohne Transkript ({hours:.1f} h Audio)")
+
+    if args.dry_run:
+        for session in sessions:
+            print(f"  {session['id']:>6}  {session['title']}")
+        return 0
+
+    added = jobs.enqueue_many(
+        [{"session_id": session['id'], "audio_path": session['path'], "language": language}
+         for session in sessions],
+        priority=PRIORITY_LOW
+    )
+    repo.set_transcription_status_many(added, "queued")
+
+    service = AudioSessionService(
+        api_key=api_key,
+        base_url=args.base_url,
+        hash_index=repo.hashes,
+        timeout=settings.get_api_timeout(),
+        max_retries=settings.get_api_max_retries(),
+        rate_limiter=RateLimiter(args.rpm, args.tpm)
+    )
+
+    meter = ThroughputMeter()
+    meter.start()
+
+    def run(job):
+        return service.transcribe(job["audio_path"], job["language"], max_concurrency=args.uploads)
+
+    def report():
+        stats = meter.snapshot(*jobs.remaining())
+        print(f"\r📝 {stats['done']} fertig, {stats['failed']} Fehler, {stats['remaining']} offen"
+              f" · {stats['speed']:.1f}× Echtzeit · {stats['tokens_per_min']:.0f} Tokens/min"
+              f" · Rest {format_eta(stats['eta'])}   ", end="", flush=True)
+
+    running = {}
+    last_heartbeat = time.monotonic()
+    executor = ThreadPoolExecutor(max_workers=max(1, args.workers))
+    try:
+        while True:
+            # Freie Plätze mit fälligen Jobs füllen
+            while len(running) < max(1, args.workers):
+                job = jobs.claim_next()
+                if job is None:
+                    break
+                repo.set_transcription_status(job["session_id"], "running")
+                running[executor.submit(run, job)] = job
+
+            if not running:
+                # Nur noch zurückgestellte Wiederholungen: bis zur Fälligkeit warten
+                next_at = jobs.next_available_at()
+                if next_at is None:
+                    break
+                time.sleep(min(60.0, max(0.5, next_at.timestamp() - time.time())))
+                continue
+
+            done, _ = wait(running, timeout=5.0, return_when=FIRST_COMPLETED)
+            if time.monotonic() - last_heartbeat >= HEARTBEAT_SEC:
+                # Leases verlängern, damit die App laufende Jobs nicht übernimmt
+                jobs.renew_leases()
+                last_heartbeat = time.monotonic()
+            for future in done:
+                job = running.pop(future)
+                result = future.result()
+                if result.get("success"):
+                    repo.update_transcript(job["session_id"], result['text'], result['tokens_used'], "completed")
+                    jobs.mark_done(job["id"])
+                    meter.record(job.get("duration_sec") or 0, result['tokens_used'])
+                else:
+                    error = result.get("error", "Unbekannter Fehler")
+                    retryable = error != "Audio-Datei nicht gefunden"
+                    state = jobs.mark_failed(job["id"], error, retryable=retryable)
+                    if state == STATE_RUNNING:
+                        continue  # Lease abgelaufen, anderer Prozess hat übernommen
+                    repo.set_transcription_status(job["session_id"], "queued" if state == STATE_QUEUED else "error")
+                    if state != STATE_QUEUED:
+                        meter.record(0, success=False)
+                    print(f"\n  ✗ Session {job['session_id']}: {error}")
+            report()
+    except KeyboardInterrupt:
+        print("\n⚠️ Abgebrochen - erneuter Aufruf setzt die Transkription fort")
+        executor.shutdown(wait=False, cancel_futures=True)
+        return 1
+
+    executor.shutdown(wait=True)
+    stats = meter.snapshot(0, 0)
+    print()
+    print(f"✅ Transkribiert: {stats['done']}, Fehler: {stats['failed']}, "
+          f"Dauer: {format_eta(stats['elapsed'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+Wendet einen Prompt auf viele Sessions an (Kommandozeile)
+
+Direkt (parallel, mit Rate Limit) oder über die OpenAI Batch API
+(günstiger, Ergebnisse innerhalb von 24 h). Sessions, die schon ein
+Ergebnis für den Prompt haben, werden übersprungen (--overwrite erzwingt).
+
+Verwendung:
+    python transform_batch.py --prompt zusammenfassen --from 2025-06-02 --to 2025-06-08
+    python transform_batch.py --prompt zusammenfassen --batch-file woche.jsonl
+    python transform_batch.py --prompt zusammenfassen --submit
+    python transform_batch.py --collect batch_abc123
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+from data.repo import SessionRepository
+from services.audio_session_service import AudioSessionService
+from services.batch_transform import BatchTransformer, select_sessions
+from services.throughput import RateLimiter, format_eta
+from settings import SettingsManager
+
+
+def main():
+    """Hauptfunktion"""
+    settings = SettingsManager.instance()
+
+    parser = argparse.ArgumentParser(description="Einen Prompt auf viele Sessions anwenden")
+    parser.add_argument("--prompt", default="zusammenfassen", help="Prompt-ID")
+    parser.add_argument("--db", default="data/sessions.db", help="Pfad zur Session-Datenbank")
+    parser.add_argument("--api-key", default=None,
+                        help="OpenAI API Key (Standard: OPENAI_API_KEY oder App-Einstellungen)")
+    parser.add_argument("--base-url", default=None,
+                        help="Alternativer API-Endpunkt, z.B. ein lokaler Test-Server")
+    parser.add_argument("--search", default="", help="Suchbegriff (Titel, Notizen, Transkript)")
+    parser.add_argument("--from", dest="date_from", default=None, help="Aufgenommen ab (ISO-Datum)")
+    parser.add_argument("--to", dest="date_to", default=None, help="Aufgenommen bis (ISO-Datum)")
+    parser.add_argument("--overwrite", action="store_true", help="Vorhandene Ergebnisse neu erzeugen")
+    parser.add_argument("--reasoning", default="medium", help="minimal | low | medium | high")
+    parser.add_argument("--verbosity", default="low", help="low | medium | high")
+    parser.add_argument("--workers", type=int, default=settings.get_transcription_workers(),
+                        help="Gleichzeitige Transformationen")
+    parser.add_argument("--rpm", type=int, default=settings.get_rate_limit_rpm(),
+                        help="Maximale API-Anfragen pro Minute (0 = unbegrenzt)")
+    parser.add_argument("--tpm", type=int, default=settings.get_rate_limit_tpm(),
+                        help="Maximale Tokens pro Minute (0 = unbegrenzt)")
+    parser.add_argument("--batch-file", default=None,
+                        help="Nur Batch-API-Datei (JSONL) schreiben statt direkt zu transformieren")
+    parser.add_argument("--submit", action="store_true",
+                        help="Batch-Datei schreiben und bei der Batch API einreichen")
+    parser.add_argument("--collect", metavar="BATCH_ID", default=None,
+                        help="Ergebnisse eines eingereichten Batches abholen und speichern")
+    parser.add_argument("--dry-run", action="store_true", help="Nur anzeigen, was verarbeitet würde")
+    args = parser.parse_args()
+
+    api_key = args.api_key or os.environ.get("OPENAI_API_KEY") or settings.get_openai_api_key()
+    needs_key = not (args.dry_run or (args.batch_file and not args.submit))
+    if not api_key and needs_key:
+        print("✗ Kein API Key (--api-key, OPENAI_API_KEY oder App-Einstellungen)")
+        return 1
+
+    repo = SessionRepository(args.db)
+    service = AudioSessionService(
+        api_key=api_key,
+        base_url=args.base_url,
+        hash_index=repo.hashes,
+        timeout=settings.get_api_timeout(),
+        max_retries=settings.get_api_max_retries(),
+        rate_limiter=RateLimiter(args.rpm, args.tpm)
+    )
+    transformer = BatchTransformer(service, repo)
+
+    if args.collect:
+        result = transformer.collect_batch(args.collect)
+        if not result["success"]:
+            print(f"✗ {result['error']}")
+            return 1
+        if result["status"] != "completed":
+            print(f"⏳ Batch {args.collect}: {result['status']}")
+        return 0
+
+    filters = {"search_term": args.search, "date_from": args.date_from, "date_to": args.date_to}
+    sessions = select_sessions(repo, args.prompt, filters, overwrite=args.overwrite)
+    print(f"📋 {len(sessions)} Sessions für Prompt '{args.prompt}'")
+
+    if args.dry_run:
+        for session in sessions:
+            print(f"  {session['id']:>6}  {session['title']}")
+        return 0
+    if not sessions:
+        return 0
+
+    if args.batch_file or args.submit:
+        path = args.batch_file or os.path.join(tempfile.gettempdir(), f"batch_{args.prompt}.jsonl")
+        result = transformer.build_batch_file(sessions, args.prompt, path, args.reasoning, args.verbosity)
+        if not result["success"]:
+            print(f"✗ {result['error']}")
+            return 1
+        if result["skipped"]:
+            print(f"  Zu lang für die Batch API (direkt verarbeiten): {result['skipped']}")
+        if not args.submit:
+            return 0
+
+        result = transformer.submit_batch(path, args.prompt)
+        if not result["success"]:
+            print(f"✗ {result['error']}")
+            return 1
+        print(f"   Abholen mit: python transform_batch.py --collect {result['batch_id']}")
+        return 0
+
+    def report(stats):
+        print(f"\r📝 {stats['done']} fertig, {stats['failed']} Fehler, {stats['remaining']} offen"
+              f" · {stats['jobs_per_min']:.1f}/min · {stats['tokens_per_min']:.0f} Tokens/min"
+              f" · Rest {format_eta(stats['eta'])}   ", end="", flush=True)
+
+    try:
+        result = transformer.run(
+            sessions, args.prompt, args.reasoning, args.verbosity,
+            max_workers=args.workers,
+            progress_callback=report
+        )
+    except KeyboardInterrupt:
+        print("\n⚠️ Abgebrochen - erneuter Aufruf überspringt bereits gespeicherte Ergebnisse")
+        return 1
+
+    print()
+    for session_id, error in result["errors"]:
+        print(f"  ✗ Session {session_id}: {error}")
+    return 0 if not result["failed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
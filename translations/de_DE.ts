@@ -113,6 +113,146 @@ Die Audiodatei bleibt erhalten.</translation>
         <source>Export fehlgeschlagen:
 {0}</source>
         <translation>Export fehlgeschlagen:
+{0}</translation>
+    </message>
+    <message>
+        <source>JSON Lines (*.jsonl)</source>
+        <translation>JSON Lines (*.jsonl)</translation>
+    </message>
+    <message>
+        <source>Parquet Dateien (*.parquet)</source>
+        <translation>Parquet Dateien (*.parquet)</translation>
+    </message>
+    <message>
+        <source>Exportiere Sessions...</source>
+        <translation>Exportiere Sessions...</translation>
+    </message>
+    <message>
+        <source>Abbrechen</source>
+        <translation>Abbrechen</translation>
+    </message>
+    <message>
+        <source>Export</source>
+        <translation>Export</translation>
+    </message>
+    <message>
+        <source>Import</source>
+        <translation>Import</translation>
+    </message>
+    <message>
+        <source>Audio-Archiv importieren</source>
+        <translation>Audio-Archiv importieren</translation>
+    </message>
+    <message>
+        <source>Importiere Audio-Dateien...</source>
+        <translation>Importiere Audio-Dateien...</translation>
+    </message>
+    <message>
+        <source>Importiert: {0}
+Bereits vorhanden: {1}
+Dubletten: {2}
+Fehler: {3}</source>
+        <translation>Importiert: {0}
+Bereits vorhanden: {1}
+Dubletten: {2}
+Fehler: {3}</translation>
+    </message>
+    <message>
+        <source>Import fehlgeschlagen:
+{0}</source>
+        <translation>Import fehlgeschlagen:
+{0}</translation>
+    </message>
+    <message>
+        <source>Möchten Sie {0} Sessions wirklich löschen?
+
+⚠️ Die Audiodateien werden ebenfalls permanent gelöscht!</source>
+        <translation>Möchten Sie {0} Sessions wirklich löschen?
+
+⚠️ Die Audiodateien werden ebenfalls permanent gelöscht!</translation>
+    </message>
+    <message>
+        <source>Sessions wurden gelöscht, aber {0} Audiodateien konnten nicht gelöscht werden:
+{1}</source>
+        <translation>Sessions wurden gelöscht, aber {0} Audiodateien konnten nicht gelöscht werden:
+{1}</translation>
+    </message>
+    <message>
+        <source>Kein OpenAI API Key gesetzt. Bitte in den Einstellungen hinterlegen.</source>
+        <translation>Kein OpenAI API Key gesetzt. Bitte in den Einstellungen hinterlegen.</translation>
+    </message>
+    <message>
+        <source>Alle transkribieren</source>
+        <translation>Alle transkribieren</translation>
+    </message>
+    <message>
+        <source>Alle Sessions ohne Transkript (oder mit Fehler) zur Transkription einreihen</source>
+        <translation>Alle Sessions ohne Transkript (oder mit Fehler) zur Transkription einreihen</translation>
+    </message>
+    <message>
+        <source>Transkription {0}/{1}</source>
+        <translation>Transkription {0}/{1}</translation>
+    </message>
+    <message>
+        <source>{0:.1f}× Echtzeit</source>
+        <translation>{0:.1f}× Echtzeit</translation>
+    </message>
+    <message>
+        <source>Rest {0}</source>
+        <translation>Rest {0}</translation>
+    </message>
+    <message>
+        <source>Alle Sessions sind bereits transkribiert.</source>
+        <translation>Alle Sessions sind bereits transkribiert.</translation>
+    </message>
+    <message>
+        <source>{0} Sessions ({1:.1f} h Audio) zur Transkription einreihen?</source>
+        <translation>{0} Sessions ({1:.1f} h Audio) zur Transkription einreihen?</translation>
+    </message>
+    <message>
+        <source>Prompt anwenden</source>
+        <translation>Prompt anwenden</translation>
+    </message>
+    <message>
+        <source>Einen Prompt auf alle ausgewählten bzw. gefilterten Sessions mit Transkript anwenden</source>
+        <translation>Einen Prompt auf alle ausgewählten bzw. gefilterten Sessions mit Transkript anwenden</translation>
+    </message>
+    <message>
+        <source>Batch-Transformation abbrechen?</source>
+        <translation>Batch-Transformation abbrechen?</translation>
+    </message>
+    <message>
+        <source>Prompt:</source>
+        <translation>Prompt:</translation>
+    </message>
+    <message>
+        <source>Alle passenden Sessions haben bereits ein Ergebnis für diesen Prompt.</source>
+        <translation>Alle passenden Sessions haben bereits ein Ergebnis für diesen Prompt.</translation>
+    </message>
+    <message>
+        <source>"{0}" auf {1} Sessions anwenden?</source>
+        <translation>"{0}" auf {1} Sessions anwenden?</translation>
+    </message>
+    <message>
+        <source>Prompt {0}/{1}</source>
+        <translation>Prompt {0}/{1}</translation>
+    </message>
+    <message>
+        <source>{0:.0f}/min</source>
+        <translation>{0:.0f}/min</translation>
+    </message>
+    <message>
+        <source>{0} Ergebnisse gespeichert ({1} aus dem Cache), {2} Fehler.</source>
+        <translation>{0} Ergebnisse gespeichert ({1} aus dem Cache), {2} Fehler.</translation>
+    </message>
+    <message>
+        <source>Abgebrochen.</source>
+        <translation>Abgebrochen.</translation>
+    </message>
+    <message>
+        <source>Batch-Transformation fehlgeschlagen:
+{0}</source>
+        <translation>Batch-Transformation fehlgeschlagen:
 {0}</translation>
     </message>
 </context>
@@ -162,6 +302,26 @@ Die Audiodatei bleibt erhalten.</translation>
         <source>Speichern</source>
         <translation>Speichern</translation>
     </message>
+    <message>
+        <source>Parallele Uploads:</source>
+        <translation>Parallele Uploads:</translation>
+    </message>
+    <message>
+        <source>Gleichzeitige Transkriptionen:</source>
+        <translation>Gleichzeitige Transkriptionen:</translation>
+    </message>
+    <message>
+        <source>Anfragen/Minute:</source>
+        <translation>Anfragen/Minute:</translation>
+    </message>
+    <message>
+        <source>Tokens/Minute:</source>
+        <translation>Tokens/Minute:</translation>
+    </message>
+    <message>
+        <source>Unbegrenzt</source>
+        <translation>Unbegrenzt</translation>
+    </message>
 </context>
 <context>
     <name>AIView</name>
@@ -313,6 +473,26 @@ Session ID: {1}</translation>
         <source>Keine Transkription vorhanden. Klicken Sie auf 'Transkription starten'.</source>
         <translation>Keine Transkription vorhanden. Klicken Sie auf 'Transkription starten'.</translation>
     </message>
+    <message>
+        <source>Abbrechen</source>
+        <translation>Abbrechen</translation>
+    </message>
+    <message>
+        <source>Modell: {0} · erstes Token nach {1:.1f} s</source>
+        <translation>Modell: {0} · erstes Token nach {1:.1f} s</translation>
+    </message>
+    <message>
+        <source>Aus dem Cache · Modell: {0} · erstellt {1} · {2} Tokens gespart</source>
+        <translation>Aus dem Cache · Modell: {0} · erstellt {1} · {2} Tokens gespart</translation>
+    </message>
+    <message>
+        <source>Umschalt+Klick: neu generieren statt Ergebnis aus dem Cache</source>
+        <translation>Umschalt+Klick: neu generieren statt Ergebnis aus dem Cache</translation>
+    </message>
+    <message>
+        <source>Abgebrochen · Teilergebnis wird nicht gespeichert</source>
+        <translation>Abgebrochen · Teilergebnis wird nicht gespeichert</translation>
+    </message>
 </context>
 <context>
     <name>PlayerWidget</name>
@@ -442,5 +622,28 @@ Session ID: {1}</translation>
         <source>Notizen</source>
         <translation>Notizen</translation>
     </message>
+    <message>
+        <source>{0} Session(s) transkribieren</source>
+        <translation>{0} Session(s) transkribieren</translation>
+    </message>
+    <message>
+        <source>{0} Session(s) exportieren</source>
+        <translation>{0} Session(s) exportieren</translation>
+    </message>
+    <message>
+        <source>{0} Session(s) löschen</source>
+        <translation>{0} Session(s) löschen</translation>
+    </message>
+</context>
+<context>
+    <name>PromptEditorDialog</name>
+    <message>
+        <source>Modell:</source>
+        <translation>Modell:</translation>
+    </message>
+    <message>
+        <source>Automatisch</source>
+        <translation>Automatisch</translation>
+    </message>
 </context>
 </TS>
@@ -113,6 +113,146 @@ The audio file will be preserved.</translation>
         <source>Export fehlgeschlagen:
 {0}</source>
         <translation>Export failed:
+{0}</translation>
+    </message>
+    <message>
+        <source>JSON Lines (*.jsonl)</source>
+        <translation>JSON Lines (*.jsonl)</translation>
+    </message>
+    <message>
+        <source>Parquet Dateien (*.parquet)</source>
+        <translation>Parquet files (*.parquet)</translation>
+    </message>
+    <message>
+        <source>Exportiere Sessions...</source>
+        <translation>Exporting sessions...</translation>
+    </message>
+    <message>
+        <source>Abbrechen</source>
+        <translation>Cancel</translation>
+    </message>
+    <message>
+        <source>Export</source>
+        <translation>Export</translation>
+    </message>
+    <message>
+        <source>Import</source>
+        <translation>Import</translation>
+    </message>
+    <message>
+        <source>Audio-Archiv importieren</source>
+        <translation>Import audio archive</translation>
+    </message>
+    <message>
+        <source>Importiere Audio-Dateien...</source>
+        <translation>Importing audio files...</translation>
+    </message>
+    <message>
+        <source>Importiert: {0}
+Bereits vorhanden: {1}
+Dubletten: {2}
+Fehler: {3}</source>
+        <translation>Imported: {0}
+Already present: {1}
+Duplicates: {2}
+Errors: {3}</translation>
+    </message>
+    <message>
+        <source>Import fehlgeschlagen:
+{0}</source>
+        <translation>Import failed:
+{0}</translation>
+    </message>
+    <message>
+        <source>Möchten Sie {0} Sessions wirklich löschen?
+
+⚠️ Die Audiodateien werden ebenfalls permanent gelöscht!</source>
+        <translation>Do you really want to delete {0} sessions?
+
+⚠️ The audio files will also be permanently deleted!</translation>
+    </message>
+    <message>
+        <source>Sessions wurden gelöscht, aber {0} Audiodateien konnten nicht gelöscht werden:
+{1}</source>
+        <translation>Sessions were deleted, but {0} audio files could not be deleted:
+{1}</translation>
+    </message>
+    <message>
+        <source>Kein OpenAI API Key gesetzt. Bitte in den Einstellungen hinterlegen.</source>
+        <translation>No OpenAI API key set. Please add it in the settings.</translation>
+    </message>
+    <message>
+        <source>Alle transkribieren</source>
+        <translation>Transcribe all</translation>
+    </message>
+    <message>
+        <source>Alle Sessions ohne Transkript (oder mit Fehler) zur Transkription einreihen</source>
+        <translation>Queue all sessions without a transcript (or with an error) for transcription</translation>
+    </message>
+    <message>
+        <source>Transkription {0}/{1}</source>
+        <translation>Transcription {0}/{1}</translation>
+    </message>
+    <message>
+        <source>{0:.1f}× Echtzeit</source>
+        <translation>{0:.1f}× real time</translation>
+    </message>
+    <message>
+        <source>Rest {0}</source>
+        <translation>{0} left</translation>
+    </message>
+    <message>
+        <source>Alle Sessions sind bereits transkribiert.</source>
+        <translation>All sessions are already transcribed.</translation>
+    </message>
+    <message>
+        <source>{0} Sessions ({1:.1f} h Audio) zur Transkription einreihen?</source>
+        <translation>Queue {0} sessions ({1:.1f} h of audio) for transcription?</translation>
+    </message>
+    <message>
+        <source>Prompt anwenden</source>
+        <translation>Apply prompt</translation>
+    </message>
+    <message>
+        <source>Einen Prompt auf alle ausgewählten bzw. gefilterten Sessions mit Transkript anwenden</source>
+        <translation>Apply a prompt to all selected or filtered sessions with a transcript</translation>
+    </message>
+    <message>
+        <source>Batch-Transformation abbrechen?</source>
+        <translation>Cancel batch transformation?</translation>
+    </message>
+    <message>
+        <source>Prompt:</source>
+        <translation>Prompt:</translation>
+    </message>
+    <message>
+        <source>Alle passenden Sessions haben bereits ein Ergebnis für diesen Prompt.</source>
+        <translation>All matching sessions already have a result for this prompt.</translation>
+    </message>
+    <message>
+        <source>"{0}" auf {1} Sessions anwenden?</source>
+        <translation>Apply "{0}" to {1} sessions?</translation>
+    </message>
+    <message>
+        <source>Prompt {0}/{1}</source>
+        <translation>Prompt {0}/{1}</translation>
+    </message>
+    <message>
+        <source>{0:.0f}/min</source>
+        <translation>{0:.0f}/min</translation>
+    </message>
+    <message>
+        <source>{0} Ergebnisse gespeichert ({1} aus dem Cache), {2} Fehler.</source>
+        <translation>{0} results saved ({1} from cache), {2} errors.</translation>
+    </message>
+    <message>
+        <source>Abgebrochen.</source>
+        <translation>Cancelled.</translation>
+    </message>
+    <message>
+        <source>Batch-Transformation fehlgeschlagen:
+{0}</source>
+        <translation>Batch transformation failed:
 {0}</translation>
     </message>
 </context>
@@ -210,6 +350,26 @@ The audio file will be preserved.</translation>
 
 {0}</translation>
     </message>
+    <message>
+        <source>Parallele Uploads:</source>
+        <translation>Parallel uploads:</translation>
+    </message>
+    <message>
+        <source>Gleichzeitige Transkriptionen:</source>
+        <translation>Concurrent transcriptions:</translation>
+    </message>
+    <message>
+        <source>Anfragen/Minute:</source>
+        <translation>Requests/minute:</translation>
+    </message>
+    <message>
+        <source>Tokens/Minute:</source>
+        <translation>Tokens/minute:</translation>
+    </message>
+    <message>
+        <source>Unbegrenzt</source>
+        <translation>Unlimited</translation>
+    </message>
 </context>
 <context>
     <name>AIView</name>
@@ -361,6 +521,26 @@ Session ID: {1}</translation>
         <source>Keine Transkription vorhanden. Klicken Sie auf 'Transkription starten'.</source>
         <translation>No transcription available. Click 'Start Transcription'.</translation>
     </message>
+    <message>
+        <source>Abbrechen</source>
+        <translation>Cancel</translation>
+    </message>
+    <message>
+        <source>Modell: {0} · erstes Token nach {1:.1f} s</source>
+        <translation>Model: {0} · first token after {1:.1f} s</translation>
+    </message>
+    <message>
+        <source>Aus dem Cache · Modell: {0} · erstellt {1} · {2} Tokens gespart</source>
+        <translation>From cache · Model: {0} · created {1} · {2} tokens saved</translation>
+    </message>
+    <message>
+        <source>Umschalt+Klick: neu generieren statt Ergebnis aus dem Cache</source>
+        <translation>Shift+click: regenerate instead of using the cached result</translation>
+    </message>
+    <message>
+        <source>Abgebrochen · Teilergebnis wird nicht gespeichert</source>
+        <translation>Cancelled · partial result is not saved</translation>
+    </message>
 </context>
 <context>
     <name>PlayerWidget</name>
@@ -490,5 +670,28 @@ Session ID: {1}</translation>
         <source>Notizen</source>
         <translation>Notes</translation>
     </message>
+    <message>
+        <source>{0} Session(s) transkribieren</source>
+        <translation>Transcribe {0} session(s)</translation>
+    </message>
+    <message>
+        <source>{0} Session(s) exportieren</source>
+        <translation>Export {0} session(s)</translation>
+    </message>
+    <message>
+        <source>{0} Session(s) löschen</source>
+        <translation>Delete {0} session(s)</translation>
+    </message>
+</context>
+<context>
+    <name>PromptEditorDialog</name>
+    <message>
+        <source>Modell:</source>
+        <translation>Model:</translation>
+    </message>
+    <message>
+        <source>Automatisch</source>
+        <translation>Automatic</translation>
+    </message>
 </context>
 </TS>
@@ -3,16 +3,18 @@ AI-View für Transkription und Textverarbeitung
 """
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QPushButton,
                                QLabel, QComboBox, QTextEdit, QGroupBox,
-                               QSplitter, QToolBar, QSizePolicy, QMessageBox)
-from PySide6.QtCore import Qt, Signal, QEvent
-import qtawesome as qta
+                               QSplitter, QToolBar, QSizePolicy, QMessageBox, QApplication)
+from PySide6.QtCore import Qt, Signal, QEvent, QDateTime
+from PySide6.QtGui import QTextCursor
 import sys
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
 from translatable_widget import TranslatableWidget
+from ui.icon_cache import IconCache
 from data.repo import SessionRepository
+from data.artifacts import KIND_TRANSFORM
 from services.workers import TranscriptionWorker, TransformationWorker
 from settings import SettingsManager
 
@@ -30,9 +32,12 @@ class AIView(TranslatableWidget, QWidget):
         self.current_session_id = None
         self.current_session_path = None
         self.repo = SessionRepository()
-        self.settings_manager = SettingsManager()
+        self.settings_manager = SettingsManager.instance()
         self.transcription_worker = None
         self.transformation_worker = None
+        self._transform_session_id = None  # Session der laufenden Transformation
+        self._transform_prompt_id = None   # Prompt der laufenden Transformation
+        self._cancelled_workers = []       # Abgebrochene Worker bis zum Thread-Ende halten
         # Gemeinsame Farbpalette für den Dark Mode
         self._colors = {
             "background": "#000e22",
@@ -48,6 +53,8 @@ class AIView(TranslatableWidget, QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         self._setup_ui()
         self.load_prompts()
+        # Prompt-Liste folgt Änderungen im Settings-Store (Editor, Sprachwechsel)
+        self.settings_manager.prompts_changed.connect(self.load_prompts)
 
     def _setup_ui(self):
         """Initialisiert die Benutzeroberfläche"""
@@ -286,6 +293,7 @@ class AIView(TranslatableWidget, QWidget):
         self.prompt_combo = QComboBox()
         # Prompts werden dynamisch geladen in load_prompts()
         self.prompt_combo.setMinimumWidth(200)
+        self.prompt_combo.currentIndexChanged.connect(self._on_prompt_changed)
         toolbar.addWidget(self.prompt_combo)
 
         # Generieren-Button
@@ -310,7 +318,7 @@ class AIView(TranslatableWidget, QWidget):
         toolbar.addSeparator()
 
         self.settings_button = QPushButton()
-        self.settings_button.setIcon(qta.icon('fa5s.cog', color='#000e22'))
+        self.settings_button.setIcon(IconCache.instance().icon('fa5s.cog', '#000e22'))
         self.settings_button.setToolTip(self.tr("Einstellungen"))
         self.settings_button.setStyleSheet("""
             QPushButton {
@@ -379,9 +387,28 @@ class AIView(TranslatableWidget, QWidget):
             )
             self.transcribe_button.show()
 
-        # Rechte Seite leeren
+        # Rechte Seite: gespeichertes Ergebnis für aktuellen Prompt anzeigen
+        self._show_stored_transformation()
+
+    def _on_prompt_changed(self, index: int):
+        """Zeigt beim Prompt-Wechsel das gespeicherte Ergebnis an"""
+        # Während einer laufenden Transformation nicht überschreiben
+        if self._transform_session_id is not None:
+            return
+        self._show_stored_transformation()
+
+    def _show_stored_transformation(self):
+        """Lädt ein früheres Ergebnis für Session + Prompt (ohne neuen API-Call)"""
         self.transformed_edit.clear()
 
+        prompt_id = self.prompt_combo.currentData()
+        if not self.current_session_id or not prompt_id:
+            return
+
+        stored = self.repo.artifacts.load(self.current_session_id, KIND_TRANSFORM, prompt_id)
+        if stored:
+            self.transformed_edit.setPlainText(stored)
+
     def _on_transcribe_clicked(self):
         """Wird aufgerufen wenn 'Transkription starten' geklickt wird"""
         # Prüfe API Key
@@ -469,7 +496,11 @@ class AIView(TranslatableWidget, QWidget):
         self.transcribe_button.setText(self.tr("Transkription starten"))
 
     def _on_generate_clicked(self):
-        """Wird aufgerufen wenn Generieren geklickt wird"""
+        """Wird aufgerufen wenn Generieren geklickt wird (während Streaming: Abbrechen)"""
+        if self._transform_session_id is not None:
+            self._cancel_transformation()
+            return
+
         # Prüfe ob Transkript vorhanden
         if not self.transcription_edit.toPlainText():
             QMessageBox.warning(
@@ -489,9 +520,8 @@ class AIView(TranslatableWidget, QWidget):
             )
             return
 
-        # Button deaktivieren
-        self.generate_button.setEnabled(False)
-        self.generate_button.setText(self.tr("Generiere..."))
+        # Button wird zum Abbrechen-Button
+        self.generate_button.setText(self.tr("Abbrechen"))
 
         # Prompt-ID aus Dropdown ermitteln
         prompt_id = self.prompt_combo.currentData()
@@ -503,27 +533,127 @@ class AIView(TranslatableWidget, QWidget):
             else:
                 prompt_id = "zusammenfassen"  # Hard fallback
 
+        # Umschalt+Klick erzwingt eine neue Generierung (Cache umgehen)
+        use_cache = not (QApplication.keyboardModifiers() & Qt.KeyboardModifier.ShiftModifier)
+
         # Worker starten
         text = self.transcription_edit.toPlainText()
+        self._transform_session_id = self.current_session_id
+        self._transform_prompt_id = prompt_id
+        self.transformed_edit.clear()
+        self.transformed_edit.setToolTip("")
         self.transformation_worker = TransformationWorker(
             text=text,
             prompt_id=prompt_id,
             api_key=api_key,
             reasoning="medium",
-            verbosity="low"
+            verbosity="low",
+            use_cache=use_cache
         )
         self.transformation_worker.progress.connect(self._on_transformation_progress)
         self.transformation_worker.finished.connect(self._on_transformation_finished)
         self.transformation_worker.error.connect(self._on_transformation_error)
+        self.transformation_worker.delta.connect(self._on_transformation_delta)
         self.transformation_worker.start()
 
+    def _on_transformation_delta(self, text: str):
+        """Hängt gestreamten Text an (nur wenn die Session noch geöffnet ist)"""
+        if self._transform_session_id != self.current_session_id:
+            return
+        cursor = self.transformed_edit.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(text)
+
+    def _cancel_transformation(self):
+        """Bricht die laufende Transformation ab, der Teiltext bleibt sichtbar"""
+        worker = self.transformation_worker
+        if worker is not None:
+            worker.cancel()
+            # Späte Signale gehen nicht mehr an die Anzeige, das Ende des Threads räumt auf
+            for signal in (worker.finished, worker.error, worker.delta, worker.progress):
+                signal.disconnect()
+            worker.cancelled.connect(self._on_transformation_cancelled)
+            worker.finished.connect(self._on_cancelled_worker_done)
+            worker.error.connect(self._on_cancelled_worker_done)
+            worker.session_id = self._transform_session_id
+            self._cancelled_workers.append(worker)
+            self.transformation_worker = None
+
+        self._transform_session_id = None
+        self.generate_button.setText(self.tr("Generieren"))
+
+    def _release_transformation_worker(self):
+        """Gibt den Worker frei (Signale kommen aus run(), der Thread kann noch laufen)"""
+        if self.transformation_worker is not None:
+            self.transformation_worker.wait()
+            self.transformation_worker = None
+
+    def _on_transformation_cancelled(self, result: dict):
+        """Abgebrochene Transformation: Teiltext bleibt sichtbar, wird aber nicht gespeichert"""
+        worker = self.sender()
+        print(f"Transformation abgebrochen, Teilergebnis ({len(result.get('result', ''))} Zeichen) nicht gespeichert")
+        # Hinweis nur, solange der Teiltext noch angezeigt wird (keine neue Transformation)
+        if (self.transformation_worker is None and worker is not None
+                and worker.session_id == self.current_session_id):
+            self.transformed_edit.setToolTip(self.tr("Abgebrochen · Teilergebnis wird nicht gespeichert"))
+        self._on_cancelled_worker_done()
+
+    def _on_cancelled_worker_done(self, *_args):
+        """Letztes Signal eines abgebrochenen Workers: Thread abwarten und freigeben"""
+        worker = self.sender()
+        if worker in self._cancelled_workers:
+            self._cancelled_workers.remove(worker)
+            worker.wait()
+            worker.deleteLater()
+
+    def shutdown(self):
+        """Bricht laufende Transformationen ab und wartet auf die Threads (beim Schließen)"""
+        self._cancel_transformation()
+        for worker in self._cancelled_workers:
+            worker.wait()
+        self._cancelled_workers = []
+
+    def closeEvent(self, event):
+        """Threads nicht laufend zerstören"""
+        self.shutdown()
+        super().closeEvent(event)
+
     def _on_transformation_progress(self, message: str):
         """Progress-Update von Transformation"""
         self.transformed_edit.setPlaceholderText(message)
 
     def _on_transformation_finished(self, result: dict):
         """Transformation abgeschlossen"""
-        self.transformed_edit.setPlainText(result['result'])
+        # Ergebnis pro Session, Prompt und Modell speichern
+        if self._transform_session_id:
+            self.repo.artifacts.save(
+                self._transform_session_id,
+                KIND_TRANSFORM,
+                result['result'],
+                prompt_id=self._transform_prompt_id,
+                model=result.get('model', ''),
+                tokens=result.get('tokens_used')
+            )
+
+        # Nur anzeigen wenn die Session noch geöffnet ist (Text kam bereits gestreamt)
+        if self._transform_session_id == self.current_session_id:
+            if self.transformed_edit.toPlainText() != result['result']:
+                self.transformed_edit.setPlainText(result['result'])
+            if result.get('cached'):
+                created = QDateTime.fromString(result.get('cached_at', '')[:19], Qt.DateFormat.ISODate)
+                self.transformed_edit.setToolTip(
+                    self.tr("Aus dem Cache · Modell: {0} · erstellt {1} · {2} Tokens gespart").format(
+                        result.get('model', ''),
+                        created.toString("dd.MM.yyyy HH:mm"),
+                        result.get('tokens_saved', 0))
+                )
+            elif result.get('ttft') is not None:
+                self.transformed_edit.setToolTip(
+                    self.tr("Modell: {0} · erstes Token nach {1:.1f} s").format(
+                        result.get('model', ''), result['ttft'])
+                )
+        self._transform_session_id = None
+        self._release_transformation_worker()
 
         # Button zurücksetzen
         self.generate_button.setEnabled(True)
@@ -536,6 +666,8 @@ class AIView(TranslatableWidget, QWidget):
             self.tr("Transformation fehlgeschlagen"),
             self.tr("Fehler: {0}").format(error_message)
         )
+        self._transform_session_id = None
+        self._release_transformation_worker()
 
         # Button zurücksetzen
         self.generate_button.setEnabled(True)
@@ -563,6 +695,7 @@ class AIView(TranslatableWidget, QWidget):
         self.load_prompts()
 
         self.generate_button.setText(self.tr("Generieren"))
+        self.generate_button.setToolTip(self.tr("Umschalt+Klick: neu generieren statt Ergebnis aus dem Cache"))
         self.settings_button.setToolTip(self.tr("Einstellungen"))
 
     def changeEvent(self, event):
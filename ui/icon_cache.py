@@ -0,0 +1,107 @@
+"""
+Gemeinsamer Cache für qtawesome-Icons und -Pixmaps
+
+qtawesome rendert jedes Icon über eine Icon-Font (QPainter + Glyphe); auf
+dem Raspberry Pi kostet das pro Pixmap spürbar Zeit. Die Sessions-Tabelle
+braucht pro Zeile und Aktualisierung ein Status-Pixmap, obwohl es nur eine
+Handvoll verschiedener gibt. Der Cache rendert jede Kombination aus
+(Name, Farbe, Größe, Device Pixel Ratio) einmal; QPixmap ist implizit
+geteilt, Labels und der Status-Delegate der Tabelle nutzen dieselben Daten.
+
+Nur im GUI-Thread verwenden (QPixmap ist nicht thread-sicher).
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from PySide6.QtCore import QSize, QTimer
+from PySide6.QtGui import QGuiApplication, QIcon, QPixmap
+import qtawesome as qta
+
+
+class IconCache:
+    """Rendert qtawesome-Icons einmal und gibt danach die gecachten Objekte zurück"""
+
+    # Globale Instanz (MainWindow, PlayerWidget, AIView und Tabelle teilen sie)
+    _instance: Optional['IconCache'] = None
+
+    def __init__(self):
+        self._icons: Dict[Tuple[str, str], QIcon] = {}
+        self._pixmaps: Dict[Tuple[str, str, int, float], QPixmap] = {}
+        self._pending: List[Tuple[str, str, int, float]] = []
+
+    @classmethod
+    def instance(cls) -> 'IconCache':
+        """Gibt die globale Instanz zurück"""
+        if cls._instance is None:
+            cls._instance = IconCache()
+        return cls._instance
+
+    @staticmethod
+    def _device_pixel_ratio() -> float:
+        """Device Pixel Ratio des Bildschirms (1.0 ohne QGuiApplication)"""
+        app = QGuiApplication.instance()
+        return app.devicePixelRatio() if app is not None else 1.0
+
+    def icon(self, name: str, color: str) -> QIcon:
+        """
+        QIcon für Buttons (skaliert mit der Button-Größe)
+
+        Das Icon rendert beim Zeichnen weiterhin über qtawesome, damit
+        Größe und Disabled-Darstellung stimmen; gecacht wird das Objekt.
+        """
+        key = (name, color)
+        icon = self._icons.get(key)
+        if icon is None:
+            icon = self._icons[key] = qta.icon(name, color=color)
+        return icon
+
+    def pixmap(self, name: str, color: str, size: int, dpr: Optional[float] = None) -> QPixmap:
+        """
+        Fertig gerendertes, quadratisches Pixmap (z.B. für QLabel)
+
+        Args:
+            name: qtawesome-Name, z.B. "fa5s.check-circle"
+            color: Farbe, z.B. "#4caf50"
+            size: Kantenlänge in logischen Pixeln
+            dpr: Device Pixel Ratio (Standard: Bildschirm der App)
+        """
+        key = (name, color, size, dpr or self._device_pixel_ratio())
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            pixmap = self._render(key)
+        return pixmap
+
+    def _render(self, key: Tuple[str, str, int, float]) -> QPixmap:
+        """Rendert ein Pixmap über qtawesome und legt es im Cache ab"""
+        name, color, size, dpr = key
+        pixmap = self._pixmaps[key] = self.icon(name, color).pixmap(QSize(size, size), dpr)
+        return pixmap
+
+    def prewarm(self, specs: Iterable[Tuple[str, str, int]], dpr: Optional[float] = None):
+        """
+        Rendert Pixmaps im Voraus, ohne die Event-Loop zu blockieren
+
+        Pro Durchlauf der Event-Loop wird ein Pixmap gerendert, damit
+        Eingaben und Zeichnen dazwischen weiterlaufen.
+
+        Args:
+            specs: (Name, Farbe, Größe) Tupel
+            dpr: Device Pixel Ratio (Standard: Bildschirm der App)
+        """
+        dpr = dpr or self._device_pixel_ratio()
+        start = not self._pending
+        self._pending.extend(
+            (name, color, size, dpr) for name, color, size in specs
+            if (name, color, size, dpr) not in self._pixmaps
+        )
+        if start and self._pending:
+            QTimer.singleShot(0, self._prewarm_next)
+
+    def _prewarm_next(self):
+        """Rendert das nächste vorgemerkte Pixmap"""
+        if not self._pending:
+            return
+        key = self._pending.pop(0)
+        if key not in self._pixmaps:
+            self._render(key)
+        if self._pending:
+            QTimer.singleShot(0, self._prewarm_next)
@@ -5,10 +5,9 @@ from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                                QPushButton, QLabel, QComboBox, QLineEdit,
                                QProgressBar, QSplitter, QGroupBox, QMessageBox,
                                QFileDialog, QToolBar, QSizePolicy, QScrollArea,
-                               QFrame, QStackedWidget)
+                               QFrame, QStackedWidget, QProgressDialog, QInputDialog)
 from PySide6.QtCore import Qt, QTimer, QEvent, QCoreApplication
 from PySide6.QtGui import QAction, QIcon, QPixmap
-import qtawesome as qta
 import sys
 import os
 from pathlib import Path
@@ -23,11 +22,17 @@ from ui.session_form import SessionFormWidget
 from ui.player_widget import PlayerWidget
 from ui.waveform_widget import WaveformWidget
 from ui.ai_view import AIView
-from ui.settings_dialog import SettingsDialog
 from settings import SettingsManager
 from simple_translator import SimpleTranslator
 from translatable_widget import TranslatableWidget
-from services.workers import TranscriptionWorker
+from ui.icon_cache import IconCache
+from services.workers import ExportWorker, ImportWorker, FileDeleteWorker, BatchTransformWorker
+from services.batch_transform import select_sessions
+from services.transcription_queue import TranscriptionQueue
+from data.jobs import PRIORITY_NORMAL, PRIORITY_LOW
+from services.throughput import format_eta
+from services.export_service import (parquet_available, format_from_path,
+                                     FORMAT_CSV, FORMAT_JSONL, FORMAT_PARQUET)
 from ui.responsive_layout import ResponsiveLayoutManager, ScreenSize
 
 
@@ -38,9 +43,14 @@ class MainWindow(TranslatableWidget, QMainWindow):
         super().__init__()
         self.recorder = AudioRecorder()
         self.repo = SessionRepository()
-        self.settings_manager = SettingsManager()
-        self.transcription_worker = None
-        self.current_transcribing_session_id = None
+        self.settings_manager = SettingsManager.instance()
+        self.transcription_queue = TranscriptionQueue(self.repo, self.settings_manager, self)
+        self.file_delete_worker = None
+        self.export_worker = None
+        self.export_progress_dialog = None
+        self.import_worker = None
+        self.import_progress_dialog = None
+        self.batch_transform_worker = None
 
         # Absoluter Pfad für Aufnahmen
         self.recordings_dir = Path.cwd() / "recordings"
@@ -75,12 +85,43 @@ class MainWindow(TranslatableWidget, QMainWindow):
 
         self._setup_ui()
         self._connect_signals()
-        self._load_sessions()
         self._setup_shortcuts()  # Keyboard Shortcuts (F11 für Fullscreen)
 
+        # Geräte-Scan, Sessions und Queue erst nach dem ersten Frame (siehe paintEvent)
+        self._startup_pending = True
+
         # Splash Screen als Overlay anzeigen
         self._show_splash_screen()
 
+    def paintEvent(self, event):
+        """Startet nach dem ersten gezeichneten Frame die restliche Initialisierung"""
+        super().paintEvent(event)
+        if self._startup_pending:
+            self._startup_pending = False
+            # singleShot: erst nach Abschluss dieses Frames, nicht mittendrin
+            QTimer.singleShot(0, self._finish_startup)
+
+    def closeEvent(self, event):
+        """Wartet beim Schließen auf abgebrochene Transformationen (kein laufender QThread)"""
+        self.ai_view.shutdown()
+        super().closeEvent(event)
+
+    def _finish_startup(self):
+        """
+        Verzögerte Initialisierung nach dem ersten Frame
+
+        Geräte-Scan (PortAudio) und Session-Liste dauern auf dem Raspberry Pi
+        spürbar; das Fenster (mit Splash) ist bis dahin schon sichtbar.
+        """
+        self._load_devices()
+        self._load_sessions()
+
+        # Beim letzten Beenden offene Transkriptionen fortsetzen
+        self.transcription_queue.resume()
+
+        # Restliche Status-Icons rendern, während das Fenster schon bedienbar ist
+        self.session_table.prewarm_icons()
+
     def _show_message(self, icon_type, title, message):
         """
         Zeigt QMessageBox ohne Icon (für Dark Theme)
@@ -472,14 +513,60 @@ class MainWindow(TranslatableWidget, QMainWindow):
                 background-color: #ff9922;
             }
         """)
-        self.export_button.clicked.connect(self._on_export_csv)
+        self.export_button.clicked.connect(lambda: self._on_export_csv())
         toolbar.addWidget(self.export_button)
 
+        # Import Button (Audio-Archive)
+        self.import_button = QPushButton(self.tr("Import"))
+        self.import_button.setToolTip(self.tr("Audio-Archiv importieren"))
+        self.import_button.setStyleSheet("""
+            QPushButton {
+                background-color: #ffaa3a;
+                color: #000e22;
+                font-weight: bold;
+                border-radius: 4px;
+                padding: 6px 16px;
+                font-size: 13px;
+            }
+            QPushButton:hover {
+                background-color: #ff9922;
+            }
+        """)
+        self.import_button.clicked.connect(self._on_import_archive)
+        toolbar.addWidget(self.import_button)
+
+        # Batch-Transkription (alle ohne Transkript oder mit Fehler)
+        self.transcribe_all_button = QPushButton(self.tr("Alle transkribieren"))
+        self.transcribe_all_button.setToolTip(
+            self.tr("Alle Sessions ohne Transkript (oder mit Fehler) zur Transkription einreihen")
+        )
+        self.transcribe_all_button.setStyleSheet(self.import_button.styleSheet())
+        self.transcribe_all_button.clicked.connect(self._on_transcribe_backlog)
+        toolbar.addWidget(self.transcribe_all_button)
+
+        # Fortschritt der Batch-Transkription (Durchsatz, Restdauer)
+        self.queue_status_label = QLabel()
+        self.queue_status_label.hide()
+        toolbar.addWidget(self.queue_status_label)
+
+        # Batch-Transformation (ein Prompt über ausgewählte bzw. gefilterte Sessions)
+        self.batch_transform_button = QPushButton(self.tr("Prompt anwenden"))
+        self.batch_transform_button.setToolTip(
+            self.tr("Einen Prompt auf alle ausgewählten bzw. gefilterten Sessions mit Transkript anwenden")
+        )
+        self.batch_transform_button.setStyleSheet(self.import_button.styleSheet())
+        self.batch_transform_button.clicked.connect(self._on_batch_transform)
+        toolbar.addWidget(self.batch_transform_button)
+
+        self.batch_status_label = QLabel()
+        self.batch_status_label.hide()
+        toolbar.addWidget(self.batch_status_label)
+
         # Settings-Button
         toolbar.addSeparator()
 
         self.toolbar_settings_button = QPushButton()
-        self.toolbar_settings_button.setIcon(qta.icon('fa5s.cog', color='#000e22'))
+        self.toolbar_settings_button.setIcon(IconCache.instance().icon('fa5s.cog', '#000e22'))
         self.toolbar_settings_button.setToolTip(self.tr("Einstellungen"))
         self.toolbar_settings_button.setStyleSheet("""
             QPushButton {
@@ -533,8 +620,7 @@ class MainWindow(TranslatableWidget, QMainWindow):
         device_layout = QHBoxLayout()
         self.mic_label = QLabel(self.tr("Mikrofon:"))
         device_layout.addWidget(self.mic_label)
-        self.device_combo = QComboBox()
-        self._load_devices()
+        self.device_combo = QComboBox()  # Geräte lädt _finish_startup()
         device_layout.addWidget(self.device_combo)
         layout.addLayout(device_layout)
 
@@ -616,7 +702,7 @@ class MainWindow(TranslatableWidget, QMainWindow):
 
         # Pause-Button
         self.pause_button = QPushButton(self.tr("Pausieren"))
-        self.pause_button.setIcon(qta.icon('fa5s.pause', color='#000e22'))
+        self.pause_button.setIcon(IconCache.instance().icon('fa5s.pause', '#000e22'))
         self.pause_button.clicked.connect(self._on_pause_clicked)
         self.pause_button.setVisible(False)  # Initial versteckt
         self.pause_button.setStyleSheet("""
@@ -643,8 +729,13 @@ class MainWindow(TranslatableWidget, QMainWindow):
 
     def _load_devices(self):
         """Lädt verfügbare Audiogeräte"""
-        devices = self.recorder.get_devices()
         self.device_combo.clear()
+        try:
+            devices = self.recorder.get_devices()
+        except (ImportError, OSError) as e:
+            # sounddevice wirft OSError, wenn PortAudio fehlt (z.B. headless)
+            print(f"⚠️ Audiogeräte nicht verfügbar: {e}")
+            return
 
         for device in devices:
             self.device_combo.addItem(device['name'], device['index'])
@@ -658,6 +749,9 @@ class MainWindow(TranslatableWidget, QMainWindow):
 
         # Table Selection
         self.session_table.session_selected.connect(self._on_session_selected)
+        self.session_table.bulk_delete_requested.connect(self._on_bulk_delete_requested)
+        self.session_table.bulk_transcribe_requested.connect(self._on_bulk_transcribe_requested)
+        self.session_table.bulk_export_requested.connect(self._on_bulk_export_requested)
 
         # Form Save
         self.session_form.save_requested.connect(self._on_save_session)
@@ -672,6 +766,11 @@ class MainWindow(TranslatableWidget, QMainWindow):
         self.ai_view.settings_requested.connect(self._on_settings_clicked)
         self.ai_view.transcription_completed.connect(self._on_transcription_status_update)
 
+        # Transkriptions-Queue
+        self.transcription_queue.status_changed.connect(self._on_queue_status_changed)
+        self.transcription_queue.progress.connect(self._on_queue_progress)
+        self.transcription_queue.stats_changed.connect(self._on_queue_stats)
+
     def _load_sessions(self, search_term: str = ''):
         """Lädt Sessions aus der Datenbank"""
         sessions = self.repo.get_all(search_term)
@@ -744,7 +843,7 @@ class MainWindow(TranslatableWidget, QMainWindow):
             # Pause-Button verstecken und zurücksetzen
             self.pause_button.setVisible(False)
             self.pause_button.setText(self.tr("Pausieren"))
-            self.pause_button.setIcon(qta.icon('fa5s.pause', color='#000e22'))
+            self.pause_button.setIcon(IconCache.instance().icon('fa5s.pause', '#000e22'))
             self.pause_button.setStyleSheet("""
                 QPushButton {
                     padding: 10px;
@@ -778,7 +877,7 @@ class MainWindow(TranslatableWidget, QMainWindow):
             self.waveform_widget.pause_recording()
 
             self.pause_button.setText(self.tr("Fortsetzen"))
-            self.pause_button.setIcon(qta.icon('fa5s.play', color='#000e22'))
+            self.pause_button.setIcon(IconCache.instance().icon('fa5s.play', '#000e22'))
             self.pause_button.setStyleSheet("""
                 QPushButton {
                     padding: 10px;
@@ -798,7 +897,7 @@ class MainWindow(TranslatableWidget, QMainWindow):
             self.waveform_widget.resume_recording()
 
             self.pause_button.setText(self.tr("Pausieren"))
-            self.pause_button.setIcon(qta.icon('fa5s.pause', color='#000e22'))
+            self.pause_button.setIcon(IconCache.instance().icon('fa5s.pause', '#000e22'))
             self.pause_button.setStyleSheet("""
                 QPushButton {
                     padding: 10px;
@@ -826,7 +925,8 @@ class MainWindow(TranslatableWidget, QMainWindow):
             duration_sec=duration,
             samplerate=self.recorder.samplerate,
             channels=self.recorder.channels,
-            notes=''
+            notes='',
+            content_hash=self.recorder.last_content_hash
         )
 
         # Tabelle aktualisieren
@@ -843,7 +943,7 @@ class MainWindow(TranslatableWidget, QMainWindow):
             self._start_background_transcription(session_id, output_path)
 
     def _start_background_transcription(self, session_id: int, audio_path: str):
-        """Startet die Hintergrund-Transkription einer Session"""
+        """Reiht eine Session zur Hintergrund-Transkription ein"""
         # Prüfe ob API Key vorhanden
         api_key = self.settings_manager.get_openai_api_key()
         if not api_key:
@@ -855,86 +955,146 @@ class MainWindow(TranslatableWidget, QMainWindow):
             print(f"Warnung: Audio-Datei nicht gefunden: {audio_path}")
             return
 
-        # Status in DB auf "pending" setzen
-        self.repo.set_transcription_status(session_id, "pending")
-        self.session_table.update_transcription_status(session_id, "pending", blink=False)
+        # Neue Aufnahmen vor wartender Bulk-Transkription
+        self.transcription_queue.enqueue(session_id, audio_path, priority=PRIORITY_NORMAL)
 
-        # Worker starten
-        self.current_transcribing_session_id = session_id
-        language = self.settings_manager.get_transcription_language()
+    def _on_queue_status_changed(self, session_id: int, status):
+        """Status-Änderung aus der Transkriptions-Queue"""
+        blink = (status == "completed")
+        self.session_table.update_transcription_status(session_id, status, blink=blink)
 
-        self.transcription_worker = TranscriptionWorker(
-            audio_path,
-            api_key,
-            language
-        )
-        self.transcription_worker.progress.connect(self._on_bg_transcription_progress)
-        self.transcription_worker.finished.connect(self._on_bg_transcription_finished)
-        self.transcription_worker.error.connect(self._on_bg_transcription_error)
-        self.transcription_worker.chunk_progress.connect(self._on_bg_chunk_progress)
-        self.transcription_worker.start()
-
-        print(f"Hintergrund-Transkription gestartet für Session {session_id}")
-
-    def _on_bg_transcription_progress(self, message: str):
-        """Progress-Update von Hintergrund-Transkription"""
-        # Optional: Status-Bar Message anzeigen
-        print(f"Transkription: {message}")
-
-    def _on_bg_chunk_progress(self, current: int, total: int):
-        """Chunk-Progress-Update von Hintergrund-Transkription"""
-        if not self.current_transcribing_session_id:
+    def _on_queue_stats(self, stats: dict):
+        """Zeigt Durchsatz und Restdauer der Transkriptions-Queue"""
+        if stats["remaining"] == 0:
+            self.queue_status_label.hide()
             return
 
-        # Tabelle aktualisieren mit Progress "3/8"
-        self.session_table.update_transcription_progress(
-            self.current_transcribing_session_id,
-            current,
-            total
-        )
+        total = stats["done"] + stats["failed"] + stats["remaining"]
+        text = self.tr("Transkription {0}/{1}").format(stats["done"] + stats["failed"], total)
+        if stats["speed"] > 0:
+            text += " · " + self.tr("{0:.1f}× Echtzeit").format(stats["speed"])
+        text += " · " + self.tr("Rest {0}").format(format_eta(stats["eta"]))
+        self.queue_status_label.setText(text)
+        self.queue_status_label.show()
 
-        print(f"Transkription: Chunk {current}/{total}")
-
-    def _on_bg_transcription_finished(self, result: dict):
-        """Hintergrund-Transkription abgeschlossen"""
-        if not self.current_transcribing_session_id:
+    def _on_transcribe_backlog(self):
+        """Reiht alle Sessions ohne Transkript oder mit Fehler ein"""
+        api_key = self.settings_manager.get_openai_api_key()
+        if not api_key:
+            self._show_message(QMessageBox.Icon.Warning, self.tr("Warnung"),
+                              self.tr("Kein OpenAI API Key gesetzt. Bitte in den Einstellungen hinterlegen."))
             return
 
-        session_id = self.current_transcribing_session_id
+        sessions = [
+            session for session in self.repo.list_sessions(statuses=[None, "error"])
+            if session['path'] and Path(session['path']).exists()
+        ]
+        if not sessions:
+            self._show_message(QMessageBox.Icon.Information, self.tr("Alle transkribieren"),
+                              self.tr("Alle Sessions sind bereits transkribiert."))
+            return
 
-        # In Datenbank speichern
-        self.repo.update_transcript(
-            session_id,
-            result['text'],
-            result['tokens_used'],
-            "completed"
+        hours = sum(session['duration_sec'] or 0 for session in sessions) / 3600
+        confirmed = self._ask_question(
+            self.tr("Alle transkribieren"),
+            self.tr("{0} Sessions ({1:.1f} h Audio) zur Transkription einreihen?").format(len(sessions), hours)
         )
+        if not confirmed:
+            return
 
-        # Tabelle aktualisieren (mit Blink-Effekt)
-        self.session_table.update_transcription_status(session_id, "completed", blink=True)
+        self.transcription_queue.enqueue_many(
+            [(session['id'], session['path']) for session in sessions],
+            priority=PRIORITY_LOW
+        )
 
-        print(f"Transkription abgeschlossen für Session {session_id} ({result['tokens_used']} tokens)")
+    def _on_batch_transform(self):
+        """Wendet einen Prompt auf mehrere Sessions an (erneuter Klick bricht ab)"""
+        if self.batch_transform_worker is not None and self.batch_transform_worker.isRunning():
+            if self._ask_question(self.tr("Prompt anwenden"), self.tr("Batch-Transformation abbrechen?")):
+                self.batch_transform_worker.cancel()
+            return
 
-        # Worker aufräumen
-        self.transcription_worker = None
-        self.current_transcribing_session_id = None
+        api_key = self.settings_manager.get_openai_api_key()
+        if not api_key:
+            self._show_message(QMessageBox.Icon.Warning, self.tr("Warnung"),
+                              self.tr("Kein OpenAI API Key gesetzt. Bitte in den Einstellungen hinterlegen."))
+            return
 
-    def _on_bg_transcription_error(self, error_message: str):
-        """Hintergrund-Transkription fehlgeschlagen"""
-        if not self.current_transcribing_session_id:
+        prompts = self.settings_manager.get_all_prompts()
+        if not prompts:
+            return
+        name, ok = QInputDialog.getItem(
+            self, self.tr("Prompt anwenden"), self.tr("Prompt:"),
+            [prompt['name'] for prompt in prompts], 0, False
+        )
+        if not ok:
             return
+        prompt = next(prompt for prompt in prompts if prompt['name'] == name)
 
-        session_id = self.current_transcribing_session_id
+        # Mehrfachauswahl hat Vorrang, sonst aktueller Suchbegriff
+        selected_ids = self.session_table.get_selected_session_ids()
+        if len(selected_ids) > 1:
+            filters = {"session_ids": selected_ids}
+        else:
+            filters = {"search_term": self.search_edit.text()}
 
-        # Status in DB setzen
-        self.repo.set_transcription_status(session_id, "error")
-        self.session_table.update_transcription_status(session_id, "error", blink=False)
+        sessions = select_sessions(self.repo, prompt['id'], filters)
+        if not sessions:
+            self._show_message(QMessageBox.Icon.Information, self.tr("Prompt anwenden"),
+                              self.tr("Alle passenden Sessions haben bereits ein Ergebnis für diesen Prompt."))
+            return
 
-        print(f"Transkription fehlgeschlagen für Session {session_id}: {error_message}")
+        confirmed = self._ask_question(
+            self.tr("Prompt anwenden"),
+            self.tr("\"{0}\" auf {1} Sessions anwenden?").format(name, len(sessions))
+        )
+        if not confirmed:
+            return
 
-        # Worker aufräumen
-        self.transcription_worker = None
-        self.current_transcribing_session_id = None
+        self.batch_transform_worker = BatchTransformWorker(
+            sessions, prompt['id'], api_key,
+            max_workers=self.settings_manager.get_transcription_workers()
+        )
+        self.batch_transform_worker.progress.connect(self._on_batch_transform_progress)
+        self.batch_transform_worker.finished.connect(self._on_batch_transform_finished)
+        self.batch_transform_worker.error.connect(self._on_batch_transform_error)
+        self.batch_status_label.setText(self.tr("Prompt 0/{0}").format(len(sessions)))
+        self.batch_status_label.show()
+        self.batch_transform_worker.start()
+
+    def _on_batch_transform_progress(self, stats: dict):
+        """Zeigt Fortschritt und Durchsatz der Batch-Transformation"""
+        total = stats["done"] + stats["failed"] + stats["remaining"]
+        text = self.tr("Prompt {0}/{1}").format(stats["done"] + stats["failed"], total)
+        text += " · " + self.tr("{0:.0f}/min").format(stats["jobs_per_min"])
+        text += " · " + self.tr("Rest {0}").format(format_eta(stats["eta"]))
+        self.batch_status_label.setText(text)
+
+    def _on_batch_transform_finished(self, result: dict):
+        """Batch-Transformation abgeschlossen oder abgebrochen"""
+        self.batch_status_label.hide()
+        self.batch_transform_worker.wait()
+        self.batch_transform_worker = None
+
+        message = self.tr("{0} Ergebnisse gespeichert ({1} aus dem Cache), {2} Fehler.").format(
+            result["done"], result["cached"], result["failed"])
+        if result.get("cancelled"):
+            message = self.tr("Abgebrochen.") + " " + message
+        self._show_message(QMessageBox.Icon.Information, self.tr("Prompt anwenden"), message)
+
+    def _on_batch_transform_error(self, error_message: str):
+        """Batch-Transformation fehlgeschlagen"""
+        self.batch_status_label.hide()
+        self.batch_transform_worker.wait()
+        self.batch_transform_worker = None
+        self._show_message(QMessageBox.Icon.Critical, self.tr("Fehler"),
+                          self.tr("Batch-Transformation fehlgeschlagen:\n{0}").format(error_message))
+
+    def _on_queue_progress(self, session_id: int, current: int, total: int):
+        """Chunk-Progress eines laufenden Jobs"""
+        # Tabelle aktualisieren mit Progress "3/8"
+        self.session_table.update_transcription_progress(session_id, current, total)
+        print(f"Transkription Session {session_id}: Chunk {current}/{total}")
 
     def _on_transcription_status_update(self, session_id: int, status: str):
         """Wird aufgerufen wenn AIView eine Transkription abgeschlossen hat"""
@@ -997,6 +1157,59 @@ class MainWindow(TranslatableWidget, QMainWindow):
                 self._show_message(QMessageBox.Icon.Warning, self.tr("Teilweise erfolgreich"),
                     self.tr("Session wurde gelöscht, aber Audiodatei konnte nicht gelöscht werden:\n{0}").format(reason))
 
+    def _on_bulk_delete_requested(self, session_ids: list):
+        """Löscht mehrere Sessions (eine Transaktion, Dateien im Hintergrund)"""
+        confirmed = self._ask_question(
+            self.tr("Löschen bestätigen"),
+            self.tr("Möchten Sie {0} Sessions wirklich löschen?\n\n⚠️ Die Audiodateien werden ebenfalls permanent gelöscht!").format(len(session_ids))
+        )
+        if not confirmed:
+            return
+
+        # Eingereihte/laufende Jobs werden in derselben Transaktion abgebrochen
+        paths = self.repo.delete_many(session_ids)
+        self.session_form.clear()
+        self.player_widget.clear()
+        self._load_sessions(self.search_edit.text())
+
+        if not paths:
+            return
+
+        # Dateien erst nach dem DB-Commit im Hintergrund löschen
+        self.file_delete_worker = FileDeleteWorker(paths)
+        self.file_delete_worker.finished.connect(self._on_bulk_files_deleted)
+        self.file_delete_worker.start()
+
+    def _on_bulk_files_deleted(self, result: dict):
+        """Dateien nach Bulk-Delete gelöscht"""
+        failed = result.get("failed", [])
+        print(f"Bulk-Delete: {result.get('deleted', 0)} Audiodateien gelöscht, {len(failed)} Fehler")
+
+        if failed:
+            self._show_message(QMessageBox.Icon.Warning, self.tr("Teilweise erfolgreich"),
+                self.tr("Sessions wurden gelöscht, aber {0} Audiodateien konnten nicht gelöscht werden:\n{1}").format(
+                    len(failed), "\n".join(failed[:10])))
+
+    def _on_bulk_transcribe_requested(self, session_ids: list):
+        """Reiht mehrere Sessions zur Hintergrund-Transkription ein"""
+        api_key = self.settings_manager.get_openai_api_key()
+        if not api_key:
+            self._show_message(QMessageBox.Icon.Warning, self.tr("Warnung"),
+                              self.tr("Kein OpenAI API Key gesetzt. Bitte in den Einstellungen hinterlegen."))
+            return
+
+        # Bereits eingereihte Sessions überspringt die Queue selbst
+        jobs = [
+            (session['id'], session['path'])
+            for session in self.repo.list_sessions(session_ids=session_ids)
+            if session['path'] and Path(session['path']).exists()
+        ]
+        self.transcription_queue.enqueue_many(jobs, priority=PRIORITY_LOW)
+
+    def _on_bulk_export_requested(self, session_ids: list):
+        """Exportiert die ausgewählten Sessions"""
+        self._on_export_csv(filters={"session_ids": session_ids})
+
     def _on_show_in_folder(self, file_path: str):
         """Zeigt die Datei im Explorer/Finder"""
         if os.path.exists(file_path):
@@ -1026,33 +1239,148 @@ class MainWindow(TranslatableWidget, QMainWindow):
         # Direkt zur Hauptansicht wechseln
         self.stacked_widget.setCurrentIndex(0)  # Haupt-View
 
-    def _on_export_csv(self):
-        """Exportiert Sessions als CSV"""
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, self.tr("CSV exportieren"), "sessions.csv", self.tr("CSV Dateien (*.csv)")
+    def _on_export_csv(self, filters: dict = None):
+        """
+        Exportiert Sessions als CSV, JSONL oder Parquet (im Hintergrund)
+
+        Args:
+            filters: Filter für den Export (Standard: aktueller Suchbegriff)
+        """
+        if self.export_worker is not None and self.export_worker.isRunning():
+            return
+
+        # Dateifilter -> Export-Format
+        file_filters = {
+            self.tr("CSV Dateien (*.csv)"): FORMAT_CSV,
+            self.tr("JSON Lines (*.jsonl)"): FORMAT_JSONL,
+        }
+        if parquet_available():
+            file_filters[self.tr("Parquet Dateien (*.parquet)")] = FORMAT_PARQUET
+
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            self, self.tr("CSV exportieren"), "sessions.csv", ";;".join(file_filters)
         )
 
-        if file_path:
-            try:
-                self.repo.export_to_csv(file_path)
-                self._show_message(QMessageBox.Icon.Information, self.tr("Erfolg"),
-                                  self.tr("Sessions wurden exportiert:\n{0}").format(file_path))
-            except Exception as e:
-                self._show_message(QMessageBox.Icon.Critical, self.tr("Fehler"),
-                                  self.tr("Export fehlgeschlagen:\n{0}").format(e))
+        if not file_path:
+            return
+
+        # Das gewählte Format zählt, die Endung wird angepasst (z.B. Parquet mit "sessions.csv")
+        fmt = file_filters.get(selected_filter) or format_from_path(file_path)
+        if format_from_path(file_path) != fmt:
+            path = Path(file_path)
+            if path.suffix.lower() in (".csv", ".jsonl", ".ndjson", ".parquet"):
+                path = path.with_suffix("")
+            file_path = f"{path}.{fmt}"
+
+        # Aktueller Suchbegriff filtert auch den Export
+        if not filters:
+            filters = {"search_term": self.search_edit.text()}
+
+        self.export_progress_dialog = QProgressDialog(
+            self.tr("Exportiere Sessions..."), self.tr("Abbrechen"), 0, 0, self
+        )
+        self.export_progress_dialog.setWindowTitle(self.tr("Export"))
+        self.export_progress_dialog.setMinimumDuration(500)
+        self.export_progress_dialog.setAutoClose(False)
+        self.export_progress_dialog.setAutoReset(False)
+
+        self.export_worker = ExportWorker(file_path, fmt=fmt, filters=filters)
+        self.export_worker.progress.connect(self._on_export_progress)
+        self.export_worker.finished.connect(self._on_export_finished)
+        self.export_worker.error.connect(self._on_export_error)
+        self.export_progress_dialog.canceled.connect(self.export_worker.cancel)
+        self.export_worker.start()
+
+    def _on_export_progress(self, exported: int, total: int):
+        """Progress-Update vom Export"""
+        if self.export_progress_dialog:
+            self.export_progress_dialog.setMaximum(max(total, 1))
+            self.export_progress_dialog.setValue(exported)
+
+    def _close_export_progress(self):
+        """Schließt den Export-Fortschrittsdialog"""
+        if self.export_progress_dialog:
+            self.export_progress_dialog.close()
+            self.export_progress_dialog = None
+
+    def _on_export_finished(self, result: dict):
+        """Export abgeschlossen oder abgebrochen"""
+        self._close_export_progress()
+
+        if result.get("cancelled"):
+            return
+
+        self._show_message(QMessageBox.Icon.Information, self.tr("Erfolg"),
+                          self.tr("Sessions wurden exportiert:\n{0}").format(result['path']))
+
+    def _on_export_error(self, error_message: str):
+        """Export fehlgeschlagen"""
+        self._close_export_progress()
+        self._show_message(QMessageBox.Icon.Critical, self.tr("Fehler"),
+                          self.tr("Export fehlgeschlagen:\n{0}").format(error_message))
+
+    def _on_import_archive(self):
+        """Importiert ein Verzeichnis mit Audio-Dateien als Sessions (im Hintergrund)"""
+        if self.import_worker is not None and self.import_worker.isRunning():
+            return
+
+        directory = QFileDialog.getExistingDirectory(self, self.tr("Audio-Archiv importieren"))
+        if not directory:
+            return
+
+        self.import_progress_dialog = QProgressDialog(
+            self.tr("Importiere Audio-Dateien..."), self.tr("Abbrechen"), 0, 0, self
+        )
+        self.import_progress_dialog.setWindowTitle(self.tr("Import"))
+        self.import_progress_dialog.setMinimumDuration(500)
+        self.import_progress_dialog.setAutoClose(False)
+        self.import_progress_dialog.setAutoReset(False)
+
+        self.import_worker = ImportWorker([directory])
+        self.import_worker.progress.connect(self._on_import_progress)
+        self.import_worker.finished.connect(self._on_import_finished)
+        self.import_worker.error.connect(self._on_import_error)
+        self.import_progress_dialog.canceled.connect(self.import_worker.cancel)
+        self.import_worker.start()
+
+    def _on_import_progress(self, processed: int, total: int):
+        """Progress-Update vom Import"""
+        if self.import_progress_dialog:
+            self.import_progress_dialog.setMaximum(max(total, 1))
+            self.import_progress_dialog.setValue(processed)
+
+    def _close_import_progress(self):
+        """Schließt den Import-Fortschrittsdialog"""
+        if self.import_progress_dialog:
+            self.import_progress_dialog.close()
+            self.import_progress_dialog = None
+
+    def _on_import_finished(self, result: dict):
+        """Import abgeschlossen oder abgebrochen"""
+        self._close_import_progress()
+        self._load_sessions(self.search_edit.text())
+
+        self._show_message(QMessageBox.Icon.Information, self.tr("Import"),
+                          self.tr("Importiert: {0}\nBereits vorhanden: {1}\nDubletten: {2}\nFehler: {3}").format(
+                              result['imported'], result['skipped'],
+                              result['duplicates'], result['failed']))
+
+    def _on_import_error(self, error_message: str):
+        """Import fehlgeschlagen"""
+        self._close_import_progress()
+        self._show_message(QMessageBox.Icon.Critical, self.tr("Fehler"),
+                          self.tr("Import fehlgeschlagen:\n{0}").format(error_message))
 
     def _on_settings_clicked(self):
         """Öffnet den Settings-Dialog"""
         from PySide6.QtWidgets import QDialog
+        from ui.settings_dialog import SettingsDialog
 
         # Merke aktuelle Sprache
         old_language = self.settings_manager.get_language()
 
         dialog = SettingsDialog(self.settings_manager, self)
 
-        # Verbinde prompts_changed Signal mit AI View reload
-        dialog.prompts_changed.connect(self.ai_view.load_prompts)
-
         if dialog.exec() == QDialog.DialogCode.Accepted:
             # Prüfe ob Sprache geändert wurde
             new_language = self.settings_manager.get_language()
@@ -1061,6 +1389,9 @@ class MainWindow(TranslatableWidget, QMainWindow):
                 # Sprache hat sich geändert - Live-Update
                 self.change_language(new_language)
 
+            # Neuer API Key oder größerer Pool: wartende Jobs starten
+            self.transcription_queue.dispatch()
+
     def retranslateUi(self):
         """Aktualisiert alle UI-Texte (für Sprachwechsel)"""
         # Fenstertitel
@@ -1070,6 +1401,16 @@ class MainWindow(TranslatableWidget, QMainWindow):
         self.search_label.setText(self.tr("Suche:"))
         self.search_edit.setPlaceholderText(self.tr("Suche nach Titel, Notizen oder Transkription..."))
         self.export_button.setText(self.tr("CSV Export"))
+        self.import_button.setText(self.tr("Import"))
+        self.import_button.setToolTip(self.tr("Audio-Archiv importieren"))
+        self.transcribe_all_button.setText(self.tr("Alle transkribieren"))
+        self.transcribe_all_button.setToolTip(
+            self.tr("Alle Sessions ohne Transkript (oder mit Fehler) zur Transkription einreihen")
+        )
+        self.batch_transform_button.setText(self.tr("Prompt anwenden"))
+        self.batch_transform_button.setToolTip(
+            self.tr("Einen Prompt auf alle ausgewählten bzw. gefilterten Sessions mit Transkript anwenden")
+        )
         self.toolbar_settings_button.setToolTip(self.tr("Einstellungen"))
 
         # Recorder Panel
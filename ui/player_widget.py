@@ -4,7 +4,6 @@ Playback-Widget für Audio-Wiedergabe
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                                QLabel, QSlider, QGroupBox)
 from PySide6.QtCore import Qt, Signal, QEvent
-import qtawesome as qta
 import sys
 from pathlib import Path
 
@@ -12,6 +11,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from player import AudioPlayer
 from translatable_widget import TranslatableWidget
+from ui.icon_cache import IconCache
 
 
 class PlayerWidget(TranslatableWidget, QWidget):
@@ -142,14 +142,14 @@ class PlayerWidget(TranslatableWidget, QWidget):
         """
 
         self.folder_button = QPushButton()
-        self.folder_button.setIcon(qta.icon('fa5s.folder-open', color='#000e22'))
+        self.folder_button.setIcon(IconCache.instance().icon('fa5s.folder-open', '#000e22'))
         self.folder_button.setToolTip(self.tr("Im Ordner zeigen"))
         self.folder_button.clicked.connect(self._on_folder_clicked)
         self.folder_button.setEnabled(False)
         self.folder_button.setStyleSheet(icon_button_style)
 
         self.ai_button = QPushButton()
-        self.ai_button.setIcon(qta.icon('fa5s.robot', color='#000e22'))
+        self.ai_button.setIcon(IconCache.instance().icon('fa5s.robot', '#000e22'))
         self.ai_button.setToolTip(self.tr("KI-Funktionen"))
         self.ai_button.clicked.connect(self._on_ai_clicked)
         self.ai_button.setEnabled(False)
@@ -2,7 +2,7 @@
 Prompt-Editor Dialog für Create/Edit von Custom Prompts
 """
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout,
-                               QPushButton, QLabel, QLineEdit, QTextEdit, QMessageBox)
+                               QPushButton, QLabel, QLineEdit, QTextEdit, QMessageBox, QComboBox)
 from PySide6.QtCore import Qt, QEvent
 import sys
 from pathlib import Path
@@ -10,6 +10,7 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from translatable_widget import TranslatableWidget
+from services.model_router import MODEL_AUTO, MODEL_CHOICES
 
 
 class PromptEditorDialog(TranslatableWidget, QDialog):
@@ -65,6 +66,14 @@ class PromptEditorDialog(TranslatableWidget, QDialog):
             QTextEdit:focus {
                 border: 1px solid #ffaa3a;
             }
+            QComboBox {
+                background-color: #001633;
+                color: #e0e0e0;
+                border: 1px solid #003355;
+                border-radius: 3px;
+                padding: 6px;
+                font-size: 13px;
+            }
         """)
 
         layout = QVBoxLayout(self)
@@ -90,6 +99,15 @@ class PromptEditorDialog(TranslatableWidget, QDialog):
         self.prompt_text_edit.setMinimumHeight(150)
         layout.addWidget(self.prompt_text_edit)
 
+        # Modell (automatisch = GPT-5 mit Fallback auf GPT-4o)
+        self.model_label = QLabel(self.tr("Modell:"))
+        layout.addWidget(self.model_label)
+
+        self.model_combo = QComboBox()
+        for model in MODEL_CHOICES:
+            self.model_combo.addItem(model or self.tr("Automatisch"), model)
+        layout.addWidget(self.model_combo)
+
         # Buttons
         button_layout = QHBoxLayout()
         button_layout.addStretch()
@@ -139,6 +157,12 @@ class PromptEditorDialog(TranslatableWidget, QDialog):
         if self.prompt:
             self.name_edit.setText(self.prompt.get("name", ""))
             self.prompt_text_edit.setPlainText(self.prompt.get("prompt_text", ""))
+            index = self.model_combo.findData(self.prompt.get("model") or MODEL_AUTO)
+            if index < 0:
+                # Unbekanntes Modell (z.B. manuell eingetragen) nicht verlieren
+                self.model_combo.addItem(self.prompt["model"], self.prompt["model"])
+                index = self.model_combo.count() - 1
+            self.model_combo.setCurrentIndex(index)
 
     def _on_save(self):
         """Validierung und Speichern"""
@@ -167,7 +191,8 @@ class PromptEditorDialog(TranslatableWidget, QDialog):
         # Daten für Rückgabe vorbereiten
         self.result_data = {
             "name": name,
-            "prompt_text": prompt_text
+            "prompt_text": prompt_text,
+            "model": self.model_combo.currentData()
         }
 
         self.accept()
@@ -187,6 +212,8 @@ class PromptEditorDialog(TranslatableWidget, QDialog):
         # Labels
         self.name_label.setText(self.tr("Name:"))
         self.prompt_text_label.setText(self.tr("Prompt-Text:"))
+        self.model_label.setText(self.tr("Modell:"))
+        self.model_combo.setItemText(0, self.tr("Automatisch"))
 
         # Placeholders
         self.name_edit.setPlaceholderText(self.tr("z.B. Meeting-Notizen erstellen"))
@@ -3,7 +3,7 @@ Settings-Dialog für App-Einstellungen
 """
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout,
                                QPushButton, QLabel, QComboBox, QCheckBox, QGroupBox, QLineEdit,
-                               QListWidget, QMessageBox, QListWidgetItem)
+                               QListWidget, QMessageBox, QListWidgetItem, QSpinBox)
 from PySide6.QtCore import Qt, QEvent, Signal
 import sys
 from pathlib import Path
@@ -130,6 +130,65 @@ class SettingsDialog(TranslatableWidget, QDialog):
         """)
         transcription_layout.addWidget(self.auto_transcription_checkbox)
 
+        # Parallele Chunk-Uploads bei langen Aufnahmen
+        concurrency_layout = QHBoxLayout()
+        self.concurrency_label = QLabel(self.tr("Parallele Uploads:"))
+        concurrency_layout.addWidget(self.concurrency_label)
+
+        self.concurrency_spinbox = QSpinBox()
+        self.concurrency_spinbox.setRange(1, 8)
+        self.concurrency_spinbox.setStyleSheet("""
+            QSpinBox {
+                background-color: #001633;
+                color: #e0e0e0;
+                border: 1px solid #003355;
+                border-radius: 3px;
+                padding: 4px;
+                font-size: 13px;
+            }
+        """)
+        concurrency_layout.addWidget(self.concurrency_spinbox)
+        concurrency_layout.addStretch()
+        transcription_layout.addLayout(concurrency_layout)
+
+        # Mehrere Sessions gleichzeitig transkribieren (Warteschlange)
+        workers_layout = QHBoxLayout()
+        self.workers_label = QLabel(self.tr("Gleichzeitige Transkriptionen:"))
+        workers_layout.addWidget(self.workers_label)
+
+        self.workers_spinbox = QSpinBox()
+        self.workers_spinbox.setRange(1, 4)
+        self.workers_spinbox.setStyleSheet(self.concurrency_spinbox.styleSheet())
+        workers_layout.addWidget(self.workers_spinbox)
+        workers_layout.addStretch()
+        transcription_layout.addLayout(workers_layout)
+
+        # Rate Limits für Batch-Transkription (0 = unbegrenzt)
+        rpm_layout = QHBoxLayout()
+        self.rpm_label = QLabel(self.tr("Anfragen/Minute:"))
+        rpm_layout.addWidget(self.rpm_label)
+
+        self.rpm_spinbox = QSpinBox()
+        self.rpm_spinbox.setRange(0, 10000)
+        self.rpm_spinbox.setSpecialValueText(self.tr("Unbegrenzt"))
+        self.rpm_spinbox.setStyleSheet(self.concurrency_spinbox.styleSheet())
+        rpm_layout.addWidget(self.rpm_spinbox)
+        rpm_layout.addStretch()
+        transcription_layout.addLayout(rpm_layout)
+
+        tpm_layout = QHBoxLayout()
+        self.tpm_label = QLabel(self.tr("Tokens/Minute:"))
+        tpm_layout.addWidget(self.tpm_label)
+
+        self.tpm_spinbox = QSpinBox()
+        self.tpm_spinbox.setRange(0, 10000000)
+        self.tpm_spinbox.setSingleStep(1000)
+        self.tpm_spinbox.setSpecialValueText(self.tr("Unbegrenzt"))
+        self.tpm_spinbox.setStyleSheet(self.concurrency_spinbox.styleSheet())
+        tpm_layout.addWidget(self.tpm_spinbox)
+        tpm_layout.addStretch()
+        transcription_layout.addLayout(tpm_layout)
+
         self.transcription_group.setLayout(transcription_layout)
         layout.addWidget(self.transcription_group)
 
@@ -334,6 +393,11 @@ class SettingsDialog(TranslatableWidget, QDialog):
         auto_transcription = self.settings_manager.get_auto_transcription()
         self.auto_transcription_checkbox.setChecked(auto_transcription)
 
+        self.concurrency_spinbox.setValue(self.settings_manager.get_transcription_concurrency())
+        self.workers_spinbox.setValue(self.settings_manager.get_transcription_workers())
+        self.rpm_spinbox.setValue(self.settings_manager.get_rate_limit_rpm())
+        self.tpm_spinbox.setValue(self.settings_manager.get_rate_limit_tpm())
+
         api_key = self.settings_manager.get_openai_api_key()
         self.api_key_input.setText(api_key)
 
@@ -343,6 +407,10 @@ class SettingsDialog(TranslatableWidget, QDialog):
         self.settings_manager.set_auto_transcription(
             self.auto_transcription_checkbox.isChecked()
         )
+        self.settings_manager.set_transcription_concurrency(self.concurrency_spinbox.value())
+        self.settings_manager.set_transcription_workers(self.workers_spinbox.value())
+        self.settings_manager.set_rate_limit_rpm(self.rpm_spinbox.value())
+        self.settings_manager.set_rate_limit_tpm(self.tpm_spinbox.value())
         self.settings_manager.set_openai_api_key(self.api_key_input.text())
         self.accept()
 
@@ -391,7 +459,7 @@ class SettingsDialog(TranslatableWidget, QDialog):
             data = dialog.get_result()
             if data:
                 # Prompt speichern
-                self.settings_manager.add_prompt(data['name'], data['prompt_text'])
+                self.settings_manager.add_prompt(data['name'], data['prompt_text'], data['model'])
                 # Liste neu laden
                 self._load_prompts()
                 # Signal auslösen
@@ -424,7 +492,8 @@ class SettingsDialog(TranslatableWidget, QDialog):
                 self.settings_manager.update_prompt(
                     prompt['id'],
                     data['name'],
-                    data['prompt_text']
+                    data['prompt_text'],
+                    data['model']
                 )
                 # Liste neu laden
                 self._load_prompts()
@@ -480,6 +549,12 @@ class SettingsDialog(TranslatableWidget, QDialog):
 
         self.transcription_group.setTitle(self.tr("Transkription"))
         self.auto_transcription_checkbox.setText(self.tr("Auto-Transkription aktivieren"))
+        self.concurrency_label.setText(self.tr("Parallele Uploads:"))
+        self.workers_label.setText(self.tr("Gleichzeitige Transkriptionen:"))
+        self.rpm_label.setText(self.tr("Anfragen/Minute:"))
+        self.rpm_spinbox.setSpecialValueText(self.tr("Unbegrenzt"))
+        self.tpm_label.setText(self.tr("Tokens/Minute:"))
+        self.tpm_spinbox.setSpecialValueText(self.tr("Unbegrenzt"))
         self.openai_group.setTitle(self.tr("OpenAI API"))
         self.api_key_label.setText(self.tr("API Key:"))
 
@@ -1,25 +1,231 @@
 """
 Sessions-Tabelle Widget
+
+Model/View statt QTableWidget: Das Model hält nur die Session-Dicts, Texte
+entstehen erst in data() für die sichtbaren Zeilen. Die Status-Spalte zeichnet
+ein Delegate mit den Pixmaps aus dem IconCache (kein Widget pro Zeile), so
+bleibt load_sessions() auch bei 100.000 Sessions ein einziger Model-Reset.
 """
-from PySide6.QtWidgets import (QTableWidget, QTableWidgetItem, QHeaderView,
-                               QAbstractItemView, QLabel)
-from PySide6.QtCore import Signal, Qt, QEvent, QTimer, QSize
-from PySide6.QtGui import QColor
-import qtawesome as qta
-from typing import List, Dict, Any
+from PySide6.QtWidgets import (QTableView, QHeaderView, QAbstractItemView,
+                               QMenu, QStyledItemDelegate)
+from PySide6.QtCore import (Signal, Qt, QEvent, QTimer, QSize, QRect,
+                            QAbstractTableModel, QModelIndex)
+from PySide6.QtGui import QColor, QFont, QFontMetrics
+from typing import List, Dict, Any, Optional, Set
 import sys
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
 from translatable_widget import TranslatableWidget
+from ui.icon_cache import IconCache
+
+# Status-Icons der Transkriptions-Spalte: Status -> (qtawesome-Name, Farbe)
+STATUS_ICONS = {
+    "completed": ('fa5s.check-circle', '#4caf50'),  # Green
+    "queued": ('fa5s.clock', '#ffc107'),            # Wartet in der Queue
+    "running": ('fa5s.spinner', '#ffc107'),         # Yellow/Orange
+    # "pending" aus älteren Datenbanken wie laufend anzeigen
+    "pending": ('fa5s.spinner', '#ffc107'),
+    "error": ('fa5s.times-circle', '#f44336'),      # Red
+}
+DEFAULT_STATUS_ICON = ('fa5s.circle', '#9e9e9e')   # Gray
+BLINK_ICON = ('fa5s.check-circle', '#ffffff')       # Helles Icon für den Blink-Effekt
+
+# Icon-Größen: nur Icon bzw. Icon mit Progress-Text
+STATUS_ICON_SIZE = 20
+PROGRESS_ICON_SIZE = 16
+
+# Spalten der Tabelle
+COLUMN_COUNT = 7
+STATUS_COLUMN = 5
+
+# Item-Rolle der Status-Spalte: (Status, Progress-Text, Blink-Icon aktiv)
+STATUS_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+def format_file_size(size_bytes: int) -> str:
+    """Formatiert Dateigröße in menschenlesbarem Format"""
+    if not size_bytes:
+        return "-"
+
+    units = ['B', 'KB', 'MB', 'GB']
+    unit_index = 0
+    size = float(size_bytes)
 
+    while size >= 1024 and unit_index < len(units) - 1:
+        size /= 1024
+        unit_index += 1
 
-class SessionTableWidget(TranslatableWidget, QTableWidget):
+    if unit_index == 0:  # Bytes
+        return f"{int(size)} {units[unit_index]}"
+    else:
+        return f"{size:.1f} {units[unit_index]}"
+
+
+class SessionTableModel(QAbstractTableModel):
+    """
+    Tabellen-Model über der Session-Liste aus dem Repository
+
+    Unter den Sessions hängen leere Zeilen bis MIN_DISPLAY_ROWS, damit die
+    Tabelle auch mit wenigen Sessions gefüllt aussieht.
+    """
+
+    MIN_DISPLAY_ROWS = 30  # Mindestanzahl an anzuzeigenden Zeilen
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._sessions: List[Dict[str, Any]] = []
+        self._rows: Dict[int, int] = {}          # Session-ID -> Zeile
+        self._progress: Dict[int, str] = {}      # Session-ID -> z.B. "3/8"
+        self._blinking: Set[int] = set()         # Session-IDs mit Blink-Icon
+        self._headers: List[str] = [""] * COLUMN_COUNT
+
+    def set_sessions(self, sessions: List[Dict[str, Any]]):
+        """Ersetzt alle Sessions (ein Reset statt Einfügen pro Zeile)"""
+        self.beginResetModel()
+        self._sessions = sessions
+        self._rows = {session['id']: row for row, session in enumerate(sessions)}
+        self._progress.clear()
+        self.endResetModel()
+
+    def set_headers(self, labels: List[str]):
+        """Setzt die Spaltenüberschriften"""
+        self._headers = list(labels)
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, COLUMN_COUNT - 1)
+
+    def session_id(self, row: int) -> Optional[int]:
+        """Session-ID einer Zeile (None für die leeren Füllzeilen)"""
+        if 0 <= row < len(self._sessions):
+            return self._sessions[row]['id']
+        return None
+
+    def row_of(self, session_id: int) -> Optional[int]:
+        """Zeile einer Session (None wenn nicht geladen)"""
+        return self._rows.get(session_id)
+
+    def set_status(self, session_id: int, status: Optional[str]):
+        """Setzt den Transkriptions-Status und entfernt den Progress-Text"""
+        row = self._rows.get(session_id)
+        if row is None:
+            return
+        self._sessions[row]['transcription_status'] = status
+        self._progress.pop(session_id, None)
+        self._status_changed(row)
+
+    def set_progress(self, session_id: int, progress_text: str):
+        """Zeigt eine laufende Transkription mit Progress-Text an"""
+        row = self._rows.get(session_id)
+        if row is None:
+            return
+        self._sessions[row]['transcription_status'] = "running"
+        self._progress[session_id] = progress_text
+        self._status_changed(row)
+
+    def set_blinking(self, session_id: int, blinking: bool):
+        """Schaltet das helle Blink-Icon einer Session an oder aus"""
+        if blinking:
+            self._blinking.add(session_id)
+        else:
+            self._blinking.discard(session_id)
+        row = self._rows.get(session_id)
+        if row is not None:
+            self._status_changed(row)
+
+    def _status_changed(self, row: int):
+        """Lässt die Status-Zelle einer Zeile neu zeichnen"""
+        index = self.index(row, STATUS_COLUMN)
+        self.dataChanged.emit(index, index, [STATUS_ROLE])
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return max(len(self._sessions), self.MIN_DISPLAY_ROWS)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return COLUMN_COUNT
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        row = index.row()
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        if row >= len(self._sessions):
+            return None
+        session = self._sessions[row]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return str(session['id'])
+            if column == 1:
+                return session['title']
+            if column == 2:
+                return session['recorded_at']
+            if column == 3:
+                return str(session['duration_sec'])
+            if column == 4:
+                return format_file_size(session.get('file_size', 0))
+            if column == 6:
+                notes = session['notes'] or ''
+                return notes[:50] + '...' if len(notes) > 50 else notes
+        elif role == STATUS_ROLE and column == STATUS_COLUMN:
+            session_id = session['id']
+            return (session.get('transcription_status'), self._progress.get(session_id),
+                    session_id in self._blinking)
+        return None
+
+
+class StatusIconDelegate(QStyledItemDelegate):
+    """Zeichnet das Status-Icon (und optional den Progress-Text) zentriert in die Zelle"""
+
+    def paint(self, painter, option, index):
+        # Hintergrund und Selektion wie bei den anderen Spalten
+        super().paint(painter, option, index)
+
+        state = index.data(STATUS_ROLE)
+        if state is None:
+            return
+        status, progress_text, blinking = state
+        icons = IconCache.instance()
+        rect = option.rect
+
+        painter.save()
+        if progress_text:
+            # Icon + Text: kleineres Icon für Platz, 2 Spaces vor dem Text
+            pixmap = icons.pixmap(*STATUS_ICONS["running"], PROGRESS_ICON_SIZE)
+            text = f"  {progress_text}"
+            font = QFont(option.font)
+            font.setPixelSize(12)
+            text_width = QFontMetrics(font).horizontalAdvance(text)
+            x = rect.x() + (rect.width() - PROGRESS_ICON_SIZE - text_width) // 2
+            painter.drawPixmap(x, rect.y() + (rect.height() - PROGRESS_ICON_SIZE) // 2, pixmap)
+            painter.setFont(font)
+            painter.setPen(QColor("#e0e0e0"))
+            painter.drawText(QRect(x + PROGRESS_ICON_SIZE, rect.y(), text_width, rect.height()),
+                             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, text)
+        else:
+            name, color = BLINK_ICON if blinking else STATUS_ICONS.get(status, DEFAULT_STATUS_ICON)
+            pixmap = icons.pixmap(name, color, STATUS_ICON_SIZE)
+            painter.drawPixmap(rect.x() + (rect.width() - STATUS_ICON_SIZE) // 2,
+                               rect.y() + (rect.height() - STATUS_ICON_SIZE) // 2, pixmap)
+        painter.restore()
+
+
+class SessionTableWidget(TranslatableWidget, QTableView):
     """Tabelle zur Anzeige aller Audio-Sessions"""
 
     session_selected = Signal(int)  # Wird ausgelöst wenn eine Session ausgewählt wird
-    MIN_DISPLAY_ROWS = 30  # Mindestanzahl an anzuzeigenden Zeilen
+    bulk_delete_requested = Signal(list)      # Session-IDs der Mehrfachauswahl
+    bulk_transcribe_requested = Signal(list)  # Session-IDs der Mehrfachauswahl
+    bulk_export_requested = Signal(list)      # Session-IDs der Mehrfachauswahl
+    MIN_DISPLAY_ROWS = SessionTableModel.MIN_DISPLAY_ROWS
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -28,16 +234,16 @@ class SessionTableWidget(TranslatableWidget, QTableWidget):
 
     def _setup_ui(self):
         """Initialisiert die Tabelle"""
-        # Spalten definieren
-        self.setColumnCount(6)
-        self.setHorizontalHeaderLabels([
-            self.tr("ID"), self.tr("Titel"), self.tr("Aufnahmedatum"), self.tr("Dauer (s)"),
-            self.tr("Dateigröße"), self.tr("Transkription"), self.tr("Notizen")
-        ])
+        # Model und Delegate für die Status-Icons
+        self._model = SessionTableModel(self)
+        self.setModel(self._model)
+        self.setItemDelegateForColumn(STATUS_COLUMN, StatusIconDelegate(self))
+        self.retranslateUi()
 
         # Tabellen-Eigenschaften
         self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        # Mehrfachauswahl (Shift/Strg) für Bulk-Aktionen
+        self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.setAlternatingRowColors(True)
 
@@ -58,7 +264,7 @@ class SessionTableWidget(TranslatableWidget, QTableWidget):
         header.setSectionResizeMode(6, QHeaderView.ResizeMode.Stretch)           # Notizen
 
         # Feste Breite für Transkription-Spalte für zentrierte Icons (und Progress-Text)
-        header.resizeSection(5, 100)
+        header.resizeSection(STATUS_COLUMN, 100)
 
         # Gitterlinien ausblenden
         self.setShowGrid(False)
@@ -68,18 +274,18 @@ class SessionTableWidget(TranslatableWidget, QTableWidget):
 
         # Stylesheet für Dark Theme mit blauem Hintergrund
         self.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #000e22;
                 alternate-background-color: #001633;
                 color: #e0e0e0;
                 gridline-color: #003355;
                 border: none;
             }
-            QTableWidget::item {
+            QTableView::item {
                 border-color: #003355;
                 padding: 4px;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #002244;
                 color: #ffffff;
             }
@@ -97,70 +303,30 @@ class SessionTableWidget(TranslatableWidget, QTableWidget):
         """)
 
         # Signal verbinden
-        self.itemSelectionChanged.connect(self._on_selection_changed)
+        self.selectionModel().selectionChanged.connect(self._on_selection_changed)
+
+        # Kontextmenü für Bulk-Aktionen
+        self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.customContextMenuRequested.connect(self._on_context_menu)
 
     def load_sessions(self, sessions: List[Dict[str, Any]]):
-        """Lädt Sessions in die Tabelle"""
-        self.setRowCount(0)  # Tabelle leeren
-
-        for row_idx, session in enumerate(sessions):
-            self.insertRow(row_idx)
-
-            # Daten einfügen mit horizontaler Zentrierung
-            id_item = QTableWidgetItem(str(session['id']))
-            id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(row_idx, 0, id_item)
-
-            title_item = QTableWidgetItem(session['title'])
-            title_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(row_idx, 1, title_item)
-
-            date_item = QTableWidgetItem(session['recorded_at'])
-            date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(row_idx, 2, date_item)
-
-            duration_item = QTableWidgetItem(str(session['duration_sec']))
-            duration_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(row_idx, 3, duration_item)
-
-            # Dateigröße
-            file_size = session.get('file_size', 0)
-            file_size_item = QTableWidgetItem(self._format_file_size(file_size))
-            file_size_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(row_idx, 4, file_size_item)
-
-            # Transkription Status
-            status = session.get('transcription_status', None)
-            status_widget = self._create_status_widget(status)
-            self.setCellWidget(row_idx, 5, status_widget)
-
-            notes_text = session['notes'][:50] + '...' if len(session['notes']) > 50 else session['notes']
-            notes_item = QTableWidgetItem(notes_text)
-            notes_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(row_idx, 6, notes_item)
-
-        # Fülle Tabelle mit leeren Zeilen auf, um MIN_DISPLAY_ROWS zu erreichen
-        current_rows = len(sessions)
-        if current_rows < self.MIN_DISPLAY_ROWS:
-            for row_idx in range(current_rows, self.MIN_DISPLAY_ROWS):
-                self.insertRow(row_idx)
-                # Füge leere Items in alle Spalten ein (außer Transkription-Spalte 5)
-                for col_idx in range(7):
-                    if col_idx != 5:  # Überspringe Transkriptions-Spalte (nutzt Widgets)
-                        empty_item = QTableWidgetItem("")
-                        empty_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                        self.setItem(row_idx, col_idx, empty_item)
+        """
+        Lädt Sessions in die Tabelle
+
+        Ein einziger Model-Reset: Texte und Status-Icons entstehen erst beim
+        Zeichnen der sichtbaren Zeilen, die ResizeToContents-Spalten messen
+        nur eine Stichprobe (resizeContentsPrecision).
+        """
+        self._model.set_sessions(sessions)
 
     def select_first_session(self):
         """Wählt automatisch die erste Session in der Tabelle aus"""
-        if self.rowCount() > 0:
-            # Prüfe ob erste Zeile valide Session-ID hat
-            id_item = self.item(0, 0)
-            if id_item and id_item.text().strip():
-                # Erste Zeile auswählen
-                self.selectRow(0)
-                # Fokus auf Tabelle setzen (verhindert On-Screen-Keyboard)
-                self.setFocus()
+        # Prüfe ob erste Zeile eine echte Session ist
+        if self._model.session_id(0) is not None:
+            # Erste Zeile auswählen
+            self.selectRow(0)
+            # Fokus auf Tabelle setzen (verhindert On-Screen-Keyboard)
+            self.setFocus()
 
     def select_session_by_id(self, session_id: int):
         """
@@ -169,91 +335,86 @@ class SessionTableWidget(TranslatableWidget, QTableWidget):
         Args:
             session_id: Die ID der auszuwählenden Session
         """
-        for row in range(self.rowCount()):
-            id_item = self.item(row, 0)
-            if id_item and id_item.text().strip():
-                if int(id_item.text()) == session_id:
-                    # Session gefunden - auswählen
-                    self.selectRow(row)
-                    # Fokus auf Tabelle setzen (verhindert On-Screen-Keyboard)
-                    self.setFocus()
-                    break
-
-    def _on_selection_changed(self):
+        row = self._model.row_of(session_id)
+        if row is not None:
+            # Session gefunden - auswählen
+            self.selectRow(row)
+            # Fokus auf Tabelle setzen (verhindert On-Screen-Keyboard)
+            self.setFocus()
+
+    def _on_selection_changed(self, *_args):
         """Wird aufgerufen wenn die Selektion sich ändert"""
         selected_rows = self.selectionModel().selectedRows()
-        if selected_rows:
-            row = selected_rows[0].row()
-            id_item = self.item(row, 0)
-            # Nur echte Sessions verarbeiten (ID-Spalte nicht leer)
-            if id_item and id_item.text().strip():
-                session_id = int(id_item.text())
+        # Detailansicht nur bei Einzelauswahl aktualisieren
+        if len(selected_rows) == 1:
+            session_id = self._model.session_id(selected_rows[0].row())
+            # Nur echte Sessions verarbeiten (keine Füllzeilen)
+            if session_id is not None:
                 self.session_selected.emit(session_id)
 
     def get_selected_session_id(self) -> int:
         """Gibt die ID der aktuell ausgewählten Session zurück"""
         selected_rows = self.selectionModel().selectedRows()
         if selected_rows:
-            row = selected_rows[0].row()
-            id_item = self.item(row, 0)
-            # Nur echte Sessions verarbeiten (ID-Spalte nicht leer)
-            if id_item and id_item.text().strip():
-                return int(id_item.text())
+            session_id = self._model.session_id(selected_rows[0].row())
+            # Nur echte Sessions verarbeiten (keine Füllzeilen)
+            if session_id is not None:
+                return session_id
         return -1
 
+    def get_selected_session_ids(self) -> List[int]:
+        """Gibt die IDs aller ausgewählten Sessions zurück (Mehrfachauswahl)"""
+        session_ids = []
+        for index in self.selectionModel().selectedRows():
+            session_id = self._model.session_id(index.row())
+            # Nur echte Sessions verarbeiten (keine Füllzeilen)
+            if session_id is not None:
+                session_ids.append(session_id)
+        return session_ids
+
+    def _on_context_menu(self, pos):
+        """Zeigt das Kontextmenü für die ausgewählten Sessions"""
+        session_ids = self.get_selected_session_ids()
+        if not session_ids:
+            return
+
+        menu = QMenu(self)
+        menu.setStyleSheet("""
+            QMenu {
+                background-color: #001633;
+                color: #e0e0e0;
+                border: 1px solid #003355;
+            }
+            QMenu::item:selected {
+                background-color: #ffaa3a;
+                color: #000e22;
+            }
+        """)
+        count = len(session_ids)
+        transcribe_action = menu.addAction(self.tr("{0} Session(s) transkribieren").format(count))
+        export_action = menu.addAction(self.tr("{0} Session(s) exportieren").format(count))
+        menu.addSeparator()
+        delete_action = menu.addAction(self.tr("{0} Session(s) löschen").format(count))
+
+        action = menu.exec(self.viewport().mapToGlobal(pos))
+        if action == transcribe_action:
+            self.bulk_transcribe_requested.emit(session_ids)
+        elif action == export_action:
+            self.bulk_export_requested.emit(session_ids)
+        elif action == delete_action:
+            self.bulk_delete_requested.emit(session_ids)
+
     def clear_selection(self):
         """Löscht die aktuelle Selektion"""
         self.clearSelection()
 
-    def _format_file_size(self, size_bytes: int) -> str:
-        """Formatiert Dateigröße in menschenlesbarem Format"""
-        if size_bytes == 0:
-            return "-"
-
-        units = ['B', 'KB', 'MB', 'GB']
-        unit_index = 0
-        size = float(size_bytes)
-
-        while size >= 1024 and unit_index < len(units) - 1:
-            size /= 1024
-            unit_index += 1
-
-        if unit_index == 0:  # Bytes
-            return f"{int(size)} {units[unit_index]}"
-        else:
-            return f"{size:.1f} {units[unit_index]}"
-
-    def _create_status_widget(self, status: str = None, progress_text: str = None) -> QLabel:
-        """
-        Erstellt ein zentriertes Status-Widget mit Icon (und optionalem Progress-Text)
-
-        Args:
-            status: Status ("completed", "pending", "error", None)
-            progress_text: Optional: z.B. "3/8" für Chunk-Progress
-        """
-        if status == "completed":
-            icon = qta.icon('fa5s.check-circle', color='#4caf50')  # Green
-        elif status == "pending":
-            icon = qta.icon('fa5s.spinner', color='#ffc107')  # Yellow/Orange
-        elif status == "error":
-            icon = qta.icon('fa5s.times-circle', color='#f44336')  # Red
-        else:
-            icon = qta.icon('fa5s.circle', color='#9e9e9e')  # Gray
-
-        label = QLabel()
-
-        # Mit Progress-Text: Icon + Text
-        if progress_text:
-            label.setPixmap(icon.pixmap(QSize(16, 16)))  # Kleineres Icon für Platz
-            label.setText(f"  {progress_text}")  # 2 Spaces vor Text
-            label.setStyleSheet("background-color: transparent; color: #e0e0e0; font-size: 12px;")
-        else:
-            # Ohne Progress: Nur Icon (wie bisher)
-            label.setPixmap(icon.pixmap(QSize(20, 20)))
-            label.setStyleSheet("background-color: transparent;")
-
-        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        return label
+    def prewarm_icons(self):
+        """Rendert alle Status-Icons im Voraus (nach dem Start, ohne die Event-Loop zu blockieren)"""
+        specs = [(name, color, STATUS_ICON_SIZE) for name, color in STATUS_ICONS.values()]
+        specs.append((*DEFAULT_STATUS_ICON, STATUS_ICON_SIZE))
+        specs.append((*STATUS_ICONS["running"], PROGRESS_ICON_SIZE))
+        specs.append((*BLINK_ICON, STATUS_ICON_SIZE))
+        IconCache.instance().prewarm(specs)
 
     def update_transcription_status(self, session_id: int, status: str, blink: bool = False):
         """
@@ -261,21 +422,14 @@ class SessionTableWidget(TranslatableWidget, QTableWidget):
 
         Args:
             session_id: Die ID der Session
-            status: Status ("completed", "pending", "error", None)
+            status: Status ("completed", "queued", "running", "error", None)
             blink: Ob der Status blinken soll (z.B. bei Fertigstellung)
         """
-        # Finde die Zeile mit der Session-ID
-        for row in range(self.rowCount()):
-            id_item = self.item(row, 0)
-            if id_item and id_item.text().strip() and int(id_item.text()) == session_id:
-                # Erstelle neues Status-Widget
-                status_widget = self._create_status_widget(status)
-                self.setCellWidget(row, 5, status_widget)
-
-                # Blink-Effekt bei Fertigstellung
-                if blink and status == "completed":
-                    self._blink_status(row, 5)
-                break
+        self._model.set_status(session_id, status)
+
+        # Blink-Effekt bei Fertigstellung
+        if blink and status == "completed" and self._model.row_of(session_id) is not None:
+            self._blink_status(session_id)
 
     def update_transcription_progress(self, session_id: int, current_chunk: int, total_chunks: int):
         """
@@ -286,44 +440,25 @@ class SessionTableWidget(TranslatableWidget, QTableWidget):
             current_chunk: Aktueller Chunk (1-basiert)
             total_chunks: Gesamtanzahl Chunks
         """
-        for row in range(self.rowCount()):
-            id_item = self.item(row, 0)
-            if id_item and id_item.text().strip() and int(id_item.text()) == session_id:
-                # Widget mit Progress-Text erstellen: "3/8"
-                progress_text = f"{current_chunk}/{total_chunks}"
-                status_widget = self._create_status_widget("pending", progress_text)
-                self.setCellWidget(row, 5, status_widget)
-                break
-
-    def _blink_status(self, row: int, col: int, blinks: int = 3):
-        """Lässt eine Zelle blinken"""
-        widget = self.cellWidget(row, col)
-        if not widget or not isinstance(widget, QLabel):
-            return
-
-        # Original-Pixmap merken
-        original_pixmap = widget.pixmap()
-        # Helles Blink-Icon erstellen
-        blink_icon = qta.icon('fa5s.check-circle', color='#ffffff')
-        blink_pixmap = blink_icon.pixmap(QSize(20, 20))
+        # Progress-Text: "3/8"
+        self._model.set_progress(session_id, f"{current_chunk}/{total_chunks}")
 
+    def _blink_status(self, session_id: int, blinks: int = 3):
+        """Lässt das Status-Icon einer Session blinken (auch über ein Neuladen hinweg)"""
         blink_count = [0]  # Mutable counter für nested function
 
         def toggle_icon():
             if blink_count[0] < blinks * 2:
-                if blink_count[0] % 2 == 0:
-                    # Weißes Icon anzeigen
-                    widget.setPixmap(blink_pixmap)
-                else:
-                    # Original-Icon anzeigen
-                    widget.setPixmap(original_pixmap)
+                # Gerade Schritte: helles Icon, ungerade: Original-Icon
+                self._model.set_blinking(session_id, blink_count[0] % 2 == 0)
                 blink_count[0] += 1
             else:
                 # Am Ende sicherstellen, dass das Original-Icon angezeigt wird
-                widget.setPixmap(original_pixmap)
+                self._model.set_blinking(session_id, False)
                 timer.stop()
+                timer.deleteLater()
 
-        timer = QTimer()
+        timer = QTimer(self)
         timer.timeout.connect(toggle_icon)
         timer.start(300)  # 300ms interval
 
@@ -368,7 +503,7 @@ class SessionTableWidget(TranslatableWidget, QTableWidget):
                 self.tr("ID"), self.tr("Titel"), self.tr("Aufnahmedatum"), self.tr("Dauer (s)"),
                 self.tr("Dateigröße"), self.tr("Transkription"), self.tr("Notizen")
             ]
-        self.setHorizontalHeaderLabels(labels)
+        self._model.set_headers(labels)
 
     def changeEvent(self, event):
         """Behandelt Änderungs-Events (z.B. Sprachwechsel)"""